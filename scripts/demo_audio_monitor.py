@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Audio Monitor Demo
+
+Feeds one second of a noisy 1 kHz tone through AudioMonitor in 20 ms
+frames and prints the resulting statistics.
+
+Usage: python scripts/demo_audio_monitor.py
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from audio_monitor import AudioMonitor
+
+
+def main() -> None:
+    # Demo audio monitor
+    logging.basicConfig(level=logging.INFO)
+    
+    monitor = AudioMonitor(sample_rate=16000)
+    monitor.set_codec_info("mSBC", 16000)
+    
+    # Generate test audio
+    duration = 1.0
+    sample_rate = 16000
+    t = np.linspace(0, duration, int(sample_rate * duration))
+    
+    # Test signal with noise
+    signal_audio = 0.5 * np.sin(2 * np.pi * 1000 * t)
+    noise = 0.05 * np.random.randn(len(t))
+    test_audio = signal_audio + noise
+    
+    # Process in frames
+    frame_size = 320  # 20ms
+    for i in range(0, len(test_audio) - frame_size, frame_size):
+        frame = test_audio[i:i+frame_size]
+        frame_bytes = (frame * 32768).astype(np.int16).tobytes()
+        
+        monitor.record_capture_timestamp()
+        monitor.analyze_frame(frame_bytes, has_voice=True)
+        monitor.log_metrics(interval_frames=25)
+    
+    print("\nFinal Statistics:")
+    stats = monitor.get_statistics()
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    
+    acceptable, reason = monitor.is_quality_acceptable()
+    print(f"\nQuality: {'✓ Acceptable' if acceptable else '✗ Poor'} - {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Audio Kernels Module for RPi Hands-Free Headset
+
+This module provides small numeric kernels for the real-time audio path.
+When Numba is installed the kernels are JIT-compiled to native code
+that runs without the GIL, so the preprocessing worker doesn't stall the
+audio thread; otherwise equivalent NumPy implementations are used.
+"""
+
+import logging
+import time
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.warning("numba not available, using NumPy audio kernels")
+
+# int16 -> [-1, 1) scale factor; multiply by this rather than dividing
+# by 32768 (exact, since it is a power of two)
+INV_32768 = np.float32(1.0 / 32768.0)
+
+
+def soft_clip(x, gain):
+    """
+    Apply a gain followed by the AGC soft clipper, tanh(2 * x) / 2.
+    
+    tanh is replaced by its Pade approximant t(27 + t^2) / (27 + 9t^2),
+    which is monotonic up to |t| = 3 where it reaches exactly 1, so the
+    input is clamped there (max deviation from tanh is about 0.02).
+    
+    Args:
+        x: Float audio frame
+        gain: Linear gain applied before clipping
+        
+    Returns:
+        New array with the clipped signal, bounded to +/-0.5
+    """
+    t = x * (2.0 * gain)
+    np.clip(t, -3.0, 3.0, out=t)
+    t2 = t * t
+    t *= 27.0 + t2
+    t2 *= 9.0
+    t2 += 27.0
+    t /= t2
+    t *= 0.5
+    return t
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def sos_filter(x, sos, zi):
+        """
+        Filter a frame in place through a cascade of second-order sections.
+        
+        Args:
+            x: float32 frame, overwritten with the filtered output
+            sos: Sections in scipy's layout, rows of (b0, b1, b2, 1, a1, a2)
+            zi: Per-section filter state (n_sections x 2, sosfilt layout),
+                updated in place
+        """
+        for s in range(sos.shape[0]):
+            b0 = sos[s, 0]
+            b1 = sos[s, 1]
+            b2 = sos[s, 2]
+            a1 = sos[s, 4]
+            a2 = sos[s, 5]
+            z0 = zi[s, 0]
+            z1 = zi[s, 1]
+            for i in range(x.shape[0]):
+                xi = x[i]
+                yi = b0 * xi + z0
+                z0 = b1 * xi - a1 * yi + z1
+                z1 = b2 * xi - a2 * yi
+                x[i] = yi
+            zi[s, 0] = z0
+            zi[s, 1] = z1
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def frame_stats(x):
+        """
+        Energy, peak and clipped-sample count of a 16-bit PCM frame in one pass.
+        
+        Args:
+            x: int16 sample array
+            
+        Returns:
+            Tuple of (sum of squares, peak magnitude, samples at full scale)
+        """
+        acc = 0
+        peak = 0
+        clipped = 0
+        for i in range(x.shape[0]):
+            v = np.int64(x[i])
+            acc += v * v
+            a = abs(v)
+            if a > peak:
+                peak = a
+            if a >= 32767:
+                clipped += 1
+        return acc, peak, clipped
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def nlms_filter(mic, ref, w, mu, eps, out):
+        """
+        Run an NLMS echo canceller over a whole frame.
+        
+        Args:
+            mic: Microphone frame (desired signal)
+            ref: Speaker reference, preceded by len(w) - 1 samples of
+                history (len(mic) + len(w) - 1 samples, oldest first)
+            w: Filter weights, updated in place
+            mu: Step size
+            eps: Regularization added to the reference power
+            out: Output array for the error signal (len(mic) samples)
+        """
+        taps = w.shape[0]
+        for i in range(mic.shape[0]):
+            # Tap k is ref[i + taps - 1 - k], i.e. newest sample first
+            newest = i + taps - 1
+            y = 0.0
+            norm = eps
+            for k in range(taps):
+                xk = ref[newest - k]
+                y += w[k] * xk
+                norm += xk * xk
+            err = mic[i] - y
+            g = mu * err / norm
+            for k in range(taps):
+                w[k] += g * ref[newest - k]
+            out[i] = err
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def soft_clip_to_i16(x, gain, out):
+        """
+        Apply gain, the AGC soft clipper and int16 conversion in one pass.
+        
+        Args:
+            x: Float audio frame
+            gain: Linear gain applied before clipping
+            out: int16 output array (len(x) samples)
+        """
+        g = 2.0 * gain
+        for i in range(x.shape[0]):
+            t = x[i] * g
+            if t > 3.0:
+                t = 3.0
+            elif t < -3.0:
+                t = -3.0
+            t2 = t * t
+            # Bounded to +/-0.5 full scale, so no int16 clipping is needed
+            out[i] = round(16384.0 * t * (27.0 + t2) / (27.0 + 9.0 * t2))
+else:
+    # Only the NumPy fallbacks need scipy; importing scipy.signal is
+    # expensive, so modules that only use the kernels (e.g. the monitor)
+    # don't pay for it when numba is available
+    from scipy import signal
+    
+    def sos_filter(x, sos, zi):
+        """
+        Filter a frame in place through a cascade of second-order sections.
+        
+        Args:
+            x: float32 frame, overwritten with the filtered output
+            sos: Sections in scipy's layout, rows of (b0, b1, b2, 1, a1, a2)
+            zi: Per-section filter state (n_sections x 2, sosfilt layout),
+                updated in place
+        """
+        y, zi[:] = signal.sosfilt(sos, x, zi=zi)
+        x[:] = y
+    
+    def frame_stats(x):
+        """
+        Energy, peak and clipped-sample count of a 16-bit PCM frame.
+        
+        Args:
+            x: int16 sample array
+            
+        Returns:
+            Tuple of (sum of squares, peak magnitude, samples at full scale)
+        """
+        if x.size == 0:
+            return 0, 0, 0
+        mag = np.abs(x.astype(np.int32))
+        return (int(np.einsum('i,i->', x, x, dtype=np.int64)), int(mag.max()),
+                int(np.count_nonzero(mag >= 32767)))
+    
+    def nlms_filter(mic, ref, w, mu, eps, out):
+        """
+        Run an NLMS echo canceller over a whole frame.
+        
+        Args:
+            mic: Microphone frame (desired signal)
+            ref: Speaker reference, preceded by len(w) - 1 samples of
+                history (len(mic) + len(w) - 1 samples, oldest first)
+            w: Filter weights, updated in place
+            mu: Step size
+            eps: Regularization added to the reference power
+            out: Output array for the error signal (len(mic) samples)
+        """
+        taps = w.shape[0]
+        
+        # Against the weights in reverse order, each tap vector is a plain
+        # forward slice of ref (w_rev is a view, so updates land in w)
+        w_rev = w[::-1]
+        tmp = np.empty(taps)
+        
+        # Reference power over the window, kept as a running sum
+        norm = float(np.dot(ref[:taps], ref[:taps]))
+        for i in range(mic.shape[0]):
+            if i:
+                oldest = float(ref[i - 1])
+                newest = float(ref[i + taps - 1])
+                norm += newest * newest - oldest * oldest
+            x = ref[i:i + taps]
+            err = mic[i] - np.dot(w_rev, x)
+            np.multiply(x, mu * err / (max(norm, 0.0) + eps), out=tmp)
+            w_rev += tmp
+            out[i] = err
+    
+    def soft_clip_to_i16(x, gain, out):
+        """
+        Apply gain, the AGC soft clipper and int16 conversion.
+        
+        Args:
+            x: Float audio frame
+            gain: Linear gain applied before clipping
+            out: int16 output array (len(x) samples)
+        """
+        clipped = soft_clip(x, gain)
+        clipped *= 32768.0
+        np.rint(clipped, out=clipped)
+        np.copyto(out, clipped, casting='unsafe')
+
+
+def warmup() -> None:
+    """
+    Compile the kernels for the argument types used on the audio path.
+    
+    Numba compiles lazily on the first call with a given type signature,
+    which can take seconds on a Pi. Call this from setup code so that
+    cost (or, with cache=True, the cheaper cache load) is not paid by the
+    real-time audio thread on its first frame. No-op without numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    
+    start = time.monotonic()
+    
+    # Captured frames arrive as read-only int16 views over ALSA bytes
+    pcm = np.frombuffer(bytes(4), dtype=np.int16)
+    frame = np.zeros(2, dtype=np.float32)
+    
+    frame_stats(pcm)
+    sos_filter(frame, np.array([[1.0, 0.0, 0.0, 1.0, 0.0, 0.0]]), np.zeros((1, 2)))
+    nlms_filter(frame[:1], frame, np.zeros(2), 0.3, 1e-6, np.zeros(1, dtype=np.float32))
+    soft_clip_to_i16(frame, 1.0, np.zeros(2, dtype=np.int16))
+    
+    logging.info(f"Audio kernels ready in {time.monotonic() - start:.2f}s")
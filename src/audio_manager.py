@@ -21,6 +21,21 @@ import time
 import numpy as np
 import os
 import socket
+import selectors
+import queue
+import re
+import select
+from collections import Counter
+from functools import lru_cache
+
+from audio_kernels import frame_stats, warmup as warmup_kernels
+
+try:
+    import pulsectl
+    PULSECTL_AVAILABLE = True
+except ImportError:
+    PULSECTL_AVAILABLE = False
+    logging.warning("pulsectl not available, using pactl for PulseAudio control")
 
 # Import audio enhancement modules
 try:
@@ -31,6 +46,45 @@ except ImportError:
     AUDIO_ENHANCEMENT_AVAILABLE = False
     logging.warning("Audio enhancement modules not available")
 
+# Fixed argv prefixes for the ALSA/PulseAudio command-line fallbacks.
+# These run with close_fds=False: the audio process holds many
+# descriptors (PCMs, sockets, pipes) and none of them matter to the
+# short-lived helper, so there is no point closing each one after fork.
+_AMIXER_SSET = ('amixer', 'sset')
+_PACTL_LIST_SINKS = ('pactl', 'list', 'short', 'sinks')
+_PACTL_SET_DEFAULT_SINK = ('pactl', 'set-default-sink')
+_PACTL_SET_CARD_PROFILE = ('pactl', 'set-card-profile')
+
+# Selector key tags for the audio loop's event sources
+_SRC_CAPTURE = 'capture'
+_SRC_SCO = 'sco'
+_SRC_WAKE = 'wake'
+
+# A Bluetooth sink name for the given (normalized) device address: it
+# mentions bluez or bluetooth and contains the address. Used on sink
+# names from pulsectl and, with _PACTL_SINK_LINE in front, to pick the
+# name column out of `pactl list short sinks`.
+_BT_SINK_NAME = r'(?=\S*(?:bluez|bluetooth))(?=\S*{addr})(\S+)'
+_PACTL_SINK_LINE = r'^\S+\s+'
+
+
+@lru_cache(maxsize=8)
+def _bt_sink_regex(address_normalized: str, listing: bool = False) -> re.Pattern:
+    """
+    Compiled Bluetooth sink regex for one device address.
+    
+    Args:
+        address_normalized: Device address with '_' separators
+        listing: Match sink lines of a pactl listing instead of bare names
+        
+    Returns:
+        Compiled pattern; group 1 is the sink name
+    """
+    pattern = _BT_SINK_NAME.format(addr=re.escape(address_normalized))
+    if listing:
+        return re.compile(_PACTL_SINK_LINE + pattern, re.MULTILINE | re.IGNORECASE)
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class AudioState(Enum):
     """Audio system states."""
@@ -48,6 +102,11 @@ class AudioManager:
     SOL_SCO = 17
     SCO_OPTIONS = 1
     
+    # Energy VAD threshold for frames that bypass the preprocessor: the
+    # preprocessor's RMS > 0.01 rule expressed as squared int16 units per
+    # sample, so it can be compared against the raw frame energy
+    VAD_ENERGY_PER_SAMPLE = (0.01 * 32768) ** 2
+    
     def __init__(self, sample_rate: int = 16000, channels: int = 1, 
                  buffer_size: int = 1024,
                  capture_device: str = 'default',
@@ -60,7 +119,9 @@ class AudioManager:
                  enable_highpass: bool = True,
                  highpass_cutoff: float = 80.0,
                  enable_monitoring: bool = True,
-                 aec_tail_ms: int = 200):
+                 aec_tail_ms: int = 200,
+                 periods: int = 3,
+                 latency_ms: int = 0):
         """
         Initialize Audio Manager.
         
@@ -79,10 +140,16 @@ class AudioManager:
             highpass_cutoff: High-pass filter cutoff in Hz
             enable_monitoring: Enable quality monitoring
             aec_tail_ms: Echo cancellation tail length in ms
+            periods: Number of periods in the ALSA ring buffer
+                (buffer = periods * buffer_size frames)
+            latency_ms: Target PulseAudio stream latency when the ALSA
+                devices are routed through PulseAudio (0 = server default)
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.buffer_size = buffer_size
+        self.periods = periods
+        self.latency_ms = latency_ms
         self.capture_device_name = capture_device
         self.playback_device_name = playback_device
         self.state = AudioState.IDLE
@@ -100,13 +167,63 @@ class AudioManager:
         self.speaker_volume = 75
         self.microphone_volume = 75
         
+        # Persistent ALSA mixer handles (None = fall back to amixer)
+        self._master_mixer: Optional[alsaaudio.Mixer] = None
+        self._capture_mixer: Optional[alsaaudio.Mixer] = None
+        
+        # In-process PulseAudio client, connected on first use (see pulse)
+        self._pulse = None
+        self._pulse_unavailable = not PULSECTL_AVAILABLE
+        
+        # Bluetooth sink name per normalized device address
+        self._bt_sinks: dict = {}
+        
+        # PulseAudio card index per card name
+        self._pulse_cards: dict = {}
+        
+        # While the event listener runs, sink names per index and the card
+        # map above are kept current from server events, so lookups need no
+        # round trip. _pulse_sinks is None when not listening.
+        self._pulse_sinks: Optional[dict] = None
+        self._pulse_lock = threading.Lock()
+        self._pulse_events = None
+        self._pulse_events_thread: Optional[threading.Thread] = None
+        self._pulse_events_stop = threading.Event()
+        
         # Callbacks
         self.on_audio_data: Optional[Callable] = None
         
-        # Threading with Event for thread-safe stop signal
+        # Threading with Event for thread-safe stop signal. Devices are only
+        # closed after the audio thread has been joined, so the loop itself
+        # needs no lock around read()/write().
         self.audio_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._audio_lock = threading.Lock()
+        
+        # Readiness selector for the SCO socket, plus a pipe that
+        # stop_audio_loop() writes to so a waiting select() returns at once
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        
+        # Errors raised inside the audio loop are counted there and logged
+        # periodically from a reporter thread, keeping logging (and the
+        # logging module lock) off the real-time path. Keys are fixed up
+        # front so the reporter can snapshot the counter safely, and each
+        # key is incremented from one thread only ('preproc' and
+        # 'preproc_overrun' by the preprocessing worker, the rest by the
+        # audio thread) since += on a Counter is not atomic.
+        self._err_counters: Counter = Counter(preproc=0, monitor=0, alsa=0, loop=0,
+                                              overrun=0, xrun=0, preproc_overrun=0)
+        self._err_last: dict = {}
+        self._error_report_interval = 5.0
+        self._reporter_thread: Optional[threading.Thread] = None
+        
+        # Preprocessing runs on its own worker so heavy frames (AEC, noise
+        # reduction) can't hold up ALSA reads and writes. Both queues are
+        # bounded and drop their oldest frame instead of blocking.
+        self._preproc_q_in: Optional[queue.Queue] = None
+        self._preproc_q_out: Optional[queue.Queue] = None
+        self._preproc_thread: Optional[threading.Thread] = None
         
         # Playback buffer for AEC reference
         self._playback_buffer: bytes = b''
@@ -142,6 +259,26 @@ class AudioManager:
         
         logging.info(f"AudioManager initialized: {sample_rate}Hz, {channels}ch")
     
+    @property
+    def pulse(self):
+        """
+        PulseAudio client, connected lazily on first use.
+        
+        The sink and card event listener starts along with the client.
+        
+        Returns:
+            pulsectl.Pulse instance, or None to fall back to pactl
+        """
+        if self._pulse is None and not self._pulse_unavailable:
+            try:
+                self._pulse = pulsectl.Pulse('AudioManager')
+            except Exception as e:
+                logging.warning(f"Failed to connect to PulseAudio, using pactl: {e}")
+                self._pulse_unavailable = True
+            else:
+                self._start_pulse_events()
+        return self._pulse
+    
     @staticmethod
     def list_audio_devices() -> dict:
         """
@@ -169,35 +306,53 @@ class AudioManager:
             True if successful
         """
         try:
-            # Try to open capture device
+            # When 'default' is the PulseAudio ALSA plugin, its streams are
+            # libpulse clients. PULSE_LATENCY_MSEC makes libpulse request
+            # ADJUST_LATENCY with matching tlength/fragsize instead of the
+            # server's large default buffers. An explicit setting in the
+            # environment wins.
+            if self.latency_ms > 0:
+                os.environ.setdefault('PULSE_LATENCY_MSEC', str(self.latency_ms))
+            
+            # Period size is set first and the ring buffer is sized as a
+            # whole number of periods, so the thread wakes once per period
+            # and ALSA keeps (periods - 1) periods of headroom against xruns.
+            # Everything is passed to the constructor so hw_params are
+            # committed once instead of being renegotiated per setter.
+            # Capture is non-blocking: the audio loop waits on its poll
+            # descriptors together with the SCO socket instead of in read()
             self.capture_device = alsaaudio.PCM(
                 alsaaudio.PCM_CAPTURE,
-                alsaaudio.PCM_NORMAL,
+                alsaaudio.PCM_NONBLOCK,
+                rate=self.sample_rate,
+                channels=self.channels,
+                format=alsaaudio.PCM_FORMAT_S16_LE,
+                periodsize=self.buffer_size,
+                periods=self.periods,
                 device=self.capture_device_name
             )
             
-            # Configure capture device
-            self.capture_device.setchannels(self.channels)
-            self.capture_device.setrate(self.sample_rate)
-            self.capture_device.setformat(alsaaudio.PCM_FORMAT_S16_LE)
-            self.capture_device.setperiodsize(self.buffer_size)
-            
             logging.info(f"Audio capture device initialized: {self.capture_device_name}")
             
-            # Try to open playback device
             self.playback_device = alsaaudio.PCM(
                 alsaaudio.PCM_PLAYBACK,
                 alsaaudio.PCM_NORMAL,
+                rate=self.sample_rate,
+                channels=self.channels,
+                format=alsaaudio.PCM_FORMAT_S16_LE,
+                periodsize=self.buffer_size,
+                periods=self.periods,
                 device=self.playback_device_name
             )
             
-            # Configure playback device
-            self.playback_device.setchannels(self.channels)
-            self.playback_device.setrate(self.sample_rate)
-            self.playback_device.setformat(alsaaudio.PCM_FORMAT_S16_LE)
-            self.playback_device.setperiodsize(self.buffer_size)
-            
             logging.info(f"Audio playback device initialized: {self.playback_device_name}")
+            logging.debug(f"ALSA buffer: {self.periods} x {self.buffer_size} frames")
+            
+            self._open_mixers()
+            
+            # Compile the DSP kernels here rather than on the audio
+            # thread's first frame
+            warmup_kernels()
             
             return True
             
@@ -205,6 +360,20 @@ class AudioManager:
             logging.error(f"Failed to initialize audio devices: {e}")
             return False
     
+    def _open_mixers(self) -> None:
+        """Open persistent mixer handles so volume changes don't fork amixer."""
+        try:
+            self._master_mixer = alsaaudio.Mixer('Master')
+        except alsaaudio.ALSAAudioError as e:
+            logging.warning(f"Master mixer not available, using amixer: {e}")
+            self._master_mixer = None
+        
+        try:
+            self._capture_mixer = alsaaudio.Mixer('Capture')
+        except alsaaudio.ALSAAudioError as e:
+            logging.warning(f"Capture mixer not available, using amixer: {e}")
+            self._capture_mixer = None
+    
     def set_speaker_volume(self, volume: int) -> bool:
         """
         Set speaker volume.
@@ -218,18 +387,22 @@ class AudioManager:
         try:
             volume = max(0, min(100, volume))  # Clamp to 0-100
             
-            # Use amixer to set volume
-            subprocess.run(
-                ['amixer', 'sset', 'Master', f'{volume}%'],
-                check=True,
-                capture_output=True
-            )
+            if self._master_mixer:
+                self._master_mixer.setvolume(volume)
+            else:
+                # Use amixer to set volume
+                subprocess.run(
+                    (*_AMIXER_SSET, 'Master', f'{volume}%'),
+                    check=True,
+                    capture_output=True,
+                    close_fds=False
+                )
             
             self.speaker_volume = volume
             logging.info(f"Speaker volume set to {volume}%")
             return True
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, alsaaudio.ALSAAudioError) as e:
             logging.error(f"Failed to set speaker volume: {e}")
             return False
         except FileNotFoundError:
@@ -249,18 +422,22 @@ class AudioManager:
         try:
             volume = max(0, min(100, volume))  # Clamp to 0-100
             
-            # Use amixer to set capture volume
-            subprocess.run(
-                ['amixer', 'sset', 'Capture', f'{volume}%'],
-                check=True,
-                capture_output=True
-            )
+            if self._capture_mixer:
+                self._capture_mixer.setvolume(volume, pcmtype=alsaaudio.PCM_CAPTURE)
+            else:
+                # Use amixer to set capture volume
+                subprocess.run(
+                    (*_AMIXER_SSET, 'Capture', f'{volume}%'),
+                    check=True,
+                    capture_output=True,
+                    close_fds=False
+                )
             
             self.microphone_volume = volume
             logging.info(f"Microphone volume set to {volume}%")
             return True
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, alsaaudio.ALSAAudioError) as e:
             logging.error(f"Failed to set microphone volume: {e}")
             return False
         except FileNotFoundError:
@@ -310,36 +487,18 @@ class AudioManager:
         
         for attempt in range(max_retries):
             try:
-                # Find Bluetooth sink
-                result = subprocess.run(
-                    ['pactl', 'list', 'short', 'sinks'],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
-                bt_sink = None
-                for line in result.stdout.split('\n'):
-                    line_lower = line.lower()
-                    # Check for bluez sink with matching address
-                    if 'bluez' in line_lower and address_normalized in line_lower:
-                        bt_sink = line.split()[1]
-                        break
-                    # Also check for bluetooth sink without bluez prefix
-                    if 'bluetooth' in line_lower and address_normalized in line_lower:
-                        bt_sink = line.split()[1]
-                        break
+                bt_sink = self._bt_sinks.get(address_normalized)
+                if bt_sink is None:
+                    bt_sink = self._find_bt_sink(address_normalized)
                 
                 if bt_sink:
                     # Set as default sink
-                    subprocess.run(
-                        ['pactl', 'set-default-sink', bt_sink],
-                        check=True,
-                        capture_output=True
-                    )
-                    
-                    logging.info(f"Audio routed to Bluetooth device: {device_address} (sink: {bt_sink})")
-                    return True
+                    if self._set_default_sink(bt_sink):
+                        self._bt_sinks[address_normalized] = bt_sink
+                        logging.info(f"Audio routed to Bluetooth device: {device_address} (sink: {bt_sink})")
+                        return True
+                    # Cached sink may be stale (e.g. after a profile switch)
+                    self._bt_sinks.pop(address_normalized, None)
                 
                 if attempt < max_retries - 1:
                     logging.debug(f"Bluetooth sink not found, retrying ({attempt + 1}/{max_retries})...")
@@ -347,6 +506,7 @@ class AudioManager:
                     
             except subprocess.CalledProcessError as e:
                 logging.error(f"Failed to route audio to Bluetooth: {e}")
+                self._bt_sinks.pop(address_normalized, None)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
             except FileNotFoundError:
@@ -357,6 +517,72 @@ class AudioManager:
         logging.info("Tip: Ensure pulseaudio-module-bluetooth is installed and PulseAudio is running")
         return False
     
+    def _find_bt_sink(self, address_normalized: str) -> Optional[str]:
+        """
+        Find the PulseAudio sink for a Bluetooth device.
+        
+        Args:
+            address_normalized: Device address with '_' separators, lowercase
+            
+        Returns:
+            Sink name, or None if not present
+        """
+        if not self.pulse:
+            result = subprocess.run(
+                _PACTL_LIST_SINKS,
+                capture_output=True,
+                text=True,
+                check=True,
+                close_fds=False
+            )
+            # Single scan over the whole listing
+            match = _bt_sink_regex(address_normalized, listing=True).search(result.stdout)
+            return match.group(1) if match else None
+        
+        with self._pulse_lock:
+            names = list(self._pulse_sinks.values()) if self._pulse_sinks is not None else None
+        
+        if names is None:
+            try:
+                names = [sink.name for sink in self.pulse.sink_list()]
+            except pulsectl.PulseError as e:
+                logging.error(f"Failed to list PulseAudio sinks: {e}")
+                return None
+        
+        # Same predicate as the pactl path: a bluez sink with matching
+        # address, or a bluetooth sink without the bluez prefix
+        sink_re = _bt_sink_regex(address_normalized)
+        for name in names:
+            if sink_re.match(name):
+                return name
+        return None
+    
+    def _set_default_sink(self, sink_name: str) -> bool:
+        """
+        Set the PulseAudio default sink.
+        
+        Args:
+            sink_name: Sink name
+            
+        Returns:
+            True if successful
+        """
+        if self.pulse:
+            try:
+                self.pulse.sink_default_set(sink_name)
+                return True
+            except pulsectl.PulseError as e:
+                logging.error(f"Failed to set default sink {sink_name}: {e}")
+                return False
+        
+        subprocess.run(
+            (*_PACTL_SET_DEFAULT_SINK, sink_name),
+            check=True,
+            capture_output=True,
+            close_fds=False
+        )
+        return True
+    
     def set_profile_hfp(self, card_name: str) -> bool:
         """
         Set Bluetooth card to HFP/HSP profile.
@@ -369,11 +595,23 @@ class AudioManager:
         """
         try:
             # Set card profile to headset_head_unit (HFP/HSP)
-            subprocess.run(
-                ['pactl', 'set-card-profile', card_name, 'headset_head_unit'],
-                check=True,
-                capture_output=True
-            )
+            if self.pulse:
+                try:
+                    card = self._find_pulse_card(card_name)
+                    if card is None:
+                        logging.error(f"Failed to set HFP profile: card {card_name} not found")
+                        return False
+                    self.pulse.card_profile_set(card, 'headset_head_unit')
+                except pulsectl.PulseError as e:
+                    logging.error(f"Failed to set HFP profile: {e}")
+                    return False
+            else:
+                subprocess.run(
+                    (*_PACTL_SET_CARD_PROFILE, card_name, 'headset_head_unit'),
+                    check=True,
+                    capture_output=True,
+                    close_fds=False
+                )
             
             logging.info(f"Set profile to headset_head_unit for {card_name}")
             return True
@@ -382,6 +620,151 @@ class AudioManager:
             logging.error(f"Failed to set HFP profile: {e}")
             return False
     
+    def _find_pulse_card(self, card_name: str):
+        """
+        Look up a PulseAudio card, trying the cached index first.
+        
+        Args:
+            card_name: PulseAudio card name
+            
+        Returns:
+            pulsectl card info, or None if no such card
+        """
+        with self._pulse_lock:
+            index = self._pulse_cards.get(card_name)
+            tracked = self._pulse_sinks is not None
+        
+        if index is not None:
+            try:
+                card = self.pulse.card_info(index)
+                if card.name == card_name:
+                    return card
+            except pulsectl.PulseError:
+                pass
+            # Card went away or its index was reused
+            with self._pulse_lock:
+                self._pulse_cards.pop(card_name, None)
+        elif tracked:
+            # The event listener keeps the card map complete
+            return None
+        
+        card = next((c for c in self.pulse.card_list() if c.name == card_name), None)
+        if card is not None:
+            with self._pulse_lock:
+                self._pulse_cards[card_name] = card.index
+        return card
+    
+    def _start_pulse_events(self) -> None:
+        """
+        Start tracking PulseAudio sinks and cards from server events.
+        
+        A second client is used because a pulsectl client blocked in
+        event_listen() can't serve requests from other threads.
+        """
+        if not self._pulse or self._pulse_events_thread:
+            return
+        
+        events = None
+        try:
+            events = pulsectl.Pulse('AudioManager-events')
+            events.event_mask_set('sink', 'card')
+            sinks = {sink.index: sink.name for sink in events.sink_list()}
+            cards = {card.name: card.index for card in events.card_list()}
+        except pulsectl.PulseError as e:
+            logging.warning(f"PulseAudio event subscription failed, looking up devices on demand: {e}")
+            if events:
+                events.close()
+            return
+        
+        with self._pulse_lock:
+            self._pulse_sinks = sinks
+            self._pulse_cards = cards
+        
+        self._pulse_events = events
+        self._pulse_events_stop.clear()
+        self._pulse_events_thread = threading.Thread(target=self._pulse_event_loop, daemon=True)
+        self._pulse_events_thread.start()
+        logging.debug(f"Tracking {len(sinks)} PulseAudio sinks and {len(cards)} cards")
+    
+    def _stop_pulse_events(self) -> None:
+        """Stop the PulseAudio event listener and close its client."""
+        if not self._pulse_events_thread:
+            return
+        
+        self._pulse_events_stop.set()
+        self._pulse_events.event_listen_stop()
+        self._pulse_events_thread.join(timeout=2.0)
+        self._pulse_events_thread = None
+        self._pulse_events.close()
+        self._pulse_events = None
+        
+        with self._pulse_lock:
+            self._pulse_sinks = None
+    
+    def _pulse_event_loop(self) -> None:
+        """Apply PulseAudio sink and card events to the local maps."""
+        events = self._pulse_events
+        pending = []
+        
+        def on_event(ev):
+            # No requests are allowed from inside the callback, so queue
+            # the event and leave event_listen() to handle it
+            pending.append((ev.facility, ev.t, ev.index))
+            raise pulsectl.PulseLoopStop
+        
+        events.event_callback_set(on_event)
+        
+        try:
+            # The timeout bounds how long a stop request that races with
+            # event_listen_stop() can go unnoticed
+            while not self._pulse_events_stop.is_set():
+                events.event_listen(timeout=1.0)
+                while pending:
+                    self._apply_pulse_event(events, *pending.pop(0))
+        except pulsectl.PulseError as e:
+            # Without events the maps can't be trusted; go back to
+            # querying the server on each lookup
+            logging.warning(f"PulseAudio event listener stopped: {e}")
+            with self._pulse_lock:
+                self._pulse_sinks = None
+    
+    def _apply_pulse_event(self, events, facility, event_type, index: int) -> None:
+        """
+        Update the sink and card maps for one PulseAudio event.
+        
+        Args:
+            events: pulsectl client of the event listener
+            facility: Event facility ('sink' or 'card')
+            event_type: Event type ('new', 'change' or 'remove')
+            index: Server index of the sink or card
+        """
+        # Names never change, so 'change' events need no update
+        if event_type == 'new':
+            try:
+                info = events.sink_info(index) if facility == 'sink' else events.card_info(index)
+            except pulsectl.PulseIndexError:
+                # Already removed again; its 'remove' event follows
+                return
+            with self._pulse_lock:
+                if self._pulse_sinks is None:
+                    return
+                if facility == 'sink':
+                    self._pulse_sinks[index] = info.name
+                else:
+                    self._pulse_cards[info.name] = index
+        
+        elif event_type == 'remove':
+            with self._pulse_lock:
+                if self._pulse_sinks is None:
+                    return
+                if facility == 'sink':
+                    name = self._pulse_sinks.pop(index, None)
+                    for address in [a for a, sink in list(self._bt_sinks.items()) if sink == name]:
+                        self._bt_sinks.pop(address, None)
+                else:
+                    for card_name in [n for n, i in self._pulse_cards.items() if i == index]:
+                        del self._pulse_cards[card_name]
+    
     def connect_sco(self, device_address: str) -> bool:
         """
         Connect SCO socket for Bluetooth voice audio.
@@ -407,6 +790,9 @@ class AudioManager:
             # Connect to device
             self.sco_socket.connect((device_address,))
             
+            if self._selector:
+                self._selector.register(self.sco_socket, selectors.EVENT_READ, _SRC_SCO)
+            
             logging.info(f"SCO socket connected to {device_address}")
             return True
             
@@ -423,6 +809,7 @@ class AudioManager:
     def disconnect_sco(self) -> None:
         """Disconnect SCO socket."""
         if self.sco_socket:
+            self._unregister_sco()
             try:
                 self.sco_socket.close()
             except:
@@ -430,6 +817,14 @@ class AudioManager:
             self.sco_socket = None
             logging.info("SCO socket disconnected")
     
+    def _unregister_sco(self) -> None:
+        """Remove the SCO socket from the audio loop selector, if present."""
+        if self._selector and self.sco_socket:
+            try:
+                self._selector.unregister(self.sco_socket)
+            except (KeyError, ValueError):
+                pass
+    
     def start_audio_loop(self) -> bool:
         """
         Start audio capture/playback loop.
@@ -446,9 +841,33 @@ class AudioManager:
             return False
         
         self._stop_event.clear()
+        
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, _SRC_WAKE)
+        if self.sco_socket:
+            self._selector.register(self.sco_socket, selectors.EVENT_READ, _SRC_SCO)
+        for fd, mask in self.capture_device.polldescriptors():
+            events = 0
+            if mask & select.POLLIN:
+                events |= selectors.EVENT_READ
+            if mask & select.POLLOUT:
+                events |= selectors.EVENT_WRITE
+            self._selector.register(fd, events or selectors.EVENT_READ, _SRC_CAPTURE)
+        
+        if self.preprocessor:
+            self._preproc_q_in = queue.Queue(maxsize=4)
+            self._preproc_q_out = queue.Queue(maxsize=4)
+            self._preproc_thread = threading.Thread(target=self._preproc_worker, daemon=True)
+            self._preproc_thread.start()
+        
         self.audio_thread = threading.Thread(target=self._audio_loop, daemon=True)
         self.audio_thread.start()
         
+        self._reporter_thread = threading.Thread(target=self._error_reporter, daemon=True)
+        self._reporter_thread.start()
+        
         self.state = AudioState.ACTIVE_CALL
         logging.info("Audio loop started")
         return True
@@ -456,10 +875,33 @@ class AudioManager:
     def stop_audio_loop(self) -> None:
         """Stop audio capture/playback loop."""
         self._stop_event.set()
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b'\0')
+            except OSError:
+                pass
         if self.audio_thread:
             self.audio_thread.join(timeout=2.0)
             self.audio_thread = None
         
+        if self._preproc_thread:
+            self._put_drop_oldest(self._preproc_q_in, None)
+            self._preproc_thread.join(timeout=2.0)
+            self._preproc_thread = None
+            self._preproc_q_in = self._preproc_q_out = None
+        
+        if self._reporter_thread:
+            self._reporter_thread.join(timeout=2.0)
+            self._reporter_thread = None
+        
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+        
         self.state = AudioState.IDLE
         logging.info("Audio loop stopped")
     
@@ -467,76 +909,251 @@ class AudioManager:
         """Audio processing loop (runs in separate thread)."""
         logging.info("Audio loop thread started")
         
+        # Devices and processing stages stay fixed for the lifetime of the
+        # loop (see cleanup()), so keep them in locals
+        capture = self.capture_device
+        playback = self.playback_device
+        preprocessor = self.preprocessor
+        monitor = self.monitor
+        selector = self._selector
+        wake_r = self._wake_r
+        
+        q_in = self._preproc_q_in
+        q_out = self._preproc_q_out
+        
+        # Reused receive buffer for downlink SCO packets. Consumers copy
+        # what they keep (AEC reference) or hand it straight to ALSA.
+        rx_buf = bytearray(self.sco_mtu * 4)
+        rx_view = memoryview(rx_buf)
+        
+        # Capture poll descriptors, in the order ALSA expects them back
+        capture_fds = [fd for fd, _ in capture.polldescriptors()]
+        
+        # A prepared capture stream only starts running, and so only
+        # becomes readable to poll, once it has been read from
+        try:
+            capture.read()
+        except alsaaudio.ALSAAudioError:
+            pass
+        
         while not self._stop_event.is_set():
             try:
-                # Read from microphone
-                with self._audio_lock:
-                    if self.capture_device:
-                        length, data = self.capture_device.read()
-                    else:
-                        length, data = 0, None
-                
-                if length > 0 and data:
-                    # Apply preprocessing if enabled
-                    processed_data = data
-                    has_voice = True
-                    
-                    if self.preprocessor:
-                        try:
-                            processed_data = self.preprocessor.process_frame(data)
-                            # Check voice activity for monitoring
-                            has_voice = self.preprocessor._detect_voice_activity(
-                                np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-                            )
-                        except Exception as e:
-                            logging.error(f"Preprocessing error: {e}")
-                            processed_data = data  # Fallback to unprocessed
+                # Single wait for whichever source is ready: a captured
+                # period, a downlink SCO packet or the stop signal
+                capture_ready = {}
+                for key, events in selector.select():
+                    source = key.data
                     
-                    # Monitor quality if enabled
-                    if self.monitor:
-                        try:
-                            self.monitor.record_capture_timestamp()
-                            self.monitor.analyze_frame(processed_data, has_voice)
-                            self.monitor.log_metrics(interval_frames=50)
-                        except Exception as e:
-                            logging.error(f"Monitoring error: {e}")
+                    if source == _SRC_CAPTURE:
+                        capture_ready[key.fd] = (
+                            (select.POLLIN if events & selectors.EVENT_READ else 0)
+                            | (select.POLLOUT if events & selectors.EVENT_WRITE else 0)
+                        )
                     
-                    # Send to SCO socket if connected (Bluetooth voice)
-                    if self.sco_socket:
+                    elif source == _SRC_SCO:
                         try:
-                            self.sco_socket.send(processed_data)
-                        except (socket.error, BlockingIOError):
-                            pass  # Non-blocking socket, ignore if would block
+                            n = key.fileobj.recv_into(rx_view, len(rx_view))
+                        except BlockingIOError:
+                            continue
+                        except OSError:
+                            n = 0
+                        if not n:
+                            # The link dropped (EOF or a socket error). The
+                            # socket would stay readable forever, so stop
+                            # waiting on it
+                            self.disconnect_sco()
+                            continue
+                        
+                        incoming_data = rx_view[:n]
+                        # Update AEC reference before playing
+                        if preprocessor:
+                            preprocessor.update_speaker_signal(incoming_data)
+                        
+                        # Play received audio
+                        playback.write(incoming_data)
                     
-                    # Call callback with processed audio
-                    if self.on_audio_data:
-                        self.on_audio_data(processed_data)
+                    else:
+                        os.read(wake_r, 64)
+                
+                if not capture_ready:
+                    continue
+                
+                # Plugin PCMs (PulseAudio's among them) signal through their
+                # own fds; ALSA translates that into the stream's readiness
+                # and clears the plugin's wakeup
+                revents = capture.polldescriptors_revents(
+                    [(fd, capture_ready.get(fd, 0)) for fd in capture_fds]
+                )
+                if not revents & (select.POLLIN | select.POLLERR):
+                    continue
                 
-                # Receive from SCO socket and play
-                if self.sco_socket:
-                    try:
-                        incoming_data = self.sco_socket.recv(self.sco_mtu * 4)
-                        if incoming_data:
-                            # Update AEC reference before playing
-                            if self.preprocessor:
-                                self.preprocessor.update_speaker_signal(incoming_data)
-                            
-                            # Play received audio
-                            with self._audio_lock:
-                                if self.playback_device:
-                                    self.playback_device.write(incoming_data)
-                    except (socket.error, BlockingIOError):
-                        pass  # Non-blocking, no data available
+                # Drain every period ALSA has ready (non-blocking)
+                length, data = capture.read()
+                while length:
+                    if length > 0:
+                        self._handle_capture(data, preprocessor, monitor, q_in, q_out)
+                    else:
+                        # Overrun: pyalsaaudio has re-prepared the stream,
+                        # which (as at startup) only runs again once it is
+                        # read from
+                        self._err_counters['xrun'] += 1
+                    length, data = capture.read()
                 
             except alsaaudio.ALSAAudioError as e:
-                logging.error(f"Audio loop error: {e}")
+                self._err_counters['alsa'] += 1
+                self._err_last['alsa'] = e
                 time.sleep(0.1)
             except Exception as e:
-                logging.error(f"Unexpected error in audio loop: {e}")
+                self._err_counters['loop'] += 1
+                self._err_last['loop'] = e
                 time.sleep(0.1)
         
         logging.info("Audio loop thread stopped")
     
+    def _handle_capture(self, data: bytes, preprocessor, monitor,
+                        q_in: Optional[queue.Queue],
+                        q_out: Optional[queue.Queue]) -> None:
+        """
+        Route one captured period towards the uplink (audio thread).
+        
+        Args:
+            data: Captured audio bytes
+            preprocessor: Preprocessor, if enabled
+            monitor: Quality monitor, if enabled
+            q_in: Preprocessing worker input queue
+            q_out: Preprocessing worker output queue
+        """
+        if monitor:
+            monitor.record_capture_timestamp()
+        
+        if preprocessor:
+            # Hand the frame to the preprocessing worker and send
+            # whatever it has finished (normally the previous frame)
+            if not self._put_drop_oldest(q_in, data):
+                self._err_counters['overrun'] += 1
+            while True:
+                try:
+                    processed_data, has_voice = q_out.get_nowait()
+                except queue.Empty:
+                    break
+                self._send_uplink(processed_data, has_voice, monitor)
+        else:
+            has_voice = True
+            stats = None
+            if monitor:
+                # One pass over the int16 frame gives both the
+                # energy VAD decision and the monitor's levels
+                samples = np.frombuffer(data, dtype=np.int16)
+                stats = frame_stats(samples)
+                has_voice = stats[0] > self.VAD_ENERGY_PER_SAMPLE * samples.size
+            self._send_uplink(data, has_voice, monitor, stats)
+    
+    def _send_uplink(self, processed_data: bytes, has_voice: bool,
+                     monitor: Optional["AudioMonitor"],
+                     stats: Optional[tuple] = None) -> None:
+        """
+        Monitor and deliver one processed capture frame (audio thread).
+        
+        Args:
+            processed_data: Processed audio bytes
+            has_voice: Voice activity for the frame
+            monitor: Quality monitor, if enabled
+            stats: Precomputed frame statistics (see audio_kernels.frame_stats)
+        """
+        # Monitor quality if enabled
+        if monitor:
+            try:
+                monitor.analyze_frame(processed_data, has_voice, stats)
+                monitor.log_metrics(interval_frames=50)
+            except Exception as e:
+                self._err_counters['monitor'] += 1
+                self._err_last['monitor'] = e
+        
+        # Send to SCO socket if connected (Bluetooth voice)
+        if self.sco_socket:
+            try:
+                self.sco_socket.send(processed_data)
+            except (socket.error, BlockingIOError):
+                pass  # Non-blocking socket, ignore if would block
+        
+        # Call callback with processed audio
+        if self.on_audio_data:
+            self.on_audio_data(processed_data)
+    
+    def _preproc_worker(self) -> None:
+        """Preprocess captured frames off the audio thread (runs in separate thread)."""
+        preprocessor = self.preprocessor
+        q_in = self._preproc_q_in
+        q_out = self._preproc_q_out
+        
+        while True:
+            data = q_in.get()
+            if data is None:
+                break
+            
+            try:
+                processed_data = preprocessor.process_frame(data)
+                # Voice activity was already evaluated while
+                # processing the frame
+                has_voice = preprocessor.last_vad
+            except Exception as e:
+                self._err_counters['preproc'] += 1
+                self._err_last['preproc'] = e
+                processed_data = data  # Fallback to unprocessed
+                has_voice = True
+            
+            if not self._put_drop_oldest(q_out, (processed_data, has_voice)):
+                self._err_counters['preproc_overrun'] += 1
+    
+    @staticmethod
+    def _put_drop_oldest(q: queue.Queue, item) -> bool:
+        """
+        Put an item on a bounded queue without blocking.
+        
+        Args:
+            q: Target queue
+            item: Item to enqueue
+            
+        Returns:
+            True if no queued item had to be dropped to make room
+        """
+        try:
+            q.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+        return False
+    
+    def _error_reporter(self) -> None:
+        """Periodically log errors counted by the audio loop (runs in separate thread)."""
+        reported = dict(self._err_counters)
+        
+        while True:
+            stopping = self._stop_event.wait(self._error_report_interval)
+            
+            current = dict(self._err_counters)
+            for key, count in current.items():
+                delta = count - reported[key]
+                if delta:
+                    last = self._err_last.get(key)
+                    logging.error(
+                        f"Audio loop: {delta} {key} error(s) in the last interval"
+                        + (f" (last: {last})" if last else "")
+                    )
+            reported = current
+            
+            if stopping:
+                break
+    
     def play_audio(self, data: bytes) -> bool:
         """
         Play audio data to speaker.
@@ -581,14 +1198,27 @@ class AudioManager:
         # Disconnect SCO
         self.disconnect_sco()
         
-        with self._audio_lock:
-            if self.capture_device:
-                self.capture_device.close()
-                self.capture_device = None
-            
-            if self.playback_device:
-                self.playback_device.close()
-                self.playback_device = None
+        # The audio thread has been joined above, so nothing else is
+        # using the devices at this point
+        if self.capture_device:
+            self.capture_device.close()
+            self.capture_device = None
+        
+        if self.playback_device:
+            self.playback_device.close()
+            self.playback_device = None
+        
+        for mixer in (self._master_mixer, self._capture_mixer):
+            if mixer:
+                mixer.close()
+        self._master_mixer = None
+        self._capture_mixer = None
+        
+        self._stop_pulse_events()
+        
+        if self._pulse:
+            self._pulse.close()
+            self._pulse = None
         
         logging.info("AudioManager cleaned up")
 
@@ -12,16 +12,20 @@ This module monitors real-time audio quality metrics:
 """
 
 import logging
+import math
 import numpy as np
 import time
 from typing import Dict, Optional
 from collections import deque
+from itertools import islice
 from dataclasses import dataclass
 
+from audio_kernels import INV_32768, frame_stats
 
-@dataclass
+
+@dataclass(frozen=True)
 class AudioQualityMetrics:
-    """Audio quality metrics data class."""
+    """Audio quality metrics data class (immutable snapshot)."""
     timestamp: float
     rms_level_db: float
     peak_level_db: float
@@ -36,6 +40,10 @@ class AudioQualityMetrics:
 class AudioMonitor:
     """Real-time audio quality monitoring."""
     
+    # Adaptation rate of the noise floor (single-pole IIR over the RMS of
+    # silent frames; time constant of about 1/NOISE_ALPHA silent frames)
+    NOISE_ALPHA = 0.02
+    
     def __init__(self, sample_rate: int = 16000, window_size: int = 100):
         """
         Initialize audio monitor.
@@ -53,15 +61,23 @@ class AudioMonitor:
         self.clip_buffer = deque(maxlen=window_size)
         self.voice_buffer = deque(maxlen=window_size)
         
-        # Noise estimation
+        # Running sums over the metric windows, so averages are O(1)
+        self._rms_sum = 0.0
+        self._peak_sum = 0.0
+        self._clip_sum = 0.0
+        self._voice_sum = 0.0
+        
+        # Noise estimation: exponential moving average of the RMS of
+        # silent frames
         self.noise_floor = 1e-6
-        self.noise_samples = []
+        self._noise_ema = 1e-6
         
         # Codec info
         self.current_codec = "CVSD"
         self.current_sample_rate = sample_rate
         
-        # Latency tracking
+        # Latency tracking (time.monotonic_ns stamps, immune to wall-clock
+        # adjustments)
         self.capture_timestamps = deque(maxlen=10)
         self.output_timestamps = deque(maxlen=10)
         
@@ -69,54 +85,142 @@ class AudioMonitor:
         self.frames_monitored = 0
         self.total_clipping_frames = 0
         
+        # Last metrics snapshot, dropped whenever its inputs change
+        self._metrics_cache: Optional[AudioQualityMetrics] = None
+        
         logging.info("AudioMonitor initialized")
     
-    def analyze_frame(self, audio_data: bytes, has_voice: bool = True) -> None:
+    def analyze_frame(self, audio_data: bytes, has_voice: bool = True,
+                      stats: Optional[tuple] = None) -> None:
         """
         Analyze single audio frame.
         
         Args:
             audio_data: Raw audio bytes (16-bit PCM)
             has_voice: Whether frame contains voice
+            stats: Precomputed (sum of squares, peak, clipped samples) of the
+                frame in int16 units, as returned by audio_kernels.frame_stats
         """
-        # Convert to numpy array
+        # Work on the int16 samples directly, no float copy
         audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32768.0
         
-        # Calculate RMS level
-        rms = np.sqrt(np.mean(audio_float ** 2))
-        self.rms_buffer.append(rms)
+        if stats is None:
+            # Energy, peak and clipping in a single pass over the samples
+            stats = frame_stats(audio_int16)
+        energy, peak_i16, clipping_samples = stats
         
-        # Calculate peak level
-        peak = np.max(np.abs(audio_float))
-        self.peak_buffer.append(peak)
+        # Calculate RMS and peak level
+        rms = float(math.sqrt(energy / len(audio_int16)) * INV_32768)
+        self._rms_sum += self._window_push(self.rms_buffer, rms)
+        self._peak_sum += self._window_push(self.peak_buffer, float(peak_i16 * INV_32768))
         
-        # Detect clipping
-        clipping_samples = np.sum(np.abs(audio_int16) >= 32767)
         clipping_percent = (clipping_samples / len(audio_int16)) * 100
-        self.clip_buffer.append(clipping_percent)
+        self._clip_sum += self._window_push(self.clip_buffer, clipping_percent)
         
         if clipping_percent > 0:
             self.total_clipping_frames += 1
         
         # Track voice activity
-        self.voice_buffer.append(1.0 if has_voice else 0.0)
+        self._voice_sum += self._window_push(self.voice_buffer, 1.0 if has_voice else 0.0)
         
         # Update noise floor during silence
         if not has_voice and rms > 0:
-            self.noise_samples.append(rms)
-            if len(self.noise_samples) > 50:
-                self.noise_floor = np.median(self.noise_samples[-50:])
+            self._noise_ema += self.NOISE_ALPHA * (rms - self._noise_ema)
+            self.noise_floor = max(self._noise_ema, 1e-6)
         
         self.frames_monitored += 1
+        self._metrics_cache = None
+    
+    def analyze_frames(self, audio_data: bytes, frame_size: int,
+                       voice_flags: np.ndarray) -> None:
+        """
+        Analyze a block of consecutive frames in one pass.
+        
+        Equivalent to calling analyze_frame once per frame, but the
+        statistics of all frames are computed with a few array
+        reductions instead of per-frame calls.
+        
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM), a whole number of frames
+            frame_size: Samples per frame
+            voice_flags: Per-frame voice activity (one entry per frame)
+        """
+        frames = np.frombuffer(audio_data, dtype=np.int16).reshape(-1, frame_size)
+        voice = np.asarray(voice_flags, dtype=bool)
+        if voice.shape != (frames.shape[0],):
+            raise ValueError(f"Expected {frames.shape[0]} voice flags, got {voice.size}")
+        if frames.shape[0] == 0:
+            return
+        
+        energy = np.einsum('ij,ij->i', frames, frames, dtype=np.int64)
+        magnitude = np.abs(frames, dtype=np.int32)
+        peak = magnitude.max(axis=1)
+        clipping_samples = np.count_nonzero(magnitude >= 32767, axis=1)
+        
+        rms = np.sqrt(energy / frame_size) * INV_32768
+        clipping_percent = clipping_samples * (100.0 / frame_size)
+        
+        self._rms_sum += self._window_extend(self.rms_buffer, rms.tolist())
+        self._peak_sum += self._window_extend(self.peak_buffer, (peak * INV_32768).tolist())
+        self._clip_sum += self._window_extend(self.clip_buffer, clipping_percent.tolist())
+        self._voice_sum += self._window_extend(self.voice_buffer, voice.astype(np.float64).tolist())
+        
+        self.total_clipping_frames += int(np.count_nonzero(clipping_samples))
+        
+        # The noise floor IIR unrolled over the block's silent frames:
+        # ema_k = (1-a)^k * ema_0 + sum(a * (1-a)^(k-1-i) * rms_i)
+        silent = rms[~voice & (rms > 0)]
+        if silent.size:
+            decay = (1.0 - self.NOISE_ALPHA) ** np.arange(silent.size, -1, -1)
+            self._noise_ema = float(decay[0] * self._noise_ema
+                                    + self.NOISE_ALPHA * np.dot(decay[1:], silent))
+            self.noise_floor = max(self._noise_ema, 1e-6)
+        
+        self.frames_monitored += frames.shape[0]
+        self._metrics_cache = None
+    
+    @staticmethod
+    def _window_extend(buffer: deque, values: list) -> float:
+        """
+        Append several values to a bounded metric window.
+        
+        Args:
+            buffer: Window deque (with maxlen)
+            values: New values, oldest first
+            
+        Returns:
+            Change to apply to the window's running sum
+        """
+        overflow = len(buffer) + len(values) - buffer.maxlen
+        evicted = sum(islice(buffer, 0, min(max(0, overflow), len(buffer))))
+        buffer.extend(values)
+        return sum(values[-buffer.maxlen:]) - evicted
+    
+    @staticmethod
+    def _window_push(buffer: deque, value: float) -> float:
+        """
+        Append to a bounded metric window.
+        
+        Args:
+            buffer: Window deque (with maxlen)
+            value: New value
+            
+        Returns:
+            Change to apply to the window's running sum
+        """
+        evicted = buffer[0] if len(buffer) == buffer.maxlen else 0.0
+        buffer.append(value)
+        return value - evicted
     
     def record_capture_timestamp(self) -> None:
         """Record timestamp when audio was captured."""
-        self.capture_timestamps.append(time.time())
+        self.capture_timestamps.append(time.monotonic_ns())
+        self._metrics_cache = None
     
     def record_output_timestamp(self) -> None:
         """Record timestamp when audio was output."""
-        self.output_timestamps.append(time.time())
+        self.output_timestamps.append(time.monotonic_ns())
+        self._metrics_cache = None
     
     def estimate_latency(self) -> float:
         """
@@ -128,58 +232,83 @@ class AudioMonitor:
         if len(self.capture_timestamps) < 2 or len(self.output_timestamps) < 2:
             return 0.0
         
-        # Calculate average delay between capture and output
-        latencies = []
-        for cap_time in list(self.capture_timestamps)[-5:]:
-            # Find closest output timestamp
-            output_times = list(self.output_timestamps)[-5:]
-            if output_times:
-                closest_output = min(output_times, key=lambda x: abs(x - cap_time))
-                if closest_output > cap_time:
-                    latency = (closest_output - cap_time) * 1000  # Convert to ms
-                    latencies.append(latency)
-        
-        if latencies:
-            return np.mean(latencies)
+        # Pair each of the last 5 captures with its closest output among
+        # the last 5 outputs; only outputs after the capture count
+        cap = np.fromiter(self.capture_timestamps, dtype=np.int64,
+                          count=len(self.capture_timestamps))[-5:]
+        out = np.fromiter(self.output_timestamps, dtype=np.int64,
+                          count=len(self.output_timestamps))[-5:]
+        closest = out[np.abs(out[None, :] - cap[:, None]).argmin(axis=1)]
+        delays = closest - cap
+        delays = delays[delays > 0]
+        
+        if delays.size:
+            return float(delays.mean()) / 1_000_000.0  # ns to ms
+        return 0.0
+    
+    def _window_avg(self, total: float, empty: float) -> float:
+        """
+        Average over the metric window from its running sum.
+        
+        Args:
+            total: Running sum of one metric window
+            empty: Value to return before any frame has been analyzed
+            
+        Returns:
+            Window average (clamped at zero to absorb rounding left over
+            from evicted values)
+        """
+        n = len(self.rms_buffer)
+        return max(0.0, total / n) if n else empty
+    
+    def _rms_avg(self) -> float:
+        """Average linear RMS level over the window."""
+        return self._window_avg(self._rms_sum, 1e-6)
+    
+    def _clip_avg(self) -> float:
+        """Average clipping percentage over the window."""
+        return self._window_avg(self._clip_sum, 0.0)
+    
+    def _rms_db(self) -> float:
+        """Average RMS level in dBFS."""
+        avg_rms = self._rms_avg()
+        return 20 * math.log10(avg_rms) if avg_rms > 0 else -100
+    
+    def _snr_db(self) -> float:
+        """SNR of the average RMS level against the noise floor in dB."""
+        avg_rms = self._rms_avg()
+        if self.noise_floor > 0 and avg_rms > self.noise_floor:
+            return 20 * math.log10(avg_rms / self.noise_floor)
         return 0.0
     
     def get_current_metrics(self) -> AudioQualityMetrics:
         """
         Get current audio quality metrics.
         
+        The snapshot is cached until the next analyzed frame, timestamp or
+        codec change, so repeated polling doesn't rebuild it.
+        
         Returns:
             AudioQualityMetrics object
         """
-        # Calculate averages from buffers
-        avg_rms = np.mean(list(self.rms_buffer)) if self.rms_buffer else 1e-6
-        avg_peak = np.mean(list(self.peak_buffer)) if self.peak_buffer else 1e-6
-        avg_clip = np.mean(list(self.clip_buffer)) if self.clip_buffer else 0.0
-        avg_voice = np.mean(list(self.voice_buffer)) if self.voice_buffer else 0.0
+        if self._metrics_cache is not None:
+            return self._metrics_cache
         
-        # Convert to dB
-        rms_db = 20 * np.log10(avg_rms) if avg_rms > 0 else -100
-        peak_db = 20 * np.log10(avg_peak) if avg_peak > 0 else -100
+        avg_peak = self._window_avg(self._peak_sum, 1e-6)
+        peak_db = 20 * math.log10(avg_peak) if avg_peak > 0 else -100
         
-        # Calculate SNR
-        if self.noise_floor > 0 and avg_rms > self.noise_floor:
-            snr_db = 20 * np.log10(avg_rms / self.noise_floor)
-        else:
-            snr_db = 0.0
-        
-        # Estimate latency
-        latency = self.estimate_latency()
-        
-        return AudioQualityMetrics(
+        self._metrics_cache = AudioQualityMetrics(
             timestamp=time.time(),
-            rms_level_db=rms_db,
+            rms_level_db=self._rms_db(),
             peak_level_db=peak_db,
-            snr_db=snr_db,
-            clipping_percent=avg_clip,
-            voice_activity_percent=avg_voice * 100,
+            snr_db=self._snr_db(),
+            clipping_percent=self._clip_avg(),
+            voice_activity_percent=self._window_avg(self._voice_sum, 0.0) * 100,
             codec=self.current_codec,
             sample_rate=self.current_sample_rate,
-            latency_ms=latency
+            latency_ms=self.estimate_latency()
         )
+        return self._metrics_cache
     
     def set_codec_info(self, codec: str, sample_rate: int) -> None:
         """
@@ -191,6 +320,7 @@ class AudioMonitor:
         """
         self.current_codec = codec
         self.current_sample_rate = sample_rate
+        self._metrics_cache = None
         logging.info(f"Codec updated: {codec} @ {sample_rate}Hz")
     
     def get_statistics(self) -> dict:
@@ -215,7 +345,7 @@ class AudioMonitor:
             'codec': metrics.codec,
             'sample_rate': metrics.sample_rate,
             'estimated_latency_ms': metrics.latency_ms,
-            'noise_floor_db': 20 * np.log10(self.noise_floor) if self.noise_floor > 0 else -100
+            'noise_floor_db': 20 * math.log10(self.noise_floor) if self.noise_floor > 0 else -100
         }
     
     def log_metrics(self, interval_frames: int = 50) -> None:
@@ -225,18 +355,25 @@ class AudioMonitor:
         Args:
             interval_frames: Log every N frames
         """
-        if self.frames_monitored % interval_frames == 0 and self.frames_monitored > 0:
-            stats = self.get_statistics()
-            
-            logging.info(
-                f"Audio Quality - "
-                f"RMS: {stats['current_rms_db']:.1f}dB, "
-                f"SNR: {stats['current_snr_db']:.1f}dB, "
-                f"Clip: {stats['current_clipping_percent']:.2f}%, "
-                f"Voice: {stats['voice_activity_percent']:.0f}%, "
-                f"Codec: {stats['codec']}, "
-                f"Latency: {stats['estimated_latency_ms']:.0f}ms"
-            )
+        if self.frames_monitored % interval_frames != 0 or self.frames_monitored == 0:
+            return
+        
+        # Skip building the statistics entirely when INFO is filtered out
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        
+        stats = self.get_statistics()
+        
+        logging.info(
+            "Audio Quality - RMS: %.1fdB, SNR: %.1fdB, Clip: %.2f%%, "
+            "Voice: %.0f%%, Codec: %s, Latency: %.0fms",
+            stats['current_rms_db'],
+            stats['current_snr_db'],
+            stats['current_clipping_percent'],
+            stats['voice_activity_percent'],
+            stats['codec'],
+            stats['estimated_latency_ms']
+        )
     
     def is_quality_acceptable(self) -> tuple[bool, str]:
         """
@@ -245,23 +382,27 @@ class AudioMonitor:
         Returns:
             (acceptable, reason) tuple
         """
-        metrics = self.get_current_metrics()
-        
-        # Check for excessive clipping
-        if metrics.clipping_percent > 1.0:
-            return False, f"Excessive clipping: {metrics.clipping_percent:.1f}%"
+        # Each check computes only what it needs, without building a
+        # full metrics snapshot
+        clip = self._clip_avg()
+        if clip > 1.0:
+            return False, f"Excessive clipping: {clip:.1f}%"
         
         # Check for low SNR
-        if metrics.snr_db < 10.0 and self.frames_monitored > 50:
-            return False, f"Low SNR: {metrics.snr_db:.1f}dB"
+        if self.frames_monitored > 50:
+            snr_db = self._snr_db()
+            if snr_db < 10.0:
+                return False, f"Low SNR: {snr_db:.1f}dB"
         
         # Check for very low level
-        if metrics.rms_level_db < -40.0:
-            return False, f"Signal too quiet: {metrics.rms_level_db:.1f}dB"
+        rms_db = self._rms_db()
+        if rms_db < -40.0:
+            return False, f"Signal too quiet: {rms_db:.1f}dB"
         
         # Check for excessive latency
-        if metrics.latency_ms > 300:
-            return False, f"High latency: {metrics.latency_ms:.0f}ms"
+        latency = self.estimate_latency()
+        if latency > 300:
+            return False, f"High latency: {latency:.0f}ms"
         
         return True, "Quality OK"
     
@@ -271,46 +412,16 @@ class AudioMonitor:
         self.peak_buffer.clear()
         self.clip_buffer.clear()
         self.voice_buffer.clear()
+        self._rms_sum = 0.0
+        self._peak_sum = 0.0
+        self._clip_sum = 0.0
+        self._voice_sum = 0.0
         self.capture_timestamps.clear()
         self.output_timestamps.clear()
-        self.noise_samples.clear()
+        self._noise_ema = 1e-6
         self.frames_monitored = 0
         self.total_clipping_frames = 0
         self.noise_floor = 1e-6
+        self._metrics_cache = None
         logging.info("AudioMonitor reset")
 
-
-if __name__ == "__main__":
-    # Test audio monitor
-    logging.basicConfig(level=logging.INFO)
-    
-    monitor = AudioMonitor(sample_rate=16000)
-    monitor.set_codec_info("mSBC", 16000)
-    
-    # Generate test audio
-    duration = 1.0
-    sample_rate = 16000
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    
-    # Test signal with noise
-    signal_audio = 0.5 * np.sin(2 * np.pi * 1000 * t)
-    noise = 0.05 * np.random.randn(len(t))
-    test_audio = signal_audio + noise
-    
-    # Process in frames
-    frame_size = 320  # 20ms
-    for i in range(0, len(test_audio) - frame_size, frame_size):
-        frame = test_audio[i:i+frame_size]
-        frame_bytes = (frame * 32768).astype(np.int16).tobytes()
-        
-        monitor.record_capture_timestamp()
-        monitor.analyze_frame(frame_bytes, has_voice=True)
-        monitor.log_metrics(interval_frames=25)
-    
-    print("\nFinal Statistics:")
-    stats = monitor.get_statistics()
-    for key, value in stats.items():
-        print(f"  {key}: {value}")
-    
-    acceptable, reason = monitor.is_quality_acceptable()
-    print(f"\nQuality: {'✓ Acceptable' if acceptable else '✗ Poor'} - {reason}")
@@ -12,12 +12,14 @@ microphone transmission to phones:
 """
 
 import logging
+import math
 import numpy as np
 from scipy import signal
 from scipy.fft import rfft, irfft
-from typing import Optional, Tuple
-from collections import deque
-import threading
+from typing import List, Optional, Tuple
+
+from audio_kernels import (NUMBA_AVAILABLE, INV_32768, sos_filter, nlms_filter,
+                           soft_clip_to_i16)
 
 try:
     import webrtcvad
@@ -26,6 +28,13 @@ except ImportError:
     WEBRTC_AVAILABLE = False
     logging.warning("webrtcvad not available, voice activity detection disabled")
 
+try:
+    import pyfftw
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+    logging.warning("pyfftw not available, using scipy.fft for noise reduction")
+
 try:
     import speexdsp
     SPEEXDSP_AVAILABLE = True
@@ -66,7 +75,7 @@ class AudioPreprocessor:
         
         # Feature flags
         self.enable_noise_reduction = enable_noise_reduction
-        self.noise_reduction_level = noise_reduction_level
+        self._noise_reduction_level = noise_reduction_level
         self.enable_aec = enable_aec
         self.enable_agc = enable_agc
         self.enable_highpass = enable_highpass
@@ -77,20 +86,59 @@ class AudioPreprocessor:
         self.agc_attack = 0.01
         self.agc_release = 0.001
         
-        # Noise reduction parameters
+        # Noise reduction parameters. _scaled_noise is the profile times
+        # the over-subtraction factor, refreshed whenever either changes.
         self.noise_profile: Optional[np.ndarray] = None
+        self._scaled_noise: Optional[np.ndarray] = None
         self.noise_estimation_frames = 25  # ~500ms at 20ms frames
         self.noise_frames_collected = 0
+        # During silence only every Nth frame goes through the FFT (and
+        # refreshes the noise profile); the rest are attenuated directly
+        self.silence_gain = 0.1
+        self.silence_fft_interval = 8
+        self._silent_frames = 0
         self.fft_size = 512
         self.overlap = 0.5
+        # Zero-padded FFT input, reused every frame instead of np.pad.
+        # With pyfftw the transforms are planned once against it (aligned).
+        self._rfft = None
+        self._irfft = None
+        if PYFFTW_AVAILABLE:
+            try:
+                self._fft_in = pyfftw.zeros_aligned(self.fft_size, dtype='float32')
+                self._rfft = pyfftw.builders.rfft(
+                    self._fft_in, avoid_copy=True, threads=1,
+                    planner_effort='FFTW_MEASURE'
+                )
+                self._irfft = pyfftw.builders.irfft(
+                    pyfftw.zeros_aligned(self.fft_size // 2 + 1, dtype='complex64'),
+                    n=self.fft_size, threads=1, planner_effort='FFTW_MEASURE'
+                )
+            except Exception as e:
+                logging.warning(f"Failed to plan FFTW transforms, using scipy.fft: {e}")
+                self._rfft = None
+                self._irfft = None
+        if self._rfft is None:
+            self._fft_in = np.zeros(self.fft_size, dtype=np.float32)
+        # Samples written into _fft_in by the last frame; the tail beyond
+        # it is known to be zero and only needs clearing if a frame shrinks
+        self._fft_in_len = 0
+        # Per-bin gain mask, computed in place every frame
+        self._nr_gain = np.empty(self.fft_size // 2 + 1, dtype=np.float32)
         self.prev_frame: Optional[np.ndarray] = None
         
         # Echo cancellation parameters
         self.aec_filter_length = 1024
         self.aec_filter = np.zeros(self.aec_filter_length)
         self.aec_step_size = 0.5
-        self.speaker_buffer = deque(maxlen=self.aec_filter_length * 8)  # Extended for latency
-        self.speaker_buffer_lock = threading.Lock()
+        # Speaker reference kept as raw int16 samples, exactly as played,
+        # in a ring buffer (extended for latency). The ring has a single
+        # producer (playback) and a single consumer (capture), so it is
+        # lock-free: _spk_written counts every sample ever written and is
+        # only assigned by the producer, after the samples are in place.
+        self._spk_ring = np.zeros(self.aec_filter_length * 8, dtype=np.int16)
+        self._spk_written = 0
+        self._spk_scratch = np.empty_like(self._spk_ring)
         
         # SpeexDSP Echo Canceller
         self.speex_echo = None
@@ -113,12 +161,22 @@ class AudioPreprocessor:
         self.nlms_weights = np.zeros(512)
         self.nlms_mu = 0.3  # Reduced step size for stability
         
+        # Frequency-domain state of the same filter, used instead of the
+        # per-sample loop when numba is unavailable (sized on first use)
+        self._fdaf_W: Optional[np.ndarray] = None
+        self._fdaf_x: Optional[np.ndarray] = None
+        self._fdaf_e: Optional[np.ndarray] = None
+        self._fdaf_power: Optional[np.ndarray] = None
+        
         # High-pass filter
         if self.enable_highpass:
             nyquist = sample_rate / 2
             normalized_cutoff = highpass_cutoff / nyquist
-            self.hp_b, self.hp_a = signal.butter(4, normalized_cutoff, btype='high')
-            self.hp_zi = signal.lfilter_zi(self.hp_b, self.hp_a)
+            # Second-order sections are better conditioned than the
+            # transfer-function form at low cutoffs
+            self.hp_sos = signal.butter(4, normalized_cutoff, btype='high', output='sos')
+            # Per-section state, starting from rest (sosfilt layout)
+            self.hp_zi = np.zeros((len(self.hp_sos), 2))
         
         # WebRTC VAD for voice activity detection
         self.vad = None
@@ -128,12 +186,43 @@ class AudioPreprocessor:
             except Exception as e:
                 logging.warning(f"Failed to initialize WebRTC VAD: {e}")
         
+        # Voice activity of the most recent frame, computed once per frame
+        # in process_frame() and shared with callers (e.g. quality monitor)
+        self.last_vad = True
+        
+        # int16 output of SpeexDSP for the current frame, reused by the VAD
+        # instead of converting the float frame back (None if not available)
+        self._aec_int16: Optional[np.ndarray] = None
+        
+        # Per-frame conversion buffers, reused across calls (regrown if a
+        # larger frame arrives)
+        self._scratch_f = np.empty(self.frame_size, dtype=np.float32)
+        self._scratch_i16 = np.empty(self.frame_size, dtype=np.int16)
+        
         # Statistics
         self.frames_processed = 0
         self.total_gain_applied = 0.0
         
         logging.info(f"AudioPreprocessor initialized: {sample_rate}Hz, {frame_size_ms}ms frames")
     
+    @property
+    def noise_reduction_level(self) -> int:
+        """Noise reduction strength (0-3)."""
+        return self._noise_reduction_level
+    
+    @noise_reduction_level.setter
+    def noise_reduction_level(self, level: int) -> None:
+        self._noise_reduction_level = level
+        self._rescale_noise_profile()
+    
+    def _rescale_noise_profile(self) -> None:
+        """Recompute the noise profile scaled by the over-subtraction factor."""
+        if self.noise_profile is None:
+            self._scaled_noise = None
+        else:
+            over_subtraction = 1.0 + (self._noise_reduction_level * 0.5)
+            self._scaled_noise = self.noise_profile * np.float32(over_subtraction)
+    
     def process_frame(self, audio_data: bytes) -> bytes:
         """
         Process single audio frame.
@@ -144,45 +233,163 @@ class AudioPreprocessor:
         Returns:
             Processed audio bytes
         """
-        # Convert bytes to numpy array
+        # Convert bytes to numpy array (zero-copy view)
         audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32768.0
+        n = len(audio_int16)
+        if n > len(self._scratch_f):
+            self._scratch_f = np.empty(n, dtype=np.float32)
+            self._scratch_i16 = np.empty(n, dtype=np.int16)
+        
+        # 1. Echo cancellation. SpeexDSP works on int16, so it runs on the
+        # raw microphone samples before the float conversion
+        self._aec_int16 = None
+        if self.enable_aec and self.speex_echo is not None:
+            self._aec_int16 = self._apply_aec_i16(audio_int16)
+            if self._aec_int16 is not None:
+                audio_int16 = self._aec_int16
+        
+        # Apply preprocessing pipeline, starting on the reusable float
+        # buffer (the stages may filter it in place)
+        processed = np.multiply(audio_int16, INV_32768, out=self._scratch_f[:n])
+        
+        # 2. High-pass filter (remove rumble)
+        if self.enable_highpass:
+            sos_filter(processed, self.hp_sos, self.hp_zi)
         
-        # Apply preprocessing pipeline
-        processed = audio_float.copy()
+        # NLMS echo cancellation if SpeexDSP is unavailable (or failed)
+        if self.enable_aec and self._aec_int16 is None:
+            processed = self._apply_nlms_fallback(processed)
         
-        # 1. High-pass filter (remove rumble)
-        if self.enable_highpass:
-            processed, self.hp_zi = signal.lfilter(
-                self.hp_b, self.hp_a, processed, zi=self.hp_zi
-            )
+        # Voice activity (single evaluation per frame)
+        self.last_vad = self._detect_voice_activity(processed, self._aec_int16)
+        
+        # 3. Noise reduction
+        if self.enable_noise_reduction:
+            processed = self._apply_noise_reduction(processed, self.last_vad)
+        
+        out_i16 = self._scratch_i16[:n]
+        
+        # 4. Automatic gain control, fused with the int16 conversion
+        if self.enable_agc and self._update_agc_gain(processed):
+            soft_clip_to_i16(processed, self.agc_gain, out_i16)
+            self.total_gain_applied += self.agc_gain
+        else:
+            # Convert back to int16, scaling in the float scratch buffer
+            self._float_to_int16(processed, out_i16, self._scratch_f[:n])
+        
+        self.frames_processed += 1
+        
+        return out_i16.tobytes()
+    
+    def process_frames(self, audio_data: bytes) -> bytes:
+        """
+        Process several consecutive frames in one call.
+        
+        Equivalent to calling process_frame() on each frame in turn, but
+        the format conversion and high-pass filter run once over the whole
+        buffer and the noise reduction FFTs are batched, so the per-call
+        overhead is paid once per buffer instead of once per frame.
+        Stateful per-frame stages (echo cancellation, VAD, noise profile
+        updates and AGC) still run frame by frame, in order.
         
-        # 2. Echo cancellation
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM), a whole number of frames
+            
+        Returns:
+            Processed audio bytes
+            
+        Raises:
+            ValueError: If the data is not a whole, non-zero number of frames,
+                or is longer than the speaker reference ring with echo
+                cancellation enabled
+        """
+        audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
+        n = len(audio_int16)
+        if n == 0 or n % self.frame_size:
+            raise ValueError(f"Expected a multiple of {self.frame_size} samples, got {n}")
+        num_frames = n // self.frame_size
+        
+        if self.enable_aec and n > self._spk_ring.size:
+            raise ValueError(
+                f"Echo cancellation needs at most {self._spk_ring.size} samples "
+                f"per call, got {n}")
+        
+        # Both echo cancellers pair each frame with the matching slice of
+        # the newest n speaker reference samples
+        speaker_frames = None
         if self.enable_aec:
-            processed = self._apply_aec(processed)
+            speaker = self._latest_speaker_samples(n)
+            if speaker is not None:
+                speaker_frames = speaker.reshape(num_frames, -1)
+        
+        # 1. SpeexDSP echo cancellation, frame by frame
+        aec_int16: List[Optional[np.ndarray]] = [None] * num_frames
+        if speaker_frames is not None and self.speex_echo is not None:
+            mic_frames = audio_int16.reshape(num_frames, -1)
+            audio_int16 = audio_int16.copy()
+            for i in range(num_frames):
+                aec_int16[i] = self._apply_aec_i16(mic_frames[i], speaker_frames[i])
+                if aec_int16[i] is not None:
+                    audio_int16[i * self.frame_size:(i + 1) * self.frame_size] = aec_int16[i]
+        
+        processed = np.multiply(audio_int16, INV_32768, dtype=np.float32)
+        
+        # 2. High-pass filter, once over the whole buffer (the state carries
+        # across frame boundaries exactly as with per-frame calls)
+        if self.enable_highpass:
+            sos_filter(processed, self.hp_sos, self.hp_zi)
+        
+        frames = processed.reshape(num_frames, -1)
+        voice = []
+        for i in range(num_frames):
+            # NLMS echo cancellation if SpeexDSP is unavailable (or failed)
+            if speaker_frames is not None and aec_int16[i] is None:
+                frames[i] = self._apply_nlms_fallback(frames[i], speaker_frames[i])
+            voice.append(self._detect_voice_activity(frames[i], aec_int16[i]))
+        self.last_vad = voice[-1]
+        self._aec_int16 = aec_int16[-1]
         
         # 3. Noise reduction
         if self.enable_noise_reduction:
-            processed = self._apply_noise_reduction(processed)
+            self._apply_noise_reduction_frames(frames, voice)
         
-        # 4. Automatic gain control
-        if self.enable_agc:
-            processed = self._apply_agc(processed)
+        # 4. Automatic gain control, fused with the int16 conversion
+        out_i16 = np.empty((num_frames, self.frame_size), dtype=np.int16)
+        for frame, out in zip(frames, out_i16):
+            if self.enable_agc and self._update_agc_gain(frame):
+                soft_clip_to_i16(frame, self.agc_gain, out)
+                self.total_gain_applied += self.agc_gain
+            else:
+                self._float_to_int16(frame, out, frame)
         
-        # Convert back to int16
-        processed = np.clip(processed * 32768.0, -32768, 32767)
-        processed_int16 = processed.astype(np.int16)
+        self.frames_processed += num_frames
         
-        self.frames_processed += 1
+        return out_i16.tobytes()
+    
+    @staticmethod
+    def _float_to_int16(audio: np.ndarray, out: np.ndarray, work: np.ndarray) -> None:
+        """
+        Convert float audio to int16: scale, clip and round, then cast.
         
-        return processed_int16.tobytes()
+        Args:
+            audio: Float audio
+            out: int16 output array (len(audio) samples)
+            work: float32 working buffer (len(audio) samples; may be audio)
+        """
+        np.multiply(audio, 32768.0, out=work)
+        np.clip(work, -32768, 32767, out=work)
+        np.rint(work, out=work)
+        np.copyto(out, work, casting='unsafe')
     
-    def _apply_noise_reduction(self, audio: np.ndarray) -> np.ndarray:
+    def _apply_noise_reduction(self, audio: np.ndarray,
+                               has_voice: Optional[bool] = None) -> np.ndarray:
         """
         Apply spectral subtraction noise reduction.
         
         Args:
             audio: Input audio frame
+            has_voice: Precomputed voice activity for this frame
+                (detected here if None)
             
         Returns:
             Noise-reduced audio
@@ -197,123 +404,261 @@ class AudioPreprocessor:
             return audio
         
         # Check voice activity
-        has_voice = self._detect_voice_activity(audio)
+        if has_voice is None:
+            has_voice = self._detect_voice_activity(audio)
+        
+        n = len(audio)
         
         if not has_voice and self.noise_reduction_level > 0:
-            # Update noise profile during silence
-            self._update_noise_profile(audio)
+            if self._skip_silent_frame():
+                return audio * self.silence_gain
+            # Forward FFT of the zero-padded frame; during silence the
+            # noise profile is updated from the same spectrum
+            spectrum = self._forward_fft(audio)
+            self._update_noise_profile(audio, spectrum)
+        else:
+            self._silent_frames = 0
+            spectrum = self._forward_fft(audio)
         
-        # Spectral subtraction
-        # Pad audio for FFT
-        padded = np.pad(audio, (0, self.fft_size - len(audio)), mode='constant')
+        self._apply_spectral_gain(spectrum)
         
-        # Forward FFT
-        spectrum = rfft(padded)
-        magnitude = np.abs(spectrum)
-        phase = np.angle(spectrum)
+        # Reconstruct signal
+        if self._irfft is not None:
+            # The planned transform writes into its own output array
+            return self._irfft(spectrum)[:n].copy()
         
-        # Subtract noise
-        over_subtraction = 1.0 + (self.noise_reduction_level * 0.5)
-        clean_magnitude = magnitude - (over_subtraction * self.noise_profile[:len(magnitude)])
+        clean_audio = irfft(spectrum, n=self.fft_size)
+        
+        return clean_audio[:n]
+    
+    def _apply_noise_reduction_frames(self, frames: np.ndarray, voice: List[bool]) -> None:
+        """
+        Apply spectral subtraction to consecutive frames in place.
         
-        # Apply spectral floor
-        spectral_floor = 0.002 * magnitude
-        clean_magnitude = np.maximum(clean_magnitude, spectral_floor)
+        The forward and inverse FFTs each run once over all frames; the
+        noise profile is still updated frame by frame, so each frame sees
+        the same profile as with _apply_noise_reduction().
         
-        # Reconstruct signal
-        clean_spectrum = clean_magnitude * np.exp(1j * phase)
-        clean_audio = irfft(clean_spectrum)
+        Args:
+            frames: Audio frames (one per row), overwritten with the result
+            voice: Voice activity of each frame
+        """
+        padded = np.zeros((len(frames), self.fft_size), dtype=np.float32)
+        padded[:, :frames.shape[1]] = frames
+        spectra = rfft(padded, axis=-1)
+        
+        reduced = np.zeros(len(frames), dtype=bool)
+        for i, spectrum in enumerate(spectra):
+            # Build noise profile from first few frames
+            if self.noise_frames_collected < self.noise_estimation_frames:
+                self._update_noise_profile(frames[i], spectrum)
+                self.noise_frames_collected += 1
+                continue  # Don't process during calibration
+            
+            if self.noise_profile is None:
+                continue
+            
+            if not voice[i] and self.noise_reduction_level > 0:
+                if self._skip_silent_frame():
+                    frames[i] *= self.silence_gain
+                    continue
+                # Update noise profile during silence
+                self._update_noise_profile(frames[i], spectrum)
+            else:
+                self._silent_frames = 0
+            
+            self._apply_spectral_gain(spectrum)
+            reduced[i] = True
+        
+        if reduced.any():
+            cleaned = irfft(spectra[reduced], n=self.fft_size, axis=-1)
+            frames[reduced] = cleaned[:, :frames.shape[1]]
+    
+    def _skip_silent_frame(self) -> bool:
+        """
+        Count a silent frame and decide whether it can skip the FFT.
+        
+        Returns:
+            True for all but every silence_fft_interval-th frame of a
+            silent stretch (the first one always takes the FFT path)
+        """
+        skip = self._silent_frames % self.silence_fft_interval != 0
+        self._silent_frames += 1
+        return skip
+    
+    def _apply_spectral_gain(self, spectrum: np.ndarray) -> None:
+        """
+        Scale a spectrum in place by the noise subtraction gain mask.
+        
+        Args:
+            spectrum: Complex spectrum of one zero-padded frame
+        """
+        # Subtract noise as a real gain per bin, 1 - noise / magnitude,
+        # floored at 0.002 (the spectral floor). Scaling the complex
+        # spectrum keeps its phase, so no angle()/exp() round trip is
+        # needed. Every step writes into the same buffer.
+        gain = self._nr_gain[:len(spectrum)]
+        np.abs(spectrum, out=gain)
+        np.maximum(gain, 1e-12, out=gain)
+        np.divide(self._scaled_noise[:len(gain)], gain, out=gain)
+        np.subtract(1.0, gain, out=gain)
+        np.maximum(gain, 0.002, out=gain)
+        spectrum *= gain
+    
+    def _forward_fft(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Real FFT of a frame zero-padded to fft_size.
         
-        return clean_audio[:len(audio)]
+        Args:
+            audio: Audio frame (at most fft_size samples)
+            
+        Returns:
+            Complex spectrum (fft_size // 2 + 1 bins); with pyfftw this is
+            the plan's output array, overwritten by the next call
+        """
+        n = len(audio)
+        self._fft_in[:n] = audio
+        if n < self._fft_in_len:
+            self._fft_in[n:self._fft_in_len] = 0.0
+        self._fft_in_len = n
+        
+        if self._rfft is not None:
+            return self._rfft()
+        return rfft(self._fft_in)
     
-    def _update_noise_profile(self, audio: np.ndarray) -> None:
-        """Update noise spectral profile."""
-        padded = np.pad(audio, (0, self.fft_size - len(audio)), mode='constant')
-        spectrum = rfft(padded)
+    def _update_noise_profile(self, audio: np.ndarray,
+                              spectrum: Optional[np.ndarray] = None) -> None:
+        """
+        Update noise spectral profile.
+        
+        Args:
+            audio: Noise-only audio frame
+            spectrum: The frame's spectrum, if already computed
+        """
+        if spectrum is None:
+            spectrum = self._forward_fft(audio)
         magnitude = np.abs(spectrum)
         
         if self.noise_profile is None:
-            self.noise_profile = magnitude
+            self.noise_profile = magnitude.astype(np.float32)
         else:
-            # Exponential moving average
-            alpha = 0.1
+            # Exponential moving average (float32, like the FFT output)
+            alpha = np.float32(0.1)
             self.noise_profile = (alpha * magnitude) + ((1 - alpha) * self.noise_profile)
+        
+        self._rescale_noise_profile()
     
-    def _detect_voice_activity(self, audio: np.ndarray) -> bool:
+    def _detect_voice_activity(self, audio: np.ndarray,
+                               audio_int16: Optional[np.ndarray] = None) -> bool:
         """
         Detect if frame contains voice.
         
         Args:
             audio: Audio frame
+            audio_int16: The same frame as int16 samples, if already
+                available (converted here otherwise)
             
         Returns:
             True if voice detected
         """
-        if self.vad is None:
-            # Fallback: simple energy-based VAD
-            rms = np.sqrt(np.mean(audio ** 2))
-            return rms > 0.01
+        # WebRTC VAD takes exactly 10, 20 or 30 ms; the first 10 ms are used
+        target_size = self.sample_rate // 100
         
-        try:
-            # Convert to bytes for WebRTC VAD
-            audio_int16 = (audio * 32768).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
+        if self.vad is not None and len(audio) >= target_size:
+            try:
+                if audio_int16 is None:
+                    # Convert only the samples the VAD looks at
+                    audio_int16 = (audio[:target_size] * 32768).astype(np.int16)
+                return self.vad.is_speech(audio_int16[:target_size].tobytes(), self.sample_rate)
+            except Exception:
+                # Fall back to the energy VAD on error
+                pass
+        
+        # Fallback: simple energy-based VAD, rms > 0.01 compared squared
+        sumsq = float(np.dot(audio, audio))
+        return sumsq > 1e-4 * len(audio)
+    
+    def _apply_aec_i16(self, mic_int16: np.ndarray,
+                       speaker_int16: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Apply SpeexDSP echo cancellation to 16-bit microphone samples.
+        
+        Args:
+            mic_int16: Microphone frame as int16 samples
+            speaker_int16: Matching speaker reference (the most recently
+                played samples if None)
             
-            # WebRTC VAD requires specific frame sizes
-            # Pad or trim to match
-            target_size = int(self.sample_rate * 0.01)  # 10ms
-            if len(audio_int16) > target_size:
-                audio_bytes = audio_int16[:target_size].tobytes()
+        Returns:
+            Echo-cancelled int16 samples, or None if there is not enough
+            speaker reference yet or SpeexDSP failed
+        """
+        # Get speaker reference signal from buffer
+        if speaker_int16 is None:
+            speaker_int16 = self._latest_speaker_samples(len(mic_int16))
+            if speaker_int16 is None:
+                return None
+        
+        try:
+            # Both signals are already int16, as SpeexDSP wants them
+            output_int16 = self.speex_echo.process(
+                mic_int16.tobytes(),
+                speaker_int16.tobytes()
+            )
+            return np.frombuffer(output_int16, dtype=np.int16)
             
-            return self.vad.is_speech(audio_bytes, self.sample_rate)
-        except Exception:
-            # Fallback on error
-            rms = np.sqrt(np.mean(audio ** 2))
-            return rms > 0.01
+        except Exception as e:
+            logging.error(f"SpeexDSP AEC error: {e}")
+            return None
     
-    def _apply_aec(self, audio: np.ndarray) -> np.ndarray:
+    def _apply_nlms_fallback(self, audio: np.ndarray,
+                             speaker_int16: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        Apply adaptive echo cancellation using SpeexDSP or NLMS fallback.
+        Apply NLMS echo cancellation against the buffered speaker signal.
         
         Args:
             audio: Input audio with echo (microphone signal)
+            speaker_int16: Matching speaker reference (the most recently
+                played samples if None)
             
         Returns:
-            Echo-cancelled audio
+            Echo-cancelled audio (input unchanged until enough speaker
+            reference is buffered)
         """
-        # Get speaker reference signal from buffer
-        with self.speaker_buffer_lock:
-            if len(self.speaker_buffer) < len(audio):
+        if speaker_int16 is None:
+            speaker_int16 = self._latest_speaker_samples(len(audio))
+            if speaker_int16 is None:
                 # Not enough reference data yet, return input unchanged
                 return audio
-            
-            # Get aligned reference signal
-            speaker_ref = np.array(list(self.speaker_buffer)[:len(audio)])
-        
-        # Use SpeexDSP if available
-        if self.speex_echo is not None:
-            try:
-                # Convert to int16 for SpeexDSP
-                mic_int16 = (audio * 32768).astype(np.int16)
-                speaker_int16 = (speaker_ref * 32768).astype(np.int16)
-                
-                # Process echo cancellation
-                output_int16 = self.speex_echo.process(
-                    mic_int16.tobytes(),
-                    speaker_int16.tobytes()
-                )
-                
-                # Convert back to float
-                output = np.frombuffer(output_int16, dtype=np.int16).astype(np.float32) / 32768.0
-                return output
-                
-            except Exception as e:
-                logging.error(f"SpeexDSP AEC error: {e}")
-                # Fall through to NLMS fallback
         
-        # Fallback: NLMS adaptive filter
+        speaker_ref = np.multiply(speaker_int16, INV_32768, dtype=np.float32)
         return self._apply_nlms_aec(audio, speaker_ref)
     
+    def _latest_speaker_samples(self, n: int) -> Optional[np.ndarray]:
+        """
+        Copy the most recent speaker reference samples out of the ring.
+        
+        Args:
+            n: Number of samples
+            
+        Returns:
+            int16 samples, oldest first (a view of a scratch buffer that is
+            reused on the next call), or None if fewer than n are buffered
+        """
+        cap = self._spk_ring.size
+        out = self._spk_scratch[:n]
+        while True:
+            end = self._spk_written
+            if min(end, cap) < n:
+                return None
+            start = (end - n) % cap
+            first = min(n, cap - start)
+            out[:first] = self._spk_ring[start:start + first]
+            out[first:] = self._spk_ring[:n - first]
+            # The copy is torn only if the producer lapped the window
+            # meanwhile (over cap - n samples); then read the newest again
+            if self._spk_written - end <= cap - n:
+                return out
+    
     def _apply_nlms_aec(self, mic_signal: np.ndarray, speaker_signal: np.ndarray) -> np.ndarray:
         """
         Apply NLMS (Normalized Least Mean Squares) echo cancellation.
@@ -325,68 +670,107 @@ class AudioPreprocessor:
         Returns:
             Echo-cancelled signal
         """
+        if not NUMBA_AVAILABLE:
+            # Without the compiled kernel the per-sample loop runs in
+            # Python; adapt block-wise in the frequency domain instead
+            return self._apply_fdaf_aec(mic_signal, speaker_signal)
+        
         output = np.zeros_like(mic_signal)
         filter_len = len(self.nlms_weights)
         
         # Pad speaker signal for filter
         padded_speaker = np.pad(speaker_signal, (filter_len - 1, 0), mode='constant')
         
-        for i in range(len(mic_signal)):
-            # Get reference window
-            x = padded_speaker[i:i + filter_len][::-1]
-            
-            # Estimate echo
-            echo_estimate = np.dot(self.nlms_weights, x)
-            
-            # Calculate error (desired = mic - echo)
-            error = mic_signal[i] - echo_estimate
-            output[i] = error
-            
-            # Update weights (NLMS)
-            norm = np.dot(x, x) + 1e-6  # Regularization
-            self.nlms_weights += (self.nlms_mu / norm) * error * x
+        # Estimate echo, output error (desired = mic - echo) and update
+        # weights per sample (1e-6 regularizes the reference power)
+        nlms_filter(mic_signal, padded_speaker, self.nlms_weights,
+                    self.nlms_mu, 1e-6, output)
         
         return output
     
-    def _apply_agc(self, audio: np.ndarray) -> np.ndarray:
+    def _apply_fdaf_aec(self, mic_signal: np.ndarray, speaker_signal: np.ndarray) -> np.ndarray:
         """
-        Apply automatic gain control.
+        Apply frequency-domain NLMS echo cancellation (overlap-save FDAF).
+        
+        The echo estimate for the whole frame is one FFT convolution and
+        the weights are updated once per frame with per-bin power
+        normalization, instead of len(nlms_weights) MACs per sample.
         
         Args:
-            audio: Input audio
+            mic_signal: Microphone input with echo
+            speaker_signal: Speaker reference signal
             
         Returns:
-            Gain-controlled audio
+            Echo-cancelled signal
         """
-        # Calculate RMS level
-        rms = np.sqrt(np.mean(audio ** 2))
-        
-        if rms < 1e-6:
-            return audio  # Avoid division by zero
-        
-        # Calculate required gain
-        target_gain = self.agc_target_level / rms
-        
-        # Apply attack/release
-        if target_gain > self.agc_gain:
-            # Attack (increasing gain)
-            self.agc_gain += self.agc_attack * (target_gain - self.agc_gain)
+        n = len(mic_signal)
+        taps = len(self.nlms_weights)
+        
+        if self._fdaf_x is None or self._fdaf_x.size < n + taps - 1:
+            # Power of two holding the frame plus the filter's history
+            fft_size = 1 << (n + taps - 2).bit_length()
+            self._fdaf_W = np.zeros(fft_size // 2 + 1, dtype=np.complex128)
+            self._fdaf_x = np.zeros(fft_size)
+            self._fdaf_e = np.zeros(fft_size)
+            self._fdaf_power = None
+        
+        x = self._fdaf_x
+        fft_size = x.size
+        
+        # Slide the new reference block into the input window
+        x[:-n] = x[n:]
+        x[-n:] = speaker_signal
+        X = rfft(x)
+        
+        # Echo estimate: the last n samples of the circular convolution
+        # are free of wrap-around
+        echo = irfft(self._fdaf_W * X, n=fft_size)[-n:]
+        error = mic_signal - echo
+        
+        # Smoothed per-bin reference power for the normalization
+        power = X.real ** 2 + X.imag ** 2
+        if self._fdaf_power is None:
+            self._fdaf_power = power
         else:
-            # Release (decreasing gain)
-            self.agc_gain += self.agc_release * (target_gain - self.agc_gain)
+            self._fdaf_power = 0.9 * self._fdaf_power + 0.1 * power
+        
+        # Gradient from the error block (aligned with the end of the input
+        # window), constrained to the filter length
+        e = self._fdaf_e
+        e[-n:] = error
+        E = rfft(e)
+        gradient = irfft(np.conj(X) * E / (self._fdaf_power + 1e-6), n=fft_size)
+        gradient[taps:] = 0.0
+        self._fdaf_W += self.nlms_mu * rfft(gradient)
+        
+        return error.astype(mic_signal.dtype, copy=False)
+    
+    def _update_agc_gain(self, audio: np.ndarray) -> bool:
+        """
+        Move the AGC gain towards the target for this frame.
         
-        # Limit gain to reasonable range
-        self.agc_gain = np.clip(self.agc_gain, 0.5, 10.0)
+        Args:
+            audio: Input audio
+            
+        Returns:
+            False if the frame is too quiet to measure (gain not applied)
+        """
+        # Calculate RMS level (sum of squares in one BLAS dot)
+        sumsq = float(np.dot(audio, audio))
         
-        # Apply gain with soft clipping
-        gained = audio * self.agc_gain
+        if sumsq < 1e-12 * audio.size:
+            return False  # rms < 1e-6; avoid division by zero
         
-        # Soft clipping to prevent distortion
-        gained = np.tanh(gained * 2.0) / 2.0
+        # Calculate required gain
+        target_gain = self.agc_target_level / math.sqrt(sumsq / audio.size)
         
-        self.total_gain_applied += self.agc_gain
+        # Apply attack (increasing gain) or release (decreasing gain)
+        step = target_gain - self.agc_gain
+        coef = self.agc_release + (self.agc_attack - self.agc_release) * (step > 0)
         
-        return gained
+        # Limit gain to reasonable range (plain floats, no np.clip)
+        self.agc_gain = min(10.0, max(0.5, self.agc_gain + coef * step))
+        return True
     
     def update_speaker_signal(self, speaker_data: bytes) -> None:
         """
@@ -394,18 +778,27 @@ class AudioPreprocessor:
         Must be called with playback data before it's sent to speakers.
         
         Args:
-            speaker_data: Speaker output data (16-bit PCM bytes)
+            speaker_data: Speaker output data (16-bit PCM bytes or
+                any bytes-like object, e.g. a memoryview)
         """
         if not self.enable_aec:
             return
         
-        # Convert to float
-        speaker_int16 = np.frombuffer(speaker_data, dtype=np.int16)
-        speaker_float = speaker_int16.astype(np.float32) / 32768.0
-        
-        # Add to buffer with thread safety
-        with self.speaker_buffer_lock:
-            self.speaker_buffer.extend(speaker_float)
+        # Stored as int16; converted only if the float NLMS fallback needs it
+        samples = np.frombuffer(speaker_data, dtype=np.int16)
+        cap = self._spk_ring.size
+        if samples.size > cap:
+            samples = samples[-cap:]
+        n = samples.size
+        
+        # Copy into the ring (in at most two slices), then publish the new
+        # count; a single int assignment is atomic under the GIL
+        written = self._spk_written
+        start = written % cap
+        first = min(n, cap - start)
+        self._spk_ring[start:start + first] = samples[:first]
+        self._spk_ring[:n - first] = samples[first:]
+        self._spk_written = written + n
     
     def get_quality_metrics(self) -> dict:
         """
@@ -430,7 +823,9 @@ class AudioPreprocessor:
     def reset_noise_profile(self) -> None:
         """Reset noise profile (e.g., when environment changes)."""
         self.noise_profile = None
+        self._scaled_noise = None
         self.noise_frames_collected = 0
+        self._silent_frames = 0
         logging.info("Noise profile reset")
 
 
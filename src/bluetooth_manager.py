@@ -18,11 +18,10 @@ import dbus
 import dbus.service
 import dbus.mainloop.glib
 from gi.repository import GLib
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Tuple
 from enum import Enum
-import os
+import socket
 import threading
-import time
 
 
 class ConnectionState(Enum):
@@ -48,6 +47,56 @@ HFP_PROFILE_PATH = "/org/bluez/handsfree/hfp"
 HSP_PROFILE_PATH = "/org/bluez/handsfree/hsp"
 A2DP_PROFILE_PATH = "/org/bluez/handsfree/a2dp"
 
+# ProfileManager1.RegisterProfile options, built once
+HFP_PROFILE_OPTIONS = {
+    "Name": dbus.String("Hands-Free"),
+    "Role": dbus.String("client"),  # We act as HFP HF (client to phone's AG)
+    "Channel": dbus.UInt16(1),
+    "Features": dbus.UInt16(0x3F),  # Support all features
+    "Version": dbus.UInt16(0x0108),  # HFP 1.8
+}
+HSP_PROFILE_OPTIONS = {
+    "Name": dbus.String("Headset"),
+    "Role": dbus.String("client"),
+    "Channel": dbus.UInt16(2),
+}
+A2DP_PROFILE_OPTIONS = {
+    "Name": dbus.String("Audio Sink"),
+    "Role": dbus.String("client"),
+}
+
+# Device1 properties that appear in get_paired_devices() results
+SNAPSHOT_PROPERTIES = frozenset({'Paired', 'Address', 'Name', 'Connected'})
+
+# Device1 properties that change continuously during discovery and that
+# nothing here reads; signals carrying only these are dropped on arrival
+DISCOVERY_CHURN_PROPERTIES = frozenset({'RSSI', 'TxPower', 'ManufacturerData', 'ServiceData'})
+
+# D-Bus error names meaning our profile (or its UUID) is already registered
+ALREADY_REGISTERED_ERRORS = frozenset({
+    'org.bluez.Error.AlreadyExists',
+    'org.freedesktop.DBus.Error.ObjectPathInUse',
+})
+
+# Device object paths end in dev_XX_XX_XX_XX_XX_XX
+_UNDERSCORE_TO_COLON = str.maketrans('_', ':')
+
+
+def device_address_from_path(path: str) -> str:
+    """
+    Extract a device's Bluetooth address from its BlueZ object path.
+    
+    Args:
+        path: D-Bus path, e.g. /org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF
+        
+    Returns:
+        Address, e.g. AA:BB:CC:DD:EE:FF
+    """
+    name = path.rpartition('/')[2]
+    if name.startswith('dev_'):
+        name = name[4:]
+    return name.translate(_UNDERSCORE_TO_COLON)
+
 
 class BluetoothAgent(dbus.service.Object):
     """
@@ -77,43 +126,43 @@ class BluetoothAgent(dbus.service.Object):
     @dbus.service.method(AGENT_INTERFACE, in_signature="os", out_signature="")
     def AuthorizeService(self, device: str, uuid: str):
         """Authorize a service on a device."""
-        logging.info(f"AuthorizeService: device={device}, uuid={uuid}")
+        logging.info("AuthorizeService: device=%s, uuid=%s", device, uuid)
         # Auto-authorize HFP, HSP, A2DP services
         return
     
     @dbus.service.method(AGENT_INTERFACE, in_signature="o", out_signature="s")
     def RequestPinCode(self, device: str) -> str:
         """Return PIN code for pairing."""
-        logging.info(f"RequestPinCode for {device}, returning {self.pin_code}")
+        logging.info("RequestPinCode for %s, returning %s", device, self.pin_code)
         return self.pin_code
     
     @dbus.service.method(AGENT_INTERFACE, in_signature="o", out_signature="u")
     def RequestPasskey(self, device: str) -> int:
         """Return passkey for pairing."""
-        logging.info(f"RequestPasskey for {device}")
+        logging.info("RequestPasskey for %s", device)
         return int(self.pin_code)
     
     @dbus.service.method(AGENT_INTERFACE, in_signature="ouq", out_signature="")
     def DisplayPasskey(self, device: str, passkey: int, entered: int):
         """Display passkey during pairing."""
-        logging.info(f"DisplayPasskey: device={device}, passkey={passkey:06d}")
+        logging.info("DisplayPasskey: device=%s, passkey=%06d", device, passkey)
     
     @dbus.service.method(AGENT_INTERFACE, in_signature="os", out_signature="")
     def DisplayPinCode(self, device: str, pincode: str):
         """Display PIN code during pairing."""
-        logging.info(f"DisplayPinCode: device={device}, pincode={pincode}")
+        logging.info("DisplayPinCode: device=%s, pincode=%s", device, pincode)
     
     @dbus.service.method(AGENT_INTERFACE, in_signature="ou", out_signature="")
     def RequestConfirmation(self, device: str, passkey: int):
         """Confirm passkey match."""
-        logging.info(f"RequestConfirmation: device={device}, passkey={passkey:06d}")
+        logging.info("RequestConfirmation: device=%s, passkey=%06d", device, passkey)
         # Auto-confirm
         return
     
     @dbus.service.method(AGENT_INTERFACE, in_signature="o", out_signature="")
     def RequestAuthorization(self, device: str):
         """Authorize device connection."""
-        logging.info(f"RequestAuthorization for {device}")
+        logging.info("RequestAuthorization for %s", device)
         # Auto-authorize
         return
     
@@ -145,7 +194,7 @@ class HFPProfile(dbus.service.Object):
         self.bus = bus
         self.on_connect = on_connect
         self.on_disconnect = on_disconnect
-        self.fd = None
+        self.sock: Optional[socket.socket] = None
         self.device_path = None
         logging.info(f"HFPProfile created at {path}")
     
@@ -153,6 +202,21 @@ class HFPProfile(dbus.service.Object):
     def Release(self):
         """Called when profile is unregistered."""
         logging.info("HFP Profile released")
+        self._close_socket()
+    
+    @property
+    def fd(self) -> Optional[int]:
+        """File descriptor of the current RFCOMM socket, or None."""
+        return self.sock.fileno() if self.sock is not None else None
+    
+    def _close_socket(self) -> None:
+        """Close the RFCOMM socket we own, if any."""
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
     
     @dbus.service.method("org.bluez.Profile1", in_signature="oha{sv}", out_signature="")
     def NewConnection(self, device: str, fd: int, properties: dict):
@@ -164,14 +228,18 @@ class HFPProfile(dbus.service.Object):
             fd: File descriptor for RFCOMM channel
             properties: Connection properties
         """
-        self.fd = os.dup(fd)  # Duplicate fd to keep it open
+        # BlueZ hands the RFCOMM socket over to us: take ownership of it
+        # from the UnixFd wrapper (which would otherwise close it when
+        # collected) instead of duplicating it, and wrap it in a socket
+        # object so reads, writes and close go through the socket module
+        self._close_socket()
+        self.sock = socket.socket(fileno=fd.take() if hasattr(fd, 'take') else int(fd))
         self.device_path = device
         
-        # Extract device address from path
-        device_address = device.split('/')[-1].replace('_', ':')
+        device_address = device_address_from_path(device)
         
-        logging.info(f"HFP NewConnection: device={device_address}, fd={self.fd}")
-        logging.debug(f"Connection properties: {properties}")
+        logging.info("HFP NewConnection: device=%s, fd=%s", device_address, self.fd)
+        logging.debug("Connection properties: %s", properties)
         
         if self.on_connect:
             self.on_connect(device_address, self.fd)
@@ -179,16 +247,11 @@ class HFPProfile(dbus.service.Object):
     @dbus.service.method("org.bluez.Profile1", in_signature="o", out_signature="")
     def RequestDisconnection(self, device: str):
         """Called when disconnection is requested."""
-        logging.info(f"HFP RequestDisconnection: {device}")
+        logging.info("HFP RequestDisconnection: %s", device)
         
-        if self.fd:
-            try:
-                os.close(self.fd)
-            except OSError:
-                pass
-            self.fd = None
+        self._close_socket()
         
-        device_address = device.split('/')[-1].replace('_', ':')
+        device_address = device_address_from_path(device)
         
         if self.on_disconnect:
             self.on_disconnect(device_address)
@@ -207,6 +270,22 @@ class BluetoothManager:
     A2DP_SINK_UUID = "0000110b-0000-1000-8000-00805f9b34fb"  # A2DP Sink
     A2DP_SOURCE_UUID = "0000110a-0000-1000-8000-00805f9b34fb"  # A2DP Source
     
+    # Fixed attribute set: no per-instance __dict__ for an object that every
+    # D-Bus signal handler goes through
+    __slots__ = (
+        'device_name', 'device_class', '_device_class_int', 'pin_code', 'enable_a2dp',
+        'state', 'connected_device', 'connected_device_address',
+        'auto_reconnect', 'reconnect_attempts', 'reconnect_delay', 'reconnect_max_delay',
+        '_reconnect_source_id', '_reconnect_attempt', '_reconnect_delays',
+        '_last_connected_device',
+        'on_connected', 'on_disconnected', 'on_device_found', 'on_hfp_connected',
+        'bus', 'adapter', 'adapter_props', 'adapter_path',
+        '_objects_cache', '_objects_lock', '_paired_snapshot', '_prop_handlers',
+        '_device_proxies', '_pending_refresh', '_connected_set',
+        '_profile_manager', '_agent_manager',
+        'agent', 'hfp_profile', 'profiles_registered',
+    )
+    
     def __init__(self, device_name: str = "RPi Hands-Free", 
                  device_class: str = "0x200404",
                  pin_code: str = "0000",
@@ -219,9 +298,19 @@ class BluetoothManager:
             device_class: Bluetooth device class (0x200404 = Hands-Free audio)
             pin_code: PIN code for pairing
             enable_a2dp: Enable A2DP profile (mutually exclusive with HFP during call)
+        
+        Raises:
+            ValueError: If device_class is not a valid hexadecimal class
         """
         self.device_name = device_name
         self.device_class = device_class
+        # Parsed once here so a bad class fails at construction rather than
+        # when the adapter is configured
+        try:
+            self._device_class_int = (int(device_class, 16) if isinstance(device_class, str)
+                                      else int(device_class))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid Bluetooth device class: {device_class!r}") from None
         self.pin_code = pin_code
         self.enable_a2dp = enable_a2dp
         self.state = ConnectionState.DISCONNECTED
@@ -233,8 +322,10 @@ class BluetoothManager:
         self.reconnect_attempts = 5
         self.reconnect_delay = 2.0
         self.reconnect_max_delay = 30.0
-        self._reconnect_thread: Optional[threading.Thread] = None
-        self._stop_reconnect = threading.Event()
+        # Reconnect attempts are GLib timeouts on the D-Bus main loop
+        self._reconnect_source_id: Optional[int] = None
+        self._reconnect_attempt = 0
+        self._reconnect_delays: Tuple[float, ...] = ()
         self._last_connected_device: Optional[str] = None  # D-Bus path
         
         # Callbacks
@@ -249,7 +340,32 @@ class BluetoothManager:
         self.adapter_props: Optional[dbus.Interface] = None
         self.adapter_path: Optional[str] = None
         
+        # Local copy of BlueZ's object tree (path -> interface -> properties),
+        # fetched once with GetManagedObjects and then kept current from the
+        # InterfacesAdded/InterfacesRemoved/PropertiesChanged signals (only
+        # device properties are tracked after the initial fetch). The GLib
+        # main loop writes it while other threads read it.
+        self._objects_cache: Dict[str, Dict[str, dict]] = {}
+        self._objects_lock = threading.Lock()
+        # get_paired_devices() result, rebuilt only after the cache
+        # changes in a way that affects it (None = stale)
+        self._paired_snapshot: Optional[tuple] = None
+        # Device1 property name -> handler(path, value)
+        self._prop_handlers: Dict[str, Callable] = {
+            'Connected': self._handle_connected,
+        }
+        
+        # Device1 and Properties proxies per device path, created on first
+        # use and dropped when the device goes away
+        self._device_proxies: Dict[str, Tuple[dbus.Interface, dbus.Interface]] = {}
+        # Devices with a property refresh queued on the main loop
+        self._pending_refresh: set = set()
+        # Devices currently connected, so callbacks only fire on changes
+        self._connected_set: set = set()
+        
         # Agent and profiles
+        self._profile_manager: Optional[dbus.Interface] = None
+        self._agent_manager: Optional[dbus.Interface] = None
         self.agent: Optional[BluetoothAgent] = None
         self.hfp_profile: Optional[HFPProfile] = None
         self.profiles_registered = False
@@ -270,6 +386,17 @@ class BluetoothManager:
             # Get system bus
             self.bus = dbus.SystemBus()
             
+            # Setup signal handlers for device events. Subscribing before
+            # the object tree is fetched means no change is missed between
+            # the two.
+            self._setup_signal_handlers()
+            
+            # BlueZ's manager interfaces, looked up once and reused by
+            # registration and cleanup
+            bluez = self.bus.get_object(BLUEZ_SERVICE, '/org/bluez')
+            self._profile_manager = dbus.Interface(bluez, PROFILE_MANAGER_INTERFACE)
+            self._agent_manager = dbus.Interface(bluez, AGENT_MANAGER_INTERFACE)
+            
             # Get adapter object
             self.adapter_path = self._find_adapter()
             if not self.adapter_path:
@@ -284,7 +411,7 @@ class BluetoothManager:
             self._configure_adapter()
             
             # Power on adapter
-            self.adapter_props.Set(ADAPTER_INTERFACE, 'Powered', dbus.Boolean(True))
+            self._power_on_adapter()
             
             # Register agent for pairing
             if not self.register_agent(self.pin_code):
@@ -295,9 +422,6 @@ class BluetoothManager:
             # In that case, the application can still work with the existing profile handlers
             self._register_profiles()
             
-            # Setup signal handlers for device events
-            self._setup_signal_handlers()
-            
             logging.info(f"Bluetooth adapter initialized: {self.adapter_path}")
             return True
             
@@ -308,17 +432,30 @@ class BluetoothManager:
     def _setup_signal_handlers(self) -> None:
         """Setup D-Bus signal handlers for device events."""
         try:
+            # Match rules are narrowed to BlueZ (and, for property
+            # changes, to devices) so the bus daemon drops everything
+            # else before it reaches this process
             self.bus.add_signal_receiver(
                 self._on_properties_changed,
                 dbus_interface=PROPERTIES_INTERFACE,
                 signal_name="PropertiesChanged",
+                bus_name=BLUEZ_SERVICE,
+                arg0=DEVICE_INTERFACE,
                 path_keyword="path"
             )
             
             self.bus.add_signal_receiver(
                 self._on_interfaces_added,
                 dbus_interface=OBJECT_MANAGER_INTERFACE,
-                signal_name="InterfacesAdded"
+                signal_name="InterfacesAdded",
+                bus_name=BLUEZ_SERVICE
+            )
+            
+            self.bus.add_signal_receiver(
+                self._on_interfaces_removed,
+                dbus_interface=OBJECT_MANAGER_INTERFACE,
+                signal_name="InterfacesRemoved",
+                bus_name=BLUEZ_SERVICE
             )
             
             logging.info("D-Bus signal handlers registered")
@@ -328,45 +465,128 @@ class BluetoothManager:
     def _on_properties_changed(self, interface: str, changed: dict, 
                                invalidated: list = None, path: str = None) -> None:
         """Handle property changes on Bluetooth devices."""
-        if interface != DEVICE_INTERFACE:
+        # The match rule only delivers Device1 changes from BlueZ
+        if not invalidated and DISCOVERY_CHURN_PROPERTIES.issuperset(changed):
             return
         
-        if 'Connected' in changed:
+        self._update_cached_properties(path, interface, changed, invalidated)
+        
+        for prop, value in changed.items():
+            handler = self._prop_handlers.get(prop)
+            if handler:
+                handler(path, value)
+    
+    def _handle_connected(self, path: str, value) -> None:
+        """Handle a device's Connected property changing."""
+        connected = bool(value)
+        if connected == (path in self._connected_set):
+            return  # Repeated signal, not a transition
+        if connected:
+            self._connected_set.add(path)
+        else:
+            self._connected_set.discard(path)
+        
+        address, name = self._device_label(path)
+        
+        if connected:
+            logging.info("Device connected: %s (%s)", name, address)
+            self.state = ConnectionState.CONNECTED
+            self.connected_device = path
+            self.connected_device_address = address
+            self._last_connected_device = path
+            self.stop_reconnect()  # Stop any reconnection attempts
+            
+            if self.on_connected:
+                self.on_connected(address)
+        else:
+            logging.info("Device disconnected: %s (%s)", name, address)
+            self.state = ConnectionState.DISCONNECTED
+            self.connected_device = None
+            self.connected_device_address = None
+            
+            if self.on_disconnected:
+                self.on_disconnected(address)
+            
+            # Start auto-reconnect if enabled
+            if self.auto_reconnect and self._last_connected_device:
+                self._start_reconnect()
+    
+    def _device_label(self, path: str) -> Tuple[str, str]:
+        """
+        Look up a device's address and name in the object cache.
+        
+        If BlueZ has not described the device yet, the address is derived
+        from the path, the name is "Unknown", and the device's properties
+        are fetched once the main loop is idle.
+        
+        Args:
+            path: D-Bus path of the device
+            
+        Returns:
+            Tuple of (address, name)
+        """
+        with self._objects_lock:
+            props = self._objects_cache.get(str(path), {}).get(DEVICE_INTERFACE, {})
+            address = props.get('Address')
+            name = props.get('Name')
+        if address is None or name is None:
+            self._schedule_device_refresh(path)
+        address = str(address) if address is not None else device_address_from_path(path)
+        name = str(name) if name is not None else "Unknown"
+        return address, name
+    
+    def _get_device(self, path: str) -> Tuple[dbus.Interface, dbus.Interface]:
+        """
+        Get the (cached) proxies for a device.
+        
+        Args:
+            path: D-Bus path of the device
+            
+        Returns:
+            Tuple of (Device1 interface, Properties interface)
+        """
+        proxies = self._device_proxies.get(path)
+        if proxies is None:
             device_obj = self.bus.get_object(BLUEZ_SERVICE, path)
-            device_props = dbus.Interface(device_obj, PROPERTIES_INTERFACE)
+            proxies = (dbus.Interface(device_obj, DEVICE_INTERFACE),
+                       dbus.Interface(device_obj, PROPERTIES_INTERFACE))
+            self._device_proxies[path] = proxies
+        return proxies
+    
+    def _schedule_device_refresh(self, path: str) -> None:
+        """Queue one property refresh for a device, coalescing repeats."""
+        if path in self._pending_refresh:
+            return
+        self._pending_refresh.add(path)
+        GLib.idle_add(self._refresh_device, path)
+    
+    def _refresh_device(self, path: str) -> bool:
+        """
+        Fetch a device's properties into the object cache (GLib idle callback).
+        
+        Args:
+            path: D-Bus path of the device
             
-            try:
-                address = str(device_props.Get(DEVICE_INTERFACE, 'Address'))
-                name = str(device_props.Get(DEVICE_INTERFACE, 'Name'))
-            except:
-                address = path.split('/')[-1].replace('_', ':')
-                name = "Unknown"
-            
-            if changed['Connected']:
-                logging.info(f"Device connected: {name} ({address})")
-                self.state = ConnectionState.CONNECTED
-                self.connected_device = path
-                self.connected_device_address = address
-                self._last_connected_device = path
-                self._stop_reconnect.set()  # Stop any reconnection attempts
-                
-                if self.on_connected:
-                    self.on_connected(address)
-            else:
-                logging.info(f"Device disconnected: {name} ({address})")
-                self.state = ConnectionState.DISCONNECTED
-                self.connected_device = None
-                self.connected_device_address = None
-                
-                if self.on_disconnected:
-                    self.on_disconnected(address)
-                
-                # Start auto-reconnect if enabled
-                if self.auto_reconnect and self._last_connected_device:
-                    self._start_reconnect_thread()
+        Returns:
+            GLib.SOURCE_REMOVE (runs once)
+        """
+        self._pending_refresh.discard(path)
+        try:
+            _, device_props = self._get_device(path)
+            device_props.GetAll(
+                DEVICE_INTERFACE,
+                reply_handler=lambda props: self._cache_interfaces(
+                    path, {DEVICE_INTERFACE: props}),
+                error_handler=lambda e: logging.debug("Device refresh failed for %s: %s", path, e)
+            )
+        except dbus.exceptions.DBusException as e:
+            logging.debug("Device refresh failed for %s: %s", path, e)
+        return GLib.SOURCE_REMOVE
     
     def _on_interfaces_added(self, path: str, interfaces: dict) -> None:
         """Handle new interfaces added (device discovery)."""
+        self._cache_interfaces(path, interfaces)
+        
         if DEVICE_INTERFACE not in interfaces:
             return
         
@@ -374,17 +594,71 @@ class BluetoothManager:
         address = str(props.get('Address', ''))
         name = str(props.get('Name', 'Unknown'))
         
-        logging.info(f"Device found: {name} ({address})")
+        logging.info("Device found: %s (%s)", name, address)
         
         if self.on_device_found:
             self.on_device_found(address, name)
     
-    def _find_adapter(self) -> Optional[str]:
+    def _cache_interfaces(self, path: str, interfaces: dict) -> None:
         """
-        Find Bluetooth adapter path.
+        Store an object's interfaces and their properties in the cache.
+        
+        Args:
+            path: D-Bus path of the object
+            interfaces: Interface name -> properties
+        """
+        with self._objects_lock:
+            cached = self._objects_cache.setdefault(str(path), {})
+            for interface, props in interfaces.items():
+                cached[str(interface)] = dict(props)
+            self._paired_snapshot = None
+    
+    def _on_interfaces_removed(self, path: str, interfaces: list) -> None:
+        """Handle interfaces removed (e.g. device forgotten or adapter gone)."""
+        if DEVICE_INTERFACE in interfaces:
+            # Drop everything keyed by this path so per-device state stays
+            # bounded by the devices BlueZ still knows about
+            self._device_proxies.pop(path, None)
+            self._connected_set.discard(path)
+            self._pending_refresh.discard(path)
+        
+        with self._objects_lock:
+            cached = self._objects_cache.get(str(path))
+            if cached is None:
+                return
+            for interface in interfaces:
+                cached.pop(str(interface), None)
+            if not cached:
+                del self._objects_cache[str(path)]
+            self._paired_snapshot = None
+    
+    def _update_cached_properties(self, path: Optional[str], interface: str,
+                                  changed: dict, invalidated: Optional[list]) -> None:
+        """
+        Apply a PropertiesChanged signal to the object cache.
+        
+        Args:
+            path: D-Bus path of the object
+            interface: Interface whose properties changed
+            changed: Changed properties and their new values
+            invalidated: Names of properties whose values were invalidated
+        """
+        with self._objects_lock:
+            props = self._objects_cache.get(str(path), {}).get(str(interface))
+            if props is None:
+                return  # Not a BlueZ object we know about
+            props.update(changed)
+            for name in invalidated or ():
+                props.pop(name, None)
+            if not SNAPSHOT_PROPERTIES.isdisjoint(changed) or invalidated:
+                self._paired_snapshot = None
+    
+    def _load_managed_objects(self) -> bool:
+        """
+        Fetch BlueZ's object tree into the local cache.
         
         Returns:
-            Adapter D-Bus path or None if not found
+            True if successful
         """
         try:
             manager = dbus.Interface(
@@ -392,15 +666,67 @@ class BluetoothManager:
                 OBJECT_MANAGER_INTERFACE
             )
             objects = manager.GetManagedObjects()
-            
-            for path, interfaces in objects.items():
-                if ADAPTER_INTERFACE in interfaces:
-                    return path
-            
-            return None
         except dbus.exceptions.DBusException as e:
-            logging.error(f"Error finding adapter: {e}")
+            logging.error(f"Failed to get managed objects: {e}")
+            return False
+        
+        with self._objects_lock:
+            self._objects_cache = {
+                str(path): {str(interface): dict(props)
+                            for interface, props in interfaces.items()}
+                for path, interfaces in objects.items()
+            }
+            self._paired_snapshot = None
+            self._connected_set = {
+                path for path, interfaces in self._objects_cache.items()
+                if interfaces.get(DEVICE_INTERFACE, {}).get('Connected', False)
+            }
+        return True
+    
+    def _find_adapter(self) -> Optional[str]:
+        """
+        Find Bluetooth adapter path.
+        
+        Returns:
+            Adapter D-Bus path or None if not found
+        """
+        if not self._objects_cache and not self._load_managed_objects():
             return None
+        
+        with self._objects_lock:
+            for path, interfaces in self._objects_cache.items():
+                if ADAPTER_INTERFACE in interfaces:
+                    return path
+        
+        return None
+    
+    def _power_on_adapter(self) -> None:
+        """
+        Power on the adapter without waiting for the controller to come up.
+        
+        BlueZ only replies to Set('Powered') once the controller is running,
+        which takes hundreds of ms on some chips. Agent and profile
+        registration don't depend on it, so startup carries on and the reply
+        is handled on the main loop.
+        """
+        with self._objects_lock:
+            props = self._objects_cache.get(self.adapter_path, {}).get(ADAPTER_INTERFACE, {})
+            if props.get('Powered'):
+                return
+        
+        self.adapter_props.Set(
+            ADAPTER_INTERFACE, 'Powered', dbus.Boolean(True),
+            reply_handler=self._on_powered,
+            error_handler=self._on_power_error
+        )
+    
+    def _on_powered(self) -> None:
+        """Handle the Set('Powered') reply."""
+        logging.info("Bluetooth adapter powered on")
+    
+    def _on_power_error(self, error: dbus.exceptions.DBusException) -> None:
+        """Handle a failed Set('Powered') reply."""
+        logging.error(f"Failed to power on adapter: {error}")
     
     def _configure_adapter(self) -> None:
         """Configure adapter with device name and class."""
@@ -417,7 +743,7 @@ class BluetoothManager:
                 self.adapter_props.Set(
                     ADAPTER_INTERFACE,
                     'Class',
-                    dbus.UInt32(int(self.device_class, 16))
+                    dbus.UInt32(self._device_class_int)
                 )
             except dbus.exceptions.DBusException:
                 logging.warning("Setting device class not supported on this system")
@@ -427,19 +753,47 @@ class BluetoothManager:
         except dbus.exceptions.DBusException as e:
             logging.error(f"Failed to configure adapter: {e}")
     
-    def _unregister_profile_safe(self, profile_manager, path: str) -> None:
+    def _call_all(self, calls: list) -> list:
         """
-        Safely unregister a profile, ignoring errors if not registered.
+        Issue several D-Bus method calls at once and wait for every reply.
+        
+        The calls are all sent before any reply is awaited, then the GLib
+        main context is iterated until each has returned or failed, so N
+        round trips take about as long as the slowest one.
         
         Args:
-            profile_manager: D-Bus ProfileManager interface
-            path: Profile object path to unregister
+            calls: List of (D-Bus proxy method, args tuple)
+            
+        Returns:
+            Per call, in order: None on success or the DBusException
         """
-        try:
-            profile_manager.UnregisterProfile(dbus.ObjectPath(path))
-            logging.debug(f"Unregistered existing profile at {path}")
-        except dbus.exceptions.DBusException:
-            pass  # Profile wasn't registered, that's fine
+        results = [None] * len(calls)
+        pending = set(range(len(calls)))
+        
+        def finish(index, error=None):
+            results[index] = error
+            pending.discard(index)
+        
+        for index, (method, args) in enumerate(calls):
+            try:
+                method(*args,
+                       reply_handler=lambda *_, i=index: finish(i),
+                       error_handler=lambda e, i=index: finish(i, e))
+            except dbus.exceptions.DBusException as e:
+                finish(index, e)
+        
+        context = GLib.MainContext.default()
+        while pending:
+            context.iteration(True)
+        
+        return results
+    
+    def _profile_paths(self) -> List[str]:
+        """Return the object paths of the profiles this manager registers."""
+        profile_paths = [HFP_PROFILE_PATH, HSP_PROFILE_PATH]
+        if self.enable_a2dp:
+            profile_paths.append(A2DP_PROFILE_PATH)
+        return profile_paths
     
     def _register_profiles(self) -> bool:
         """
@@ -449,18 +803,16 @@ class BluetoothManager:
             True if successful
         """
         try:
-            # Get ProfileManager
-            profile_manager = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE, '/org/bluez'),
-                PROFILE_MANAGER_INTERFACE
-            )
+            profile_manager = self._profile_manager
+            profile_paths = self._profile_paths()
             
             # First, try to unregister any existing profiles at our paths
             # This handles the case where a previous run didn't clean up
-            self._unregister_profile_safe(profile_manager, HFP_PROFILE_PATH)
-            self._unregister_profile_safe(profile_manager, HSP_PROFILE_PATH)
-            if self.enable_a2dp:
-                self._unregister_profile_safe(profile_manager, A2DP_PROFILE_PATH)
+            # (errors just mean the profile wasn't registered)
+            self._call_all([
+                (profile_manager.UnregisterProfile, (dbus.ObjectPath(path),))
+                for path in profile_paths
+            ])
             
             # Create HFP profile handler
             self.hfp_profile = HFPProfile(
@@ -470,71 +822,44 @@ class BluetoothManager:
                 on_disconnect=self._on_hfp_disconnected
             )
             
-            # HFP profile options
-            hfp_options = {
-                "Name": dbus.String("Hands-Free"),
-                "Role": dbus.String("client"),  # We act as HFP HF (client to phone's AG)
-                "Channel": dbus.UInt16(1),
-                "Features": dbus.UInt16(0x3F),  # Support all features
-                "Version": dbus.UInt16(0x0108),  # HFP 1.8
-            }
+            # HFP, plus HSP for fallback
+            registrations = [
+                (HFP_PROFILE_PATH, self.HFP_UUID, HFP_PROFILE_OPTIONS),
+                (HSP_PROFILE_PATH, self.HSP_UUID, HSP_PROFILE_OPTIONS),
+            ]
             
-            hfp_registered = False
-            hsp_registered = False
+            # Register A2DP if enabled
+            if self.enable_a2dp:
+                registrations.append((A2DP_PROFILE_PATH, self.A2DP_SINK_UUID, A2DP_PROFILE_OPTIONS))
             
-            # Register HFP profile
-            try:
-                profile_manager.RegisterProfile(
-                    dbus.ObjectPath(HFP_PROFILE_PATH),
-                    self.HFP_UUID,
-                    hfp_options
-                )
-                logging.info("HFP profile registered")
-                hfp_registered = True
-            except dbus.exceptions.DBusException as e:
-                error_name = e.get_dbus_name() if hasattr(e, 'get_dbus_name') else str(e)
-                if "AlreadyExists" in str(e) or "UUID already registered" in str(e):
-                    logging.warning("HFP UUID already registered by another service (e.g., oFono/PulseAudio)")
-                    logging.info("Will use existing HFP profile - ensure oFono or pulseaudio-bluetooth is configured")
-                else:
-                    logging.error(f"HFP registration failed: {e}")
+            # Register all profiles in one round trip
+            hfp_error, hsp_error, *a2dp_errors = self._call_all([
+                (profile_manager.RegisterProfile, (dbus.ObjectPath(path), uuid, options))
+                for path, uuid, options in registrations
+            ])
             
-            # Also register HSP for fallback
-            hsp_options = {
-                "Name": dbus.String("Headset"),
-                "Role": dbus.String("client"),
-                "Channel": dbus.UInt16(2),
-            }
+            hfp_registered = hfp_error is None
+            if hfp_registered:
+                logging.info("HFP profile registered")
+            elif hfp_error.get_dbus_name() in ALREADY_REGISTERED_ERRORS:
+                logging.warning("HFP UUID already registered by another service (e.g., oFono/PulseAudio)")
+                logging.info("Will use existing HFP profile - ensure oFono or pulseaudio-bluetooth is configured")
+            else:
+                logging.error(f"HFP registration failed: {hfp_error}")
             
-            try:
-                profile_manager.RegisterProfile(
-                    dbus.ObjectPath(HSP_PROFILE_PATH),
-                    self.HSP_UUID,
-                    hsp_options
-                )
+            hsp_registered = hsp_error is None
+            if hsp_registered:
                 logging.info("HSP profile registered")
-                hsp_registered = True
-            except dbus.exceptions.DBusException as e:
-                if "AlreadyExists" in str(e) or "UUID already registered" in str(e):
-                    logging.warning("HSP UUID already registered by another service")
-                else:
-                    logging.warning(f"HSP registration failed (non-critical): {e}")
+            elif hsp_error.get_dbus_name() in ALREADY_REGISTERED_ERRORS:
+                logging.warning("HSP UUID already registered by another service")
+            else:
+                logging.warning(f"HSP registration failed (non-critical): {hsp_error}")
             
-            # Register A2DP if enabled
-            if self.enable_a2dp:
-                try:
-                    a2dp_options = {
-                        "Name": dbus.String("Audio Sink"),
-                        "Role": dbus.String("client"),
-                    }
-                    profile_manager.RegisterProfile(
-                        dbus.ObjectPath(A2DP_PROFILE_PATH),
-                        self.A2DP_SINK_UUID,
-                        a2dp_options
-                    )
+            for a2dp_error in a2dp_errors:
+                if a2dp_error is None:
                     logging.info("A2DP Sink profile registered")
-                except dbus.exceptions.DBusException as e:
-                    logging.warning(f"A2DP registration failed: {e}")
+                else:
+                    logging.warning(f"A2DP registration failed: {a2dp_error}")
             
             # Mark as registered if at least one profile was registered
             # or if they're handled by another service
@@ -554,7 +879,7 @@ class BluetoothManager:
     
     def _on_hfp_connected(self, device_address: str, fd: int) -> None:
         """Handle HFP connection with RFCOMM file descriptor."""
-        logging.info(f"HFP connected: {device_address}, fd={fd}")
+        logging.info("HFP connected: %s, fd=%s", device_address, fd)
         self.state = ConnectionState.CONNECTED
         self.connected_device_address = device_address
         
@@ -563,7 +888,7 @@ class BluetoothManager:
     
     def _on_hfp_disconnected(self, device_address: str) -> None:
         """Handle HFP disconnection."""
-        logging.info(f"HFP disconnected: {device_address}")
+        logging.info("HFP disconnected: %s", device_address)
         # on_disconnected callback will be triggered by property change
     
     def set_discoverable(self, discoverable: bool, timeout: int = 0) -> bool:
@@ -577,25 +902,16 @@ class BluetoothManager:
         Returns:
             True if successful
         """
-        try:
-            self.adapter_props.Set(
-                ADAPTER_INTERFACE,
-                'Discoverable',
-                dbus.Boolean(discoverable)
-            )
-            
-            self.adapter_props.Set(
-                ADAPTER_INTERFACE,
-                'DiscoverableTimeout',
-                dbus.UInt32(timeout)
-            )
-            
-            logging.info(f"Discoverable mode: {discoverable}")
-            return True
-            
-        except dbus.exceptions.DBusException as e:
-            logging.error(f"Failed to set discoverable mode: {e}")
+        error = self._set_adapter_properties([
+            ('DiscoverableTimeout', dbus.UInt32(timeout)),
+            ('Discoverable', dbus.Boolean(discoverable)),
+        ])
+        if error is not None:
+            logging.error(f"Failed to set discoverable mode: {error}")
             return False
+        
+        logging.info(f"Discoverable mode: {discoverable}")
+        return True
     
     def set_pairable(self, pairable: bool, timeout: int = 0) -> bool:
         """
@@ -608,25 +924,35 @@ class BluetoothManager:
         Returns:
             True if successful
         """
-        try:
-            self.adapter_props.Set(
-                ADAPTER_INTERFACE,
-                'Pairable',
-                dbus.Boolean(pairable)
-            )
-            
-            self.adapter_props.Set(
-                ADAPTER_INTERFACE,
-                'PairableTimeout',
-                dbus.UInt32(timeout)
-            )
-            
-            logging.info(f"Pairable mode: {pairable}")
-            return True
-            
-        except dbus.exceptions.DBusException as e:
-            logging.error(f"Failed to set pairable mode: {e}")
+        error = self._set_adapter_properties([
+            ('PairableTimeout', dbus.UInt32(timeout)),
+            ('Pairable', dbus.Boolean(pairable)),
+        ])
+        if error is not None:
+            logging.error(f"Failed to set pairable mode: {error}")
             return False
+        
+        logging.info(f"Pairable mode: {pairable}")
+        return True
+    
+    def _set_adapter_properties(self, values: list) -> Optional[dbus.exceptions.DBusException]:
+        """
+        Set several adapter properties in one batch of pipelined calls.
+        
+        The timeout properties are listed before the mode they apply to, so
+        BlueZ already has the new timeout when the mode changes.
+        
+        Args:
+            values: List of (property name, D-Bus value), in send order
+            
+        Returns:
+            None if every Set succeeded, otherwise the first error
+        """
+        errors = self._call_all([
+            (self.adapter_props.Set, (ADAPTER_INTERFACE, name, value))
+            for name, value in values
+        ])
+        return next((e for e in errors if e is not None), None)
     
     def start_discovery(self) -> bool:
         """
@@ -663,37 +989,34 @@ class BluetoothManager:
         Get list of paired devices.
         
         Returns:
-            List of paired device dictionaries
+            List of paired device dictionaries (a new list each call; the
+            dictionaries are shared snapshots and must not be modified)
         """
-        devices = []
-        try:
-            manager = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE, '/'),
-                OBJECT_MANAGER_INTERFACE
-            )
-            objects = manager.GetManagedObjects()
-            
-            for path, interfaces in objects.items():
-                if DEVICE_INTERFACE in interfaces:
-                    device_props = interfaces[DEVICE_INTERFACE]
-                    if device_props.get('Paired', False):
-                        devices.append({
-                            'path': path,
-                            'address': str(device_props.get('Address', '')),
-                            'name': str(device_props.get('Name', 'Unknown')),
-                            'connected': device_props.get('Connected', False)
-                        })
+        # Served from the signal-maintained cache, no D-Bus round trip
+        with self._objects_lock:
+            if self._paired_snapshot is None:
+                devices = []
+                for path, interfaces in self._objects_cache.items():
+                    if DEVICE_INTERFACE in interfaces:
+                        device_props = interfaces[DEVICE_INTERFACE]
+                        if device_props.get('Paired', False):
+                            devices.append({
+                                'path': path,
+                                'address': str(device_props.get('Address', '')),
+                                'name': str(device_props.get('Name', 'Unknown')),
+                                'connected': device_props.get('Connected', False)
+                            })
+                self._paired_snapshot = tuple(devices)
             
-            return devices
-            
-        except dbus.exceptions.DBusException as e:
-            logging.error(f"Failed to get paired devices: {e}")
-            return []
+            return list(self._paired_snapshot)
     
     def connect_device(self, device_path: str) -> bool:
         """
         Connect to a specific device.
         
+        The call does not wait for the connection: success arrives as a
+        Connected property change, failure is logged when BlueZ replies.
+        
         Args:
             device_path: D-Bus path of the device
             
@@ -701,11 +1024,11 @@ class BluetoothManager:
             True if connection initiated successfully
         """
         try:
-            device = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE, device_path),
-                DEVICE_INTERFACE
+            device, _ = self._get_device(device_path)
+            device.Connect(
+                reply_handler=lambda: None,
+                error_handler=self._on_connect_error
             )
-            device.Connect()
             
             self.state = ConnectionState.CONNECTING
             logging.info(f"Connecting to device: {device_path}")
@@ -715,6 +1038,12 @@ class BluetoothManager:
             logging.error(f"Failed to connect to device: {e}")
             return False
     
+    def _on_connect_error(self, error: dbus.exceptions.DBusException) -> None:
+        """Handle a failed Device1.Connect reply."""
+        logging.error(f"Failed to connect to device: {error}")
+        if self.state == ConnectionState.CONNECTING:
+            self.state = ConnectionState.DISCONNECTED
+    
     def disconnect_device(self, device_path: str) -> bool:
         """
         Disconnect from a specific device.
@@ -726,10 +1055,7 @@ class BluetoothManager:
             True if disconnection initiated successfully
         """
         try:
-            device = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE, device_path),
-                DEVICE_INTERFACE
-            )
+            device, _ = self._get_device(device_path)
             device.Disconnect()
             
             logging.info(f"Disconnecting from device: {device_path}")
@@ -753,17 +1079,11 @@ class BluetoothManager:
             # Create agent
             self.agent = BluetoothAgent(self.bus, AGENT_PATH, pin_code)
             
-            # Get AgentManager
-            agent_manager = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE, '/org/bluez'),
-                AGENT_MANAGER_INTERFACE
-            )
-            
             # Register agent
-            agent_manager.RegisterAgent(dbus.ObjectPath(AGENT_PATH), "NoInputNoOutput")
+            self._agent_manager.RegisterAgent(dbus.ObjectPath(AGENT_PATH), "NoInputNoOutput")
             
             # Request to be default agent
-            agent_manager.RequestDefaultAgent(dbus.ObjectPath(AGENT_PATH))
+            self._agent_manager.RequestDefaultAgent(dbus.ObjectPath(AGENT_PATH))
             
             logging.info(f"Bluetooth agent registered with PIN: {pin_code}")
             return True
@@ -790,64 +1110,70 @@ class BluetoothManager:
         self.reconnect_max_delay = max_delay
         logging.info(f"Reconnect config: enabled={auto_reconnect}, attempts={attempts}")
     
-    def _start_reconnect_thread(self) -> None:
-        """Start reconnection thread with exponential backoff."""
-        if self._reconnect_thread and self._reconnect_thread.is_alive():
-            logging.debug("Reconnect thread already running")
+    def _start_reconnect(self) -> None:
+        """Start reconnection attempts with exponential backoff."""
+        if self._reconnect_source_id is not None:
+            logging.debug("Reconnect already scheduled")
             return
         
-        self._stop_reconnect.clear()
-        self._reconnect_thread = threading.Thread(
-            target=self._reconnect_loop,
-            daemon=True
+        # The backoff schedule is fixed for the whole run: the delay before
+        # each attempt, plus the one before the final check that gives up
+        self._reconnect_delays = tuple(
+            min(self.reconnect_delay * 1.5 ** i, self.reconnect_max_delay)
+            for i in range(self.reconnect_attempts + 1)
         )
-        self._reconnect_thread.start()
+        self._reconnect_attempt = 0
+        self._schedule_reconnect()
         logging.info("Auto-reconnect started")
     
-    def _reconnect_loop(self) -> None:
-        """Reconnection loop with exponential backoff."""
-        current_delay = self.reconnect_delay
+    def _schedule_reconnect(self) -> None:
+        """Schedule the next reconnect attempt after its backoff delay."""
+        self._reconnect_source_id = GLib.timeout_add(
+            int(self._reconnect_delays[self._reconnect_attempt] * 1000),
+            self._reconnect_tick
+        )
+    
+    def _reconnect_tick(self) -> bool:
+        """
+        Make one reconnect attempt (GLib timeout callback).
         
-        for attempt in range(1, self.reconnect_attempts + 1):
-            if self._stop_reconnect.is_set():
-                logging.info("Reconnect cancelled")
-                return
-            
-            if self.state == ConnectionState.CONNECTED:
-                logging.info("Already connected, stopping reconnect")
-                return
-            
-            logging.info(f"Reconnect attempt {attempt}/{self.reconnect_attempts} "
-                        f"(delay: {current_delay:.1f}s)")
-            
-            # Wait before attempting
-            if self._stop_reconnect.wait(timeout=current_delay):
-                logging.info("Reconnect cancelled during wait")
-                return
-            
-            # Try to connect
-            if self._last_connected_device:
-                try:
-                    if self.connect_device(self._last_connected_device):
-                        # Wait a bit for connection to establish
-                        time.sleep(2.0)
-                        if self.state == ConnectionState.CONNECTED:
-                            logging.info("Reconnect successful")
-                            return
-                except Exception as e:
-                    logging.warning(f"Reconnect attempt failed: {e}")
-            
-            # Exponential backoff
-            current_delay = min(current_delay * 1.5, self.reconnect_max_delay)
+        Returns:
+            GLib.SOURCE_REMOVE; the next attempt is scheduled as a new
+            timeout, since the delay grows each time
+        """
+        self._reconnect_source_id = None
         
-        logging.warning(f"Reconnect failed after {self.reconnect_attempts} attempts")
+        if self.state == ConnectionState.CONNECTED:
+            logging.info("Already connected, stopping reconnect")
+            return GLib.SOURCE_REMOVE
+        
+        if self._reconnect_attempt >= self.reconnect_attempts:
+            logging.warning(f"Reconnect failed after {self.reconnect_attempts} attempts")
+            return GLib.SOURCE_REMOVE
+        
+        delay = self._reconnect_delays[self._reconnect_attempt]
+        self._reconnect_attempt += 1
+        logging.info(f"Reconnect attempt {self._reconnect_attempt}/{self.reconnect_attempts} "
+                     f"(delay: {delay:.1f}s)")
+        
+        # Try to connect; success arrives as a Connected property change,
+        # which cancels the next attempt
+        if self._last_connected_device:
+            try:
+                self.connect_device(self._last_connected_device)
+            except Exception as e:
+                logging.warning(f"Reconnect attempt failed: {e}")
+        
+        self._schedule_reconnect()
+        return GLib.SOURCE_REMOVE
     
     def stop_reconnect(self) -> None:
         """Stop any ongoing reconnection attempts."""
-        self._stop_reconnect.set()
-        if self._reconnect_thread:
-            self._reconnect_thread.join(timeout=2.0)
-            self._reconnect_thread = None
+        source_id = self._reconnect_source_id
+        if source_id is not None:
+            self._reconnect_source_id = None
+            GLib.source_remove(source_id)
+            logging.info("Reconnect cancelled")
     
     def cleanup(self) -> None:
         """Cleanup resources."""
@@ -855,30 +1181,19 @@ class BluetoothManager:
             # Stop reconnection thread
             self.stop_reconnect()
             
-            # Unregister profiles
-            if self.profiles_registered and self.bus:
-                try:
-                    profile_manager = dbus.Interface(
-                        self.bus.get_object(BLUEZ_SERVICE, '/org/bluez'),
-                        PROFILE_MANAGER_INTERFACE
-                    )
-                    profile_manager.UnregisterProfile(dbus.ObjectPath(HFP_PROFILE_PATH))
-                    profile_manager.UnregisterProfile(dbus.ObjectPath(HSP_PROFILE_PATH))
-                    if self.enable_a2dp:
-                        profile_manager.UnregisterProfile(dbus.ObjectPath(A2DP_PROFILE_PATH))
-                except:
-                    pass
-            
-            # Unregister agent
-            if self.agent and self.bus:
-                try:
-                    agent_manager = dbus.Interface(
-                        self.bus.get_object(BLUEZ_SERVICE, '/org/bluez'),
-                        AGENT_MANAGER_INTERFACE
-                    )
-                    agent_manager.UnregisterAgent(dbus.ObjectPath(AGENT_PATH))
-                except:
-                    pass
+            # Unregister profiles and agent in one batch of pipelined calls
+            calls = []
+            if self.profiles_registered and self._profile_manager:
+                calls += [
+                    (self._profile_manager.UnregisterProfile, (dbus.ObjectPath(path),))
+                    for path in self._profile_paths()
+                ]
+            if self.agent and self._agent_manager:
+                calls.append((self._agent_manager.UnregisterAgent, (dbus.ObjectPath(AGENT_PATH),)))
+            
+            for error in self._call_all(calls):
+                if error is not None:
+                    logging.debug("Unregister during cleanup failed: %s", error)
             
             if self.adapter:
                 self.set_discoverable(False)
@@ -895,7 +1210,7 @@ class BluetoothManager:
         Returns:
             File descriptor or None if not connected
         """
-        if self.hfp_profile and self.hfp_profile.fd:
+        if self.hfp_profile and self.hfp_profile.fd is not None:
             return self.hfp_profile.fd
         return None
 
@@ -12,8 +12,10 @@ It handles:
 """
 
 import logging
+import os
+import selectors
 import socket
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
 from enum import Enum
 import threading
 import re
@@ -60,6 +62,13 @@ class CallManager:
     CALLSETUP_OUTGOING = 2   # Outgoing call dialing
     CALLSETUP_ALERTING = 3   # Outgoing call alerting
     
+    # Response parsers, compiled once. The numeric ones only look past the
+    # colon: the prefix has already been matched by the caller.
+    _RE_NUMBER = re.compile(r':\s*(\d+)')  # +VGS: 7, +BRSF: 871, ...
+    _RE_CLIP = re.compile(r'\+CLIP:\s*"([^"]+)"')
+    _RE_CIEV = re.compile(r'\+CIEV:\s*(\d+),\s*(\d+)')
+    _RE_CIND_MAPPING = re.compile(r'\("([^"]+)",\s*\((\d+),(\d+)\)\)')
+    
     # Supported features (bitmap)
     HF_FEATURES = {
         'EC_NR': 0x01,           # Echo Cancellation/Noise Reduction
@@ -109,6 +118,27 @@ class CallManager:
         self.rfcomm_socket: Optional[socket.socket] = None
         self.rfcomm_thread: Optional[threading.Thread] = None
         self.running = False
+        # The reader waits on the socket and on a pipe that
+        # disconnect_rfcomm() writes to, so stopping doesn't wait for data
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        # Set by the reader when the phone's OK/ERROR result arrives
+        self._at_result = threading.Event()
+        
+        # AT response handlers, keyed by the response name before the colon
+        self._at_handlers: Dict[str, Callable[[str], None]] = {
+            'RING': self._on_ring,
+            '+CLIP': self._on_clip,
+            '+VGS': self._on_vgs,
+            '+VGM': self._on_vgm,
+            'OK': self._on_ok,
+            'ERROR': self._on_error,
+            '+CIEV': self._handle_ciev,
+            '+BRSF': self._on_brsf,
+            '+CIND': self._parse_cind_response,
+            '+BCS': self._on_bcs,
+        }
         
         logging.info("CallManager initialized")
     
@@ -134,27 +164,16 @@ class CallManager:
         Returns:
             True if connected successfully
         """
+        # A repeated HFP NewConnection replaces the current link
+        self._stop_active_reader()
+        
         try:
-            import os
-            
-            # Create socket from file descriptor
-            self.rfcomm_socket = socket.fromfd(
-                fd,
-                socket.AF_BLUETOOTH,
-                socket.SOCK_STREAM,
-                socket.BTPROTO_RFCOMM
-            )
-            
-            # Make a duplicate so we own it
+            # Make a duplicate so we own it (the HFP profile closes its copy
+            # on disconnect); the socket type is detected from the fd
             self.rfcomm_socket = socket.socket(fileno=os.dup(fd))
             
             # Start command processing thread
-            self.running = True
-            self.rfcomm_thread = threading.Thread(
-                target=self._process_commands,
-                daemon=True
-            )
-            self.rfcomm_thread.start()
+            self._start_reader()
             
             # Send HFP SLC (Service Level Connection) initialization sequence
             self._init_slc()
@@ -177,6 +196,8 @@ class CallManager:
         Returns:
             True if connected successfully
         """
+        self._stop_active_reader()
+        
         try:
             self.rfcomm_socket = socket.socket(
                 socket.AF_BLUETOOTH,
@@ -187,12 +208,7 @@ class CallManager:
             self.rfcomm_socket.connect((address, channel))
             
             # Start command processing thread
-            self.running = True
-            self.rfcomm_thread = threading.Thread(
-                target=self._process_commands,
-                daemon=True
-            )
-            self.rfcomm_thread.start()
+            self._start_reader()
             
             # Send initial AT commands
             self._send_at_command(f"{self.AT_BRSF}=31")  # Send features
@@ -206,10 +222,36 @@ class CallManager:
             logging.error(f"Failed to connect RFCOMM: {e}")
             return False
     
+    def _start_reader(self) -> None:
+        """Start the AT command thread on the connected RFCOMM socket."""
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._selector.register(self.rfcomm_socket, selectors.EVENT_READ)
+        
+        self.running = True
+        self.rfcomm_thread = threading.Thread(
+            target=self._process_commands,
+            daemon=True
+        )
+        self.rfcomm_thread.start()
+    
+    def _stop_active_reader(self) -> None:
+        """Disconnect the current RFCOMM link, if any, before a new one."""
+        if self.rfcomm_socket or self.rfcomm_thread or self._selector:
+            self.disconnect_rfcomm()
+    
     def disconnect_rfcomm(self) -> None:
         """Disconnect RFCOMM channel."""
         self.running = False
         
+        # Wake the reader out of its wait
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b'\0')
+            except OSError:
+                pass
+        
         if self.rfcomm_thread:
             self.rfcomm_thread.join(timeout=2.0)
             self.rfcomm_thread = None
@@ -221,6 +263,14 @@ class CallManager:
                 pass
             self.rfcomm_socket = None
         
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+        
         logging.info("RFCOMM disconnected")
     
     def _send_at_command(self, command: str) -> bool:
@@ -248,28 +298,42 @@ class CallManager:
             logging.error(f"Failed to send AT command: {e}")
             return False
     
+    def _send_and_wait(self, command: str, timeout: float = 0.1) -> bool:
+        """
+        Send AT command and wait for the phone's final OK/ERROR result.
+        
+        Args:
+            command: AT command string
+            timeout: Longest time to wait for the result (seconds)
+            
+        Returns:
+            True if a result arrived before the timeout
+        """
+        self._at_result.clear()
+        if not self._send_at_command(command):
+            return False
+        return self._at_result.wait(timeout)
+    
     def _process_commands(self) -> None:
         """Process incoming AT commands (runs in separate thread)."""
         logging.info("AT command processing thread started")
         
-        buffer = ""
+        buffer = b""
+        selector = self._selector
         
         while self.running:
             try:
+                # Sleep until the phone sends something or we're stopped
+                selector.select()
+                if not self.running:
+                    break
+                
                 # Read data from socket
                 data = self.rfcomm_socket.recv(1024)
                 if not data:
                     break
                 
-                buffer += data.decode('utf-8', errors='ignore')
-                
-                # Process complete lines
-                while '\r\n' in buffer:
-                    line, buffer = buffer.split('\r\n', 1)
-                    line = line.strip()
-                    
-                    if line:
-                        self._handle_at_command(line)
+                buffer = self._dispatch_at_lines(buffer, data)
                 
             except socket.error as e:
                 logging.error(f"Error reading from RFCOMM: {e}")
@@ -279,6 +343,33 @@ class CallManager:
         
         logging.info("AT command processing thread stopped")
     
+    def _dispatch_at_lines(self, buffer: bytes, data: bytes) -> bytes:
+        """
+        Handle every complete line in buffered plus newly received data.
+        
+        All lines are split out in one bytes.splitlines() pass rather than
+        by repeatedly searching and slicing the buffer. Responses are framed
+        as CR LF <response> CR LF, so the empty lines between them are skipped.
+        
+        Args:
+            buffer: Unterminated data left over from the previous read
+            data: Newly received data
+            
+        Returns:
+            The trailing unterminated fragment to prepend to the next read
+        """
+        lines = (buffer + data).splitlines()
+        buffer = b"" if data.endswith((b"\r", b"\n")) else lines.pop()
+        
+        # AT responses are 7-bit ASCII: trim and drop the empty framing lines
+        # while still bytes, so only real responses are decoded
+        for raw in lines:
+            raw = raw.strip()
+            if raw:
+                self._handle_at_command(raw.decode('ascii', errors='ignore'))
+        
+        return buffer
+    
     def _handle_at_command(self, command: str) -> None:
         """
         Handle incoming AT command from phone.
@@ -286,95 +377,105 @@ class CallManager:
         Args:
             command: Received AT command
         """
-        logging.debug(f"Received: {command}")
+        logging.debug("Received: %s", command)
         
-        # RING - Incoming call
-        if command.startswith("RING"):
-            self.state = CallState.INCOMING
-            if self.on_incoming_call:
-                self.on_incoming_call()
+        # Responses are keyed by the part before the colon ("+CIEV", "RING")
+        handler = self._at_handlers.get(command.partition(':')[0])
+        if handler:
+            handler(command)
+    
+    def _on_ring(self, command: str) -> None:
+        """RING - Incoming call."""
+        if self._begin_incoming_call():
             logging.info("Incoming call detected")
+    
+    def _begin_incoming_call(self) -> bool:
+        """
+        Enter the INCOMING state, notifying on_incoming_call once per call.
         
-        # +CLIP - Caller ID
-        elif command.startswith("+CLIP:"):
-            match = re.search(r'\+CLIP:\s*"([^"]+)"', command)
-            if match:
-                self.caller_id = match.group(1)
-                logging.info(f"Caller ID: {self.caller_id}")
-        
-        # +VGS - Speaker volume from phone
-        elif command.startswith("+VGS:"):
-            match = re.search(r'\+VGS:\s*(\d+)', command)
-            if match:
-                self.speaker_volume = int(match.group(1))
-                if self.on_volume_changed:
-                    self.on_volume_changed('speaker', self.speaker_volume)
-                logging.info(f"Speaker volume: {self.speaker_volume}")
-        
-        # +VGM - Microphone volume from phone
-        elif command.startswith("+VGM:"):
-            match = re.search(r'\+VGM:\s*(\d+)', command)
-            if match:
-                self.mic_volume = int(match.group(1))
-                if self.on_volume_changed:
-                    self.on_volume_changed('microphone', self.mic_volume)
-                logging.info(f"Microphone volume: {self.mic_volume}")
-        
-        # OK - Command acknowledged
-        elif command == "OK":
-            logging.debug("Command acknowledged")
-        
-        # ERROR - Command failed
-        elif command == "ERROR":
-            logging.warning("AT command error")
-        
-        # +CIEV - Indicator Event (call state changes)
-        elif command.startswith("+CIEV:"):
-            self._handle_ciev(command)
-        
-        # +BRSF - AG supported features
-        elif command.startswith("+BRSF:"):
-            match = re.search(r'\+BRSF:\s*(\d+)', command)
-            if match:
-                self.ag_features = int(match.group(1))
-                logging.info(f"AG features: {self.ag_features:#06x}")
-        
-        # +CIND - Indicator values response
-        elif command.startswith("+CIND:"):
-            self._parse_cind_response(command)
-        
-        # +BCS - Codec Selection from AG
-        elif command.startswith("+BCS:"):
-            match = re.search(r'\+BCS:\s*(\d+)', command)
-            if match:
-                codec_id = int(match.group(1))
-                codec_name = "CVSD" if codec_id == 1 else "mSBC" if codec_id == 2 else f"Unknown({codec_id})"
-                logging.info(f"Codec selected: {codec_name}")
-                # Confirm codec selection
-                self._send_at_command(f"{self.AT_BCS}={codec_id}")
-                if self.on_codec_selected:
-                    self.on_codec_selected(codec_name)
+        The AG announces a call with +CIEV callsetup=1 and then repeats RING
+        every few seconds until it is answered; only the first is a new call.
+        
+        Returns:
+            True if this started a new incoming call
+        """
+        if self.state == CallState.INCOMING:
+            return False
+        
+        self.state = CallState.INCOMING
+        if self.on_incoming_call:
+            self.on_incoming_call()
+        return True
+    
+    def _on_clip(self, command: str) -> None:
+        """+CLIP - Caller ID."""
+        match = self._RE_CLIP.search(command)
+        if match:
+            self.caller_id = match.group(1)
+            logging.info(f"Caller ID: {self.caller_id}")
+    
+    def _on_vgs(self, command: str) -> None:
+        """+VGS - Speaker volume from phone."""
+        match = self._RE_NUMBER.search(command)
+        if match:
+            self.speaker_volume = int(match.group(1))
+            if self.on_volume_changed:
+                self.on_volume_changed('speaker', self.speaker_volume)
+            logging.info(f"Speaker volume: {self.speaker_volume}")
+    
+    def _on_vgm(self, command: str) -> None:
+        """+VGM - Microphone volume from phone."""
+        match = self._RE_NUMBER.search(command)
+        if match:
+            self.mic_volume = int(match.group(1))
+            if self.on_volume_changed:
+                self.on_volume_changed('microphone', self.mic_volume)
+            logging.info(f"Microphone volume: {self.mic_volume}")
+    
+    def _on_ok(self, command: str) -> None:
+        """OK - Command acknowledged."""
+        logging.debug("Command acknowledged")
+        self._at_result.set()
+    
+    def _on_error(self, command: str) -> None:
+        """ERROR - Command failed."""
+        logging.warning("AT command error")
+        self._at_result.set()
+    
+    def _on_brsf(self, command: str) -> None:
+        """+BRSF - AG supported features."""
+        match = self._RE_NUMBER.search(command)
+        if match:
+            self.ag_features = int(match.group(1))
+            logging.info(f"AG features: {self.ag_features:#06x}")
+    
+    def _on_bcs(self, command: str) -> None:
+        """+BCS - Codec Selection from AG."""
+        match = self._RE_NUMBER.search(command)
+        if match:
+            codec_id = int(match.group(1))
+            codec_name = "CVSD" if codec_id == 1 else "mSBC" if codec_id == 2 else f"Unknown({codec_id})"
+            logging.info(f"Codec selected: {codec_name}")
+            # Confirm codec selection
+            self._send_at_command(f"{self.AT_BCS}={codec_id}")
+            if self.on_codec_selected:
+                self.on_codec_selected(codec_name)
     
     def _init_slc(self) -> None:
         """Initialize HFP Service Level Connection with proper sequence."""
-        import time
-        
-        # HFP SLC initialization sequence:
+        # HFP SLC initialization sequence. Each step waits for the AG to
+        # answer (at most 100 ms) before the next command is sent.
         # 1. Exchange supported features
-        self._send_at_command(f"{self.AT_BRSF}=63")  # Our features (all enabled)
-        time.sleep(0.1)
+        self._send_and_wait(f"{self.AT_BRSF}=63")  # Our features (all enabled)
         
         # 2. Query indicator mapping
-        self._send_at_command(self.AT_CIND_T)  # Get indicator definitions
-        time.sleep(0.1)
+        self._send_and_wait(self.AT_CIND_T)  # Get indicator definitions
         
         # 3. Query current indicator values
-        self._send_at_command(self.AT_CIND_Q)  # Get current values
-        time.sleep(0.1)
+        self._send_and_wait(self.AT_CIND_Q)  # Get current values
         
         # 4. Enable indicator event reporting
-        self._send_at_command(f"{self.AT_CMER}=3,0,0,1")  # Enable CIEV events
-        time.sleep(0.1)
+        self._send_and_wait(f"{self.AT_CMER}=3,0,0,1")  # Enable CIEV events
         
         # 5. Enable caller ID
         self._send_at_command(f"{self.AT_CLIP}=1")
@@ -385,7 +486,7 @@ class CallManager:
         
         Format: +CIEV: <index>,<value>
         """
-        match = re.search(r'\+CIEV:\s*(\d+),\s*(\d+)', command)
+        match = self._RE_CIEV.search(command)
         if not match:
             return
         
@@ -412,10 +513,8 @@ class CallManager:
         elif idx == self.CIEV_CALLSETUP:
             self.indicators['callsetup'] = value
             if value == self.CALLSETUP_INCOMING:
-                self.state = CallState.INCOMING
-                if self.on_incoming_call:
-                    self.on_incoming_call()
-                logging.info("Incoming call (from CIEV)")
+                if self._begin_incoming_call():
+                    logging.info("Incoming call (from CIEV)")
             elif value == self.CALLSETUP_OUTGOING:
                 self.state = CallState.OUTGOING
                 logging.info("Outgoing call dialing")
@@ -463,8 +562,7 @@ class CallManager:
         # Check if it's mapping (contains quotes) or values
         if '"' in content:
             # Parse indicator mapping: ("name",(min,max)),...
-            pattern = r'\("([^"]+)",\s*\((\d+),(\d+)\)\)'
-            matches = re.findall(pattern, content)
+            matches = self._RE_CIND_MAPPING.findall(content)
             for i, (name, min_val, max_val) in enumerate(matches, 1):
                 self.indicator_mapping[i] = name
                 logging.debug(f"Indicator {i}: {name} ({min_val}-{max_val})")
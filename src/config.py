@@ -108,6 +108,16 @@ class Config:
         """Audio buffer size in frames."""
         return self.get_int('audio', 'buffer_size', 2048)
     
+    @property
+    def audio_periods(self) -> int:
+        """Number of periods in the ALSA ring buffer."""
+        return self.get_int('audio', 'periods', 3)
+    
+    @property
+    def audio_latency_ms(self) -> int:
+        """Target PulseAudio stream latency in milliseconds (0 = server default)."""
+        return self.get_int('audio', 'latency_ms', 30)
+    
     @property
     def audio_sco_mtu(self) -> int:
         """SCO MTU (Maximum Transmission Unit)."""
@@ -57,6 +57,8 @@ class HandsFreeHeadset:
             sample_rate=self.config.audio_sample_rate,
             channels=self.config.audio_channels,
             buffer_size=self.config.audio_buffer_size,
+            periods=self.config.audio_periods,
+            latency_ms=self.config.audio_latency_ms,
             enable_preprocessing=self.config.audio_enable_preprocessing,
             noise_reduction_level=self.config.audio_noise_reduction_level,
             enable_aec=self.config.audio_enable_aec,
@@ -5,7 +5,12 @@ Unit tests for Audio Manager
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import os
+import queue
+import select
+import socket
 import sys
+import time
 from pathlib import Path
 
 # Add src to path
@@ -71,6 +76,136 @@ class TestAudioManager(unittest.TestCase):
         self.audio_manager.state = AudioState.ACTIVE_CALL
         self.assertEqual(self.audio_manager.state, AudioState.ACTIVE_CALL)
 
+    
+    def test_initialize_leaves_pulseaudio_unconnected(self):
+        """Test initialize() connects to PulseAudio only on first use."""
+        pulsectl = MagicMock()
+        self.audio_manager._pulse_unavailable = False
+        with patch('audio_manager.alsaaudio.PCM'), \
+             patch.object(self.audio_manager, '_open_mixers'), \
+             patch('audio_manager.pulsectl', pulsectl, create=True):
+            self.assertTrue(self.audio_manager.initialize())
+            pulsectl.Pulse.assert_not_called()
+            self.assertIsNone(self.audio_manager._pulse_events_thread)
+            
+            self.assertIsNotNone(self.audio_manager.pulse)
+            self.assertIsNotNone(self.audio_manager._pulse_events_thread)
+            self.audio_manager._stop_pulse_events()
+        self.assertEqual(
+            [c.args for c in pulsectl.Pulse.call_args_list],
+            [('AudioManager',), ('AudioManager-events',)]
+        )
+    
+    def test_preproc_worker_counts_overruns_under_its_own_key(self):
+        """Test the preprocessing worker doesn't share the audio thread's overrun counter."""
+        am = self.audio_manager
+        am.preprocessor = Mock()
+        am.preprocessor.process_frame.side_effect = lambda data: data
+        am._preproc_q_in = queue.Queue()
+        am._preproc_q_out = queue.Queue(maxsize=1)
+        for frame in (b'\x00\x01', b'\x00\x02', None):
+            am._preproc_q_in.put(frame)
+        
+        am._preproc_worker()
+        
+        self.assertEqual(am._err_counters['preproc_overrun'], 1)
+        self.assertEqual(am._err_counters['overrun'], 0)
+        self.assertEqual(am._preproc_q_out.get_nowait()[0], b'\x00\x02')
+    
+    def test_audio_loop_drops_closed_sco_link(self):
+        """Test the audio loop stops waiting on an SCO socket once the link drops."""
+        local, remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        local.setblocking(False)
+        self.audio_manager.preprocessor = None
+        self.audio_manager.capture_device = Mock(polldescriptors=Mock(return_value=[]),
+                                                 read=Mock(return_value=(0, b'')))
+        self.audio_manager.playback_device = Mock()
+        self.audio_manager.sco_socket = local
+        
+        self.assertTrue(self.audio_manager.start_audio_loop())
+        self.addCleanup(self.audio_manager.stop_audio_loop)
+        remote.sendall(b'\x00' * 120)
+        remote.close()
+        
+        deadline = time.monotonic() + 2.0
+        while self.audio_manager.sco_socket is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        self.assertIsNone(self.audio_manager.sco_socket)
+        self.audio_manager.playback_device.write.assert_called_once()
+        # Only the stop pipe is left to wait on, so the loop is idle
+        registered = [key.data for key in self.audio_manager._selector.get_map().values()]
+        self.assertEqual(registered, ['wake'])
+
+    
+    def test_audio_loop_restarts_capture_after_overrun(self):
+        """Test an overrun re-primes capture instead of stalling it."""
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        
+        frame = b'\x01\x00' * 160
+        results = [(0, b''), (-32, b''), (160, frame)]
+        
+        def read():
+            try:
+                os.read(read_fd, 64)
+            except BlockingIOError:
+                pass
+            return results.pop(0) if results else (0, b'')
+        
+        self.audio_manager.preprocessor = None
+        self.audio_manager.monitor = None
+        self.audio_manager.capture_device = Mock(
+            polldescriptors=Mock(return_value=[(read_fd, select.POLLIN)]),
+            polldescriptors_revents=Mock(return_value=select.POLLIN),
+            read=Mock(side_effect=read))
+        self.audio_manager.playback_device = Mock()
+        self.audio_manager._handle_capture = Mock()
+        
+        self.assertTrue(self.audio_manager.start_audio_loop())
+        self.addCleanup(self.audio_manager.stop_audio_loop)
+        os.write(write_fd, b'\0')
+        
+        deadline = time.monotonic() + 2.0
+        while not self.audio_manager._handle_capture.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        self.assertEqual(self.audio_manager._handle_capture.call_args.args[0], frame)
+        self.assertEqual(self.audio_manager._err_counters['xrun'], 1)
+    
+    def test_audio_loop_reads_capture_only_when_alsa_reports_data(self):
+        """Test fd readiness is translated through ALSA before capture is read."""
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        
+        def revents(descriptors):
+            # Like a plugin PCM: consume the wakeup without a period ready
+            os.read(read_fd, 64)
+            return 0
+        
+        capture = Mock(polldescriptors=Mock(return_value=[(read_fd, select.POLLIN)]),
+                       polldescriptors_revents=Mock(side_effect=revents),
+                       read=Mock(return_value=(0, b'')))
+        self.audio_manager.preprocessor = None
+        self.audio_manager.capture_device = capture
+        self.audio_manager.playback_device = Mock()
+        
+        self.assertTrue(self.audio_manager.start_audio_loop())
+        self.addCleanup(self.audio_manager.stop_audio_loop)
+        os.write(write_fd, b'\0')
+        
+        deadline = time.monotonic() + 2.0
+        while not capture.polldescriptors_revents.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        
+        capture.polldescriptors_revents.assert_called_once_with([(read_fd, select.POLLIN)])
+        capture.read.assert_called_once_with()  # Only the priming read
+
 
 if __name__ == '__main__':
     unittest.main()
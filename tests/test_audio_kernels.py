@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Audio Kernels Module
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scipy import signal
+
+from audio_kernels import (sos_filter, frame_stats, nlms_filter,
+                           soft_clip, soft_clip_to_i16, warmup)
+
+
+def _nlms_step(x, d, w, mu, eps):
+    """Reference NLMS iteration: x holds the taps newest first."""
+    err = d - np.dot(w, x)
+    w += (mu / (np.dot(x, x) + eps)) * err * x
+    return err
+
+
+class TestAudioKernels(unittest.TestCase):
+    """Test cases for audio kernels."""
+    
+    def test_frame_stats(self):
+        """Test single-pass energy, peak and clip count."""
+        samples = np.array([3, -4, 32767, -32768, 100], dtype=np.int16)
+        
+        energy, peak, clipped = frame_stats(samples)
+        
+        self.assertEqual(energy, int(np.sum(samples.astype(np.int64) ** 2)))
+        self.assertEqual(peak, 32768)
+        self.assertEqual(clipped, 2)
+    
+    def test_sos_filter_matches_sosfilt_across_frames(self):
+        """Test the SOS cascade output and carried state match scipy sosfilt."""
+        sos = signal.butter(4, 80.0 / 8000.0, btype='high', output='sos')
+        rng = np.random.default_rng(5)
+        audio = (0.3 * rng.standard_normal(960)).astype(np.float32)
+        
+        expected = signal.sosfilt(sos, audio.astype(np.float64))
+        
+        zi = np.zeros((len(sos), 2))
+        out = audio.copy()
+        for start in range(0, out.size, 320):
+            sos_filter(out[start:start + 320], sos, zi)
+        
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+
+    
+    def test_nlms_filter_converges_on_pure_echo(self):
+        """Test NLMS cancels a delayed, attenuated copy of the reference."""
+        rng = np.random.default_rng(1)
+        ref = rng.standard_normal(4000).astype(np.float32)
+        taps = 16
+        w = np.zeros(taps)
+        padded = np.concatenate([np.zeros(taps - 1, dtype=np.float32), ref])
+        echo = 0.5 * padded[taps - 1 - 3:-3]
+        
+        errors = np.empty(ref.size, dtype=np.float32)
+        nlms_filter(echo, padded, w, 0.5, 1e-6, errors)
+        
+        self.assertLess(np.abs(errors[-100:]).max(), 1e-3)
+        self.assertAlmostEqual(w[3], 0.5, places=3)
+    
+    def test_nlms_filter_matches_per_sample_steps(self):
+        """Test the whole-frame NLMS kernel matches per-sample updates."""
+        rng = np.random.default_rng(4)
+        taps = 32
+        ref = rng.standard_normal(320 + taps - 1).astype(np.float32)
+        mic = (0.3 * ref[taps - 1 - 5:-5] + 0.01 * rng.standard_normal(320)).astype(np.float32)
+        
+        w_expected = np.zeros(taps)
+        expected = np.empty(320, dtype=np.float32)
+        for i in range(320):
+            expected[i] = _nlms_step(ref[i:i + taps][::-1], mic[i], w_expected, 0.3, 1e-6)
+        
+        w = np.zeros(taps)
+        out = np.empty(320, dtype=np.float32)
+        nlms_filter(mic, ref, w, 0.3, 1e-6, out)
+        
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+        np.testing.assert_allclose(w, w_expected, atol=1e-6)
+    
+    def test_soft_clip_to_i16_matches_float_path(self):
+        """Test the fused AGC kernel matches soft clipping then conversion."""
+        x = np.linspace(-1.0, 1.0, 641, dtype=np.float32)
+        out = np.empty(641, dtype=np.int16)
+        soft_clip_to_i16(x, 3.0, out)
+        
+        expected = np.rint(soft_clip(x, 3.0) * 32768.0)
+        np.testing.assert_allclose(out, expected, atol=1)
+        self.assertLessEqual(np.abs(out).max(), 16384)
+        np.testing.assert_allclose(soft_clip(x, 1.0), 0.5 * np.tanh(2 * x), atol=0.015)
+    
+    def test_warmup(self):
+        """Test warmup runs every kernel without error."""
+        warmup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -117,6 +117,81 @@ class TestAudioMonitor(unittest.TestCase):
         
         self.assertAlmostEqual(metrics.peak_level_db, expected_peak_db, delta=1)
     
+    def test_analyze_frame_precomputed_stats(self):
+        """Test precomputed frame statistics give the same levels."""
+        signal = self._generate_test_audio(frequency=1000, amplitude=0.7)
+        signal_bytes = self._audio_to_bytes(signal)
+        samples = np.frombuffer(signal_bytes, dtype=np.int16).astype(np.int64)
+        stats = (int(np.sum(samples ** 2)), int(np.max(np.abs(samples))), 0)
+        
+        reference = AudioMonitor(sample_rate=16000, window_size=100)
+        reference.analyze_frame(signal_bytes)
+        self.monitor.analyze_frame(signal_bytes, stats=stats)
+        
+        self.assertAlmostEqual(self.monitor.rms_buffer[-1], reference.rms_buffer[-1], places=5)
+        self.assertAlmostEqual(self.monitor.peak_buffer[-1], reference.peak_buffer[-1], places=5)
+        self.assertEqual(self.monitor.clip_buffer[-1], 0)
+    
+    def test_running_averages_match_window(self):
+        """Test running window sums track the buffers after eviction."""
+        monitor = AudioMonitor(sample_rate=16000, window_size=5)
+        for i in range(12):
+            amplitude = 0.05 * (i + 1)
+            signal_bytes = self._audio_to_bytes(self._generate_test_audio(amplitude=amplitude))
+            monitor.analyze_frame(signal_bytes, has_voice=(i % 2 == 0))
+        
+        metrics = monitor.get_current_metrics()
+        
+        expected_rms_db = 20 * np.log10(np.mean(list(monitor.rms_buffer)))
+        self.assertAlmostEqual(metrics.rms_level_db, expected_rms_db, places=6)
+        self.assertAlmostEqual(metrics.voice_activity_percent,
+                               np.mean(list(monitor.voice_buffer)) * 100, places=6)
+    
+    def test_analyze_frames_matches_per_frame(self):
+        """Test batch analysis gives the same state as per-frame calls."""
+        rng = np.random.default_rng(3)
+        amplitudes = rng.uniform(0.001, 1.2, size=70)
+        voice = rng.random(70) < 0.3
+        frames = [self._audio_to_bytes(np.clip(self._generate_test_audio(amplitude=a), -1, 1))
+                  for a in amplitudes]
+        
+        single = AudioMonitor(sample_rate=16000, window_size=20)
+        for frame, has_voice in zip(frames, voice):
+            single.analyze_frame(frame, has_voice=bool(has_voice))
+        
+        batch = AudioMonitor(sample_rate=16000, window_size=20)
+        batch.analyze_frames(b''.join(frames[:15]), self.frame_size, voice[:15])
+        batch.analyze_frames(b''.join(frames[15:]), self.frame_size, voice[15:])
+        
+        np.testing.assert_allclose(list(batch.rms_buffer), list(single.rms_buffer))
+        np.testing.assert_allclose(list(batch.clip_buffer), list(single.clip_buffer))
+        self.assertEqual(batch.frames_monitored, single.frames_monitored)
+        self.assertEqual(batch.total_clipping_frames, single.total_clipping_frames)
+        np.testing.assert_allclose(batch.noise_floor, single.noise_floor, rtol=1e-6)
+        
+        expected = single.get_current_metrics()
+        actual = batch.get_current_metrics()
+        self.assertAlmostEqual(actual.rms_level_db, expected.rms_level_db, places=6)
+        self.assertAlmostEqual(actual.peak_level_db, expected.peak_level_db, places=6)
+        self.assertAlmostEqual(actual.voice_activity_percent,
+                               expected.voice_activity_percent, places=6)
+    
+    def test_noise_floor_tracks_silence_ema(self):
+        """Test noise floor is an exponential average of silent frame RMS."""
+        rng = np.random.default_rng(2)
+        amplitudes = rng.uniform(0.001, 0.02, size=80)
+        expected = 1e-6
+        for i, amplitude in enumerate(amplitudes):
+            has_voice = (i % 4 == 0)
+            self.monitor.analyze_frame(
+                self._audio_to_bytes(self._generate_test_audio(amplitude=amplitude)),
+                has_voice=has_voice
+            )
+            if not has_voice:
+                expected += AudioMonitor.NOISE_ALPHA * (self.monitor.rms_buffer[-1] - expected)
+        
+        self.assertAlmostEqual(self.monitor.noise_floor, expected, places=12)
+    
     # ========== SNR Tests ==========
     
     def test_snr_calculation_clean_signal(self):
@@ -240,6 +315,22 @@ class TestAudioMonitor(unittest.TestCase):
         self.assertEqual(metrics.codec, "CVSD")
         self.assertEqual(metrics.sample_rate, 8000)
     
+    def test_metrics_cached_until_inputs_change(self):
+        """Test metrics snapshot is reused until a frame or codec change."""
+        frame = self._audio_to_bytes(self._generate_test_audio())
+        self.monitor.analyze_frame(frame, has_voice=True)
+        
+        metrics = self.monitor.get_current_metrics()
+        self.assertIs(self.monitor.get_current_metrics(), metrics)
+        
+        self.monitor.analyze_frame(frame, has_voice=False)
+        updated = self.monitor.get_current_metrics()
+        self.assertIsNot(updated, metrics)
+        self.assertAlmostEqual(updated.voice_activity_percent, 50.0)
+        
+        self.monitor.set_codec_info("mSBC", 16000)
+        self.assertEqual(self.monitor.get_current_metrics().codec, "mSBC")
+    
     # ========== Latency Tests ==========
     
     def test_latency_estimation(self):
@@ -265,6 +356,18 @@ class TestAudioMonitor(unittest.TestCase):
         self.assertGreater(metrics.latency_ms, 90)
         self.assertLess(metrics.latency_ms, 110)
     
+    def test_latency_pairs_closest_later_output(self):
+        """Test each capture is paired with its closest output."""
+        ms = 1_000_000  # timestamps are in ns
+        self.monitor.capture_timestamps.extend([0, 100 * ms, 200 * ms])
+        # 0 -> 30ms and 200ms -> 250ms; the output closest to 100ms
+        # (30ms) precedes it, so that capture is skipped
+        self.monitor.output_timestamps.extend([30 * ms, 250 * ms])
+        
+        latency = self.monitor.estimate_latency()
+        
+        self.assertAlmostEqual(latency, (30 + 50) / 2, places=6)
+    
     # ========== Statistics Tests ==========
     
     def test_get_statistics(self):
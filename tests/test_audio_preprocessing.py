@@ -135,6 +135,85 @@ class TestAudioPreprocessor(unittest.TestCase):
         with self.assertRaises((ValueError, Exception)):
             self.preprocessor.process_frame(b'')
     
+    def test_process_frames_matches_per_frame(self):
+        """Test batched processing matches processing frame by frame."""
+        batched = AudioPreprocessor(
+            sample_rate=16000,
+            frame_size_ms=20,
+            noise_reduction_level=2,
+            enable_aec=False
+        )
+        rng = np.random.default_rng(0)
+        # Noise for calibration, then speech-like bursts over the noise
+        audio = 0.01 * rng.standard_normal(self.frame_size * 40)
+        audio[self.frame_size * 30:] += self._generate_test_audio(duration=0.2, amplitude=0.3)
+        data = self._audio_to_bytes(audio.astype(np.float32))
+        frame_bytes = self.frame_size * 2
+        
+        expected = b''.join(
+            self.preprocessor.process_frame(data[i:i + frame_bytes])
+            for i in range(0, len(data), frame_bytes)
+        )
+        # Split across two calls so state must carry between batches
+        split = frame_bytes * 28
+        result = batched.process_frames(data[:split]) + batched.process_frames(data[split:])
+        
+        np.testing.assert_allclose(
+            np.frombuffer(result, dtype=np.int16),
+            np.frombuffer(expected, dtype=np.int16),
+            atol=2
+        )
+        self.assertEqual(batched.frames_processed, 40)
+        self.assertAlmostEqual(batched.agc_gain, self.preprocessor.agc_gain, places=4)
+    
+    @patch('audio_preprocessing.SPEEXDSP_AVAILABLE', False)
+    def test_process_frames_aec_matches_per_frame(self):
+        """Test batched NLMS echo cancellation pairs each frame with its own reference."""
+        per_frame = AudioPreprocessor(sample_rate=16000, frame_size_ms=20,
+                                      enable_noise_reduction=False, enable_agc=False)
+        batched = AudioPreprocessor(sample_rate=16000, frame_size_ms=20,
+                                    enable_noise_reduction=False, enable_agc=False)
+        rng = np.random.default_rng(1)
+        num_frames = 10
+        speaker = 0.3 * rng.standard_normal(self.frame_size * num_frames)
+        # Prime the reference with a frame of silence, then an echo of the
+        # speaker signal delayed by 8 samples plus a little noise
+        echo = 0.5 * np.concatenate([np.zeros(8), speaker[:-8]])
+        mic = echo + 0.01 * rng.standard_normal(len(speaker))
+        spk_data = self._audio_to_bytes(speaker.astype(np.float32))
+        mic_data = self._audio_to_bytes(mic.astype(np.float32))
+        silence = bytes(self.frame_size * 2)
+        frame_bytes = self.frame_size * 2
+        
+        per_frame.update_speaker_signal(silence)
+        expected = b''
+        for i in range(0, len(mic_data), frame_bytes):
+            per_frame.update_speaker_signal(spk_data[i:i + frame_bytes])
+            expected += per_frame.process_frame(mic_data[i:i + frame_bytes])
+        batched.update_speaker_signal(silence)
+        batched.update_speaker_signal(spk_data)
+        result = batched.process_frames(mic_data)
+        
+        np.testing.assert_allclose(
+            np.frombuffer(result, dtype=np.int16),
+            np.frombuffer(expected, dtype=np.int16),
+            atol=2
+        )
+    
+    @patch('audio_preprocessing.SPEEXDSP_AVAILABLE', False)
+    def test_process_frames_aec_rejects_batch_longer_than_reference(self):
+        """Test batched echo cancellation refuses more samples than the reference ring holds."""
+        preprocessor = AudioPreprocessor(sample_rate=16000, frame_size_ms=20)
+        frames = preprocessor._spk_ring.size // self.frame_size + 1
+        with self.assertRaises(ValueError):
+            preprocessor.process_frames(bytes(self.frame_size * 2 * frames))
+    
+    def test_process_frames_rejects_partial_frame(self):
+        """Test batched processing requires a whole number of frames."""
+        data = bytes(self.frame_size * 2 + 2)
+        with self.assertRaises(ValueError):
+            self.preprocessor.process_frames(data)
+    
     # ========== Noise Reduction Tests ==========
     
     def test_noise_reduction_initialization(self):
@@ -209,6 +288,27 @@ class TestAudioPreprocessor(unittest.TestCase):
         
         self.assertIsNotNone(self.preprocessor.noise_spectrum)
     
+    def test_silent_frames_skip_fft_between_profile_updates(self):
+        """Test silence is attenuated directly, refreshing the profile every Nth frame."""
+        proc = self.preprocessor
+        noise = 0.005 * np.random.default_rng(0).standard_normal(self.frame_size)
+        noise = noise.astype(np.float32)
+        for _ in range(proc.noise_estimation_frames):
+            proc._apply_noise_reduction(noise, has_voice=False)
+        
+        profiles = [proc.noise_profile]
+        for _ in range(proc.silence_fft_interval + 1):
+            proc._apply_noise_reduction(noise, has_voice=False)
+            profiles.append(proc.noise_profile)
+        
+        # The first and (interval + 1)-th silent frames refresh the profile
+        self.assertIsNot(profiles[0], profiles[1])
+        self.assertIs(profiles[1], profiles[-2])
+        self.assertIsNot(profiles[-2], profiles[-1])
+        
+        out = proc._apply_noise_reduction(noise, has_voice=False)
+        np.testing.assert_allclose(out, noise * proc.silence_gain)
+    
     # ========== AGC Tests ==========
     
     def test_agc_quiet_signal_boost(self):
@@ -353,6 +453,54 @@ class TestAudioPreprocessor(unittest.TestCase):
         # Should detect as voice (energy-based)
         self.assertTrue(has_voice)
     
+    def test_process_frame_records_voice_activity(self):
+        """Test process_frame exposes the frame's VAD decision."""
+        proc = AudioPreprocessor(
+            sample_rate=16000,
+            enable_aec=False,
+            enable_highpass=False
+        )
+        
+        silence = np.zeros(self.frame_size, dtype=np.float32)
+        proc.process_frame(self._audio_to_bytes(silence))
+        self.assertFalse(proc.last_vad)
+        
+        signal = self._generate_test_audio(frequency=300, amplitude=0.3)
+        proc.process_frame(self._audio_to_bytes(signal))
+        self.assertTrue(proc.last_vad)
+    
+    # ========== Echo Cancellation Reference Tests ==========
+    
+    def test_speaker_reference_returns_latest_samples(self):
+        """Test the speaker ring buffer yields the newest samples across wrap-around."""
+        proc = AudioPreprocessor(sample_rate=16000, enable_aec=True)
+        self.assertIsNone(proc._latest_speaker_samples(self.frame_size))
+        
+        samples = (np.arange(20000) % 30000).astype(np.int16)
+        for start in range(0, samples.size, 700):
+            proc.update_speaker_signal(samples[start:start + 700].tobytes())
+        
+        latest = proc._latest_speaker_samples(self.frame_size)
+        np.testing.assert_array_equal(latest, samples[-self.frame_size:])
+    
+    def test_fdaf_aec_cancels_echo(self):
+        """Test the frequency-domain NLMS fallback converges on a synthetic echo path."""
+        proc = AudioPreprocessor(sample_rate=16000, enable_aec=True)
+        rng = np.random.default_rng(5)
+        frames = 120
+        speaker = (0.3 * rng.standard_normal(frames * self.frame_size)).astype(np.float32)
+        echo_path = np.zeros(512)
+        echo_path[[40, 100, 300]] = [0.5, -0.2, 0.1]
+        mic = np.convolve(speaker, echo_path)[:speaker.size].astype(np.float32)
+        
+        for i in range(frames):
+            block = slice(i * self.frame_size, (i + 1) * self.frame_size)
+            output = proc._apply_fdaf_aec(mic[block], speaker[block])
+        
+        attenuation_db = 10 * np.log10(np.mean(output ** 2) / np.mean(mic[block] ** 2))
+        self.assertLess(attenuation_db, -30)
+        self.assertEqual(output.dtype, np.float32)
+    
     # ========== Quality Metrics Tests ==========
     
     def test_get_quality_metrics(self):
@@ -5,13 +5,15 @@ Unit tests for Bluetooth Manager
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import os
+import socket
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from bluetooth_manager import BluetoothManager, ConnectionState
+from bluetooth_manager import BluetoothManager, ConnectionState, HFPProfile
 
 
 class TestBluetoothManager(unittest.TestCase):
@@ -31,6 +33,12 @@ class TestBluetoothManager(unittest.TestCase):
         self.assertEqual(self.bt_manager.state, ConnectionState.DISCONNECTED)
         self.assertIsNone(self.bt_manager.connected_device)
     
+    def test_invalid_device_class_rejected(self):
+        """Test a malformed device class fails at construction."""
+        self.assertEqual(self.bt_manager._device_class_int, 0x200404)
+        with self.assertRaises(ValueError):
+            BluetoothManager(device_class="hands-free")
+    
     def test_uuid_constants(self):
         """Test Bluetooth UUID constants."""
         self.assertEqual(
@@ -63,6 +71,184 @@ class TestBluetoothManager(unittest.TestCase):
         self.bt_manager.on_disconnected = callback
         self.assertEqual(self.bt_manager.on_disconnected, callback)
     
+    def test_paired_devices_follow_object_signals(self):
+        """Test the object cache tracks BlueZ signals without re-fetching."""
+        path = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+        device_iface = 'org.bluez.Device1'
+        self.bt_manager._on_interfaces_added(path, {
+            device_iface: {'Address': 'AA:BB:CC:DD:EE:FF', 'Name': 'Phone', 'Paired': False}
+        })
+        self.assertEqual(self.bt_manager.get_paired_devices(), [])
+        
+        self.bt_manager._on_properties_changed(device_iface, {'Paired': True}, [], path=path)
+        devices = self.bt_manager.get_paired_devices()
+        self.assertEqual(len(devices), 1)
+        self.assertEqual(devices[0]['address'], 'AA:BB:CC:DD:EE:FF')
+        self.assertEqual(devices[0]['name'], 'Phone')
+        
+        
+        # Unrelated property changes reuse the snapshot
+        self.bt_manager._on_properties_changed(device_iface, {'RSSI': -40}, [], path=path)
+        self.assertIs(self.bt_manager.get_paired_devices()[0], devices[0])
+        self.assertNotIn('RSSI', self.bt_manager._objects_cache[path][device_iface])
+        
+        self.bt_manager._on_interfaces_removed(path, [device_iface])
+        self.assertEqual(self.bt_manager.get_paired_devices(), [])
+    
+    @patch('bluetooth_manager.GLib')
+    def test_connection_callbacks_fire_on_transitions_only(self, mock_glib):
+        """Test repeated Connected signals don't re-run the callbacks."""
+        path = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+        device_iface = 'org.bluez.Device1'
+        self.bt_manager.auto_reconnect = False
+        self.bt_manager.on_connected = Mock()
+        self.bt_manager.on_disconnected = Mock()
+        self.bt_manager._on_interfaces_added(path, {
+            device_iface: {'Address': 'AA:BB:CC:DD:EE:FF', 'Name': 'Phone'}
+        })
+        
+        for _ in range(2):
+            self.bt_manager._on_properties_changed(device_iface, {'Connected': True}, [], path=path)
+        self.bt_manager.on_connected.assert_called_once_with('AA:BB:CC:DD:EE:FF')
+        self.assertEqual(self.bt_manager.connected_device, path)
+        
+        for _ in range(2):
+            self.bt_manager._on_properties_changed(device_iface, {'Connected': False}, [], path=path)
+        self.bt_manager.on_disconnected.assert_called_once_with('AA:BB:CC:DD:EE:FF')
+        self.assertEqual(self.bt_manager.state, ConnectionState.DISCONNECTED)
+        
+        # Names came from the cache, so nothing was fetched over D-Bus
+        mock_glib.idle_add.assert_not_called()
+    
+    def test_device_proxies_cached_until_removed(self):
+        """Test device proxies are created once per path and evicted on removal."""
+        path = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+        self.bt_manager.bus = MagicMock()
+        
+        self.bt_manager.connect_device(path)
+        self.bt_manager.disconnect_device(path)
+        self.bt_manager.bus.get_object.assert_called_once_with('org.bluez', path)
+        
+        self.bt_manager._connected_set.add(path)
+        self.bt_manager._on_interfaces_removed(path, ['org.bluez.Device1'])
+        self.assertNotIn(path, self.bt_manager._device_proxies)
+        self.assertNotIn(path, self.bt_manager._connected_set)
+        self.bt_manager.connect_device(path)
+        self.assertEqual(self.bt_manager.bus.get_object.call_count, 2)
+    
+    @patch('bluetooth_manager.GLib')
+    def test_reconnect_backs_off_on_main_loop(self, mock_glib):
+        """Test reconnect attempts are GLib timeouts with growing delays."""
+        self.bt_manager._last_connected_device = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+        self.bt_manager.bus = MagicMock()
+        mock_glib.timeout_add.return_value = 42
+        
+        self.bt_manager._start_reconnect()
+        mock_glib.timeout_add.assert_called_once_with(2000, self.bt_manager._reconnect_tick)
+        
+        self.bt_manager._reconnect_tick()
+        self.bt_manager.bus.get_object.assert_called_once_with(
+            'org.bluez', '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+        )
+        self.assertEqual(self.bt_manager.state, ConnectionState.CONNECTING)
+        mock_glib.timeout_add.assert_called_with(3000, self.bt_manager._reconnect_tick)
+        
+        self.bt_manager.stop_reconnect()
+        mock_glib.source_remove.assert_called_once_with(42)
+        self.assertIsNone(self.bt_manager._reconnect_source_id)
+        
+        # The schedule grows by 1.5x up to the cap, one entry per attempt
+        # plus the final give-up check
+        self.bt_manager.configure_reconnect(attempts=4, delay=2.0, max_delay=5.0)
+        self.bt_manager._start_reconnect()
+        self.assertEqual(self.bt_manager._reconnect_delays, (2.0, 3.0, 4.5, 5.0, 5.0))
+        self.bt_manager.stop_reconnect()
+        self.assertIsNone(self.bt_manager._reconnect_source_id)
+    
+    @patch('bluetooth_manager.GLib')
+    def test_call_all_collects_replies_in_order(self, mock_glib):
+        """Test pipelined D-Bus calls report per-call errors in call order."""
+        from bluetooth_manager import dbus
+        error = dbus.exceptions.DBusException("UUID already registered")
+        
+        def succeed(*args, reply_handler, error_handler):
+            reply_handler()
+        
+        def fail(*args, reply_handler, error_handler):
+            error_handler(error)
+        
+        results = self.bt_manager._call_all([(succeed, ('a',)), (fail, ('b',)), (succeed, ())])
+        self.assertEqual(results, [None, error, None])
+    
+    def test_power_on_does_not_block(self):
+        """Test the adapter is powered on asynchronously, and only when off."""
+        adapter = '/org/bluez/hci0'
+        self.bt_manager.adapter_path = adapter
+        self.bt_manager.adapter_props = MagicMock()
+        self.bt_manager._objects_cache = {adapter: {'org.bluez.Adapter1': {'Powered': False}}}
+        
+        self.bt_manager._power_on_adapter()
+        args, kwargs = self.bt_manager.adapter_props.Set.call_args
+        self.assertEqual(args[:2], ('org.bluez.Adapter1', 'Powered'))
+        self.assertIn('reply_handler', kwargs)
+        self.assertIn('error_handler', kwargs)
+        
+        self.bt_manager.adapter_props.reset_mock()
+        self.bt_manager._objects_cache[adapter]['org.bluez.Adapter1']['Powered'] = True
+        self.bt_manager._power_on_adapter()
+        self.bt_manager.adapter_props.Set.assert_not_called()
+    
+    def test_discoverable_and_pairable_pipeline_their_sets(self):
+        """Test mode and timeout are sent together and any failure is reported."""
+        self.bt_manager.adapter_props = MagicMock()
+        self.bt_manager.adapter_props.Set.side_effect = (
+            lambda *args, reply_handler, error_handler: reply_handler())
+        
+        self.assertTrue(self.bt_manager.set_discoverable(True, timeout=0))
+        names = [c.args[1] for c in self.bt_manager.adapter_props.Set.call_args_list]
+        self.assertEqual(names, ['DiscoverableTimeout', 'Discoverable'])
+        
+        error = Exception('org.bluez.Error.Failed')
+        self.bt_manager.adapter_props.Set.side_effect = (
+            lambda iface, name, value, reply_handler, error_handler:
+                error_handler(error) if name == 'Pairable' else reply_handler())
+        self.assertFalse(self.bt_manager.set_pairable(True))
+    
+    @patch('bluetooth_manager.GLib')
+    def test_cleanup_unregisters_through_cached_managers(self, mock_glib):
+        """Test cleanup pipelines every unregister call on the cached proxies."""
+        def succeed(*args, reply_handler, error_handler):
+            reply_handler()
+        
+        self.bt_manager.bus = MagicMock()
+        self.bt_manager._profile_manager = Mock(UnregisterProfile=Mock(side_effect=succeed))
+        self.bt_manager._agent_manager = Mock(UnregisterAgent=Mock(side_effect=succeed))
+        self.bt_manager.profiles_registered = True
+        self.bt_manager.agent = Mock()
+        
+        self.bt_manager.cleanup()
+        self.assertEqual(self.bt_manager._profile_manager.UnregisterProfile.call_count, 2)
+        self.bt_manager._agent_manager.UnregisterAgent.assert_called_once()
+        self.bt_manager.bus.get_object.assert_not_called()
+    
+    def test_hfp_profile_takes_ownership_of_rfcomm_fd(self):
+        """Test NewConnection keeps BlueZ's fd (no dup) and closes it on disconnect."""
+        local, remote = socket.socketpair()
+        self.addCleanup(remote.close)
+        read_fd = local.detach()
+        on_connect = Mock()
+        profile = HFPProfile(MagicMock(), '/org/bluez/handsfree/hfp', on_connect=on_connect)
+        
+        device = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+        profile.NewConnection(device, Mock(take=Mock(return_value=read_fd)), {})
+        self.assertEqual(profile.fd, read_fd)
+        on_connect.assert_called_once_with('AA:BB:CC:DD:EE:FF', read_fd)
+        
+        profile.RequestDisconnection(device)
+        self.assertIsNone(profile.fd)
+        with self.assertRaises(OSError):
+            os.fstat(read_fd)
+    
     def test_state_transitions(self):
         """Test connection state transitions."""
         self.assertEqual(self.bt_manager.state, ConnectionState.DISCONNECTED)
@@ -5,7 +5,11 @@ Unit tests for Call Manager
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import os
+import socket
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Add src to path
@@ -87,6 +91,110 @@ class TestCallManager(unittest.TestCase):
         command = "+VGS: 10"
         self.assertTrue(command.startswith("+VGS:"))
 
+    
+    def test_at_lines_split_across_reads(self):
+        """Test AT responses are framed correctly however the reads are split."""
+        self.call_manager._handle_at_command = Mock()
+        
+        buffer = b""
+        for chunk in [b'\r\nRI', b'NG\r', b'\n\r\n+CLIP: "123",129\r\n\r\n+VGS:', b' 7\r\n']:
+            buffer = self.call_manager._dispatch_at_lines(buffer, chunk)
+        
+        self.assertEqual(buffer, b"")
+        self.assertEqual(
+            [c.args[0] for c in self.call_manager._handle_at_command.call_args_list],
+            ['RING', '+CLIP: "123",129', '+VGS: 7']
+        )
+
+    
+    def test_handle_at_responses(self):
+        """Test unsolicited AT responses update call state."""
+        self.call_manager.on_volume_changed = Mock()
+        self.call_manager.on_incoming_call = Mock()
+        
+        self.call_manager._handle_at_command('+VGS: 12')
+        self.assertEqual(self.call_manager.speaker_volume, 12)
+        self.call_manager.on_volume_changed.assert_called_once_with('speaker', 12)
+        
+        self.call_manager._handle_at_command('+CIEV: 3,1')
+        self.assertEqual(self.call_manager.state, CallState.INCOMING)
+        self.call_manager.on_incoming_call.assert_called_once_with()
+        
+        self.call_manager._handle_at_command('+CLIP: "+1234567890",145')
+        self.assertEqual(self.call_manager.caller_id, '+1234567890')
+        
+        self.call_manager._handle_at_command('+CIND: ("service",(0,1)),("call",(0,1))')
+        self.assertEqual(self.call_manager.indicator_mapping, {1: 'service', 2: 'call'})
+
+    
+    def test_ring_and_unknown_responses(self):
+        """Test a ringing call is reported once and unknown responses are ignored."""
+        self.call_manager.on_incoming_call = Mock()
+        
+        self.call_manager._handle_at_command('+COPS: 0,0,"Carrier"')
+        self.assertEqual(self.call_manager.state, CallState.IDLE)
+        
+        # The AG announces the call once and then keeps ringing
+        for line in ['+CIEV: 3,1', 'RING', 'RING']:
+            self.call_manager._handle_at_command(line)
+        self.assertEqual(self.call_manager.state, CallState.INCOMING)
+        self.call_manager.on_incoming_call.assert_called_once_with()
+
+    
+    def test_reader_handles_data_and_stops_promptly(self):
+        """Test the AT reader wakes for data and for disconnect without waiting."""
+        local, remote = socket.socketpair()
+        self.addCleanup(remote.close)
+        handled = threading.Event()
+        self.call_manager._handle_at_command = Mock(side_effect=lambda line: handled.set())
+        
+        self.call_manager.rfcomm_socket = local
+        self.call_manager._start_reader()
+        remote.sendall(b'\r\nRING\r\n')
+        self.assertTrue(handled.wait(2.0))
+        self.call_manager._handle_at_command.assert_called_once_with('RING')
+        
+        start = time.monotonic()
+        self.call_manager.disconnect_rfcomm()
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertIsNone(self.call_manager.rfcomm_thread)
+        self.assertIsNone(self.call_manager._wake_w)
+    
+    @patch('call_manager.CallManager._init_slc')
+    def test_repeated_connection_replaces_reader(self, mock_init_slc):
+        """Test a second RFCOMM connection stops the first reader and its fds."""
+        pairs = [socket.socketpair() for _ in range(2)]
+        for local, remote in pairs:
+            self.addCleanup(local.close)
+            self.addCleanup(remote.close)
+        
+        self.assertTrue(self.call_manager.connect_rfcomm_fd(pairs[0][0].fileno()))
+        first_thread = self.call_manager.rfcomm_thread
+        open_fds = len(os.listdir('/proc/self/fd'))
+        
+        self.assertTrue(self.call_manager.connect_rfcomm_fd(pairs[1][0].fileno()))
+        self.addCleanup(self.call_manager.disconnect_rfcomm)
+        self.assertFalse(first_thread.is_alive())
+        self.assertIsNot(self.call_manager.rfcomm_thread, first_thread)
+        # The first link's socket, wake pipe and selector were all closed
+        self.assertEqual(len(os.listdir('/proc/self/fd')), open_fds)
+
+    
+    def test_slc_setup_advances_on_each_reply(self):
+        """Test SLC commands go out as fast as the phone answers them."""
+        sent = []
+        
+        def reply(command):
+            sent.append(command)
+            self.call_manager._handle_at_command('OK')
+            return True
+        
+        self.call_manager._send_at_command = Mock(side_effect=reply)
+        start = time.monotonic()
+        self.call_manager._init_slc()
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(sent, ['AT+BRSF=63', 'AT+CIND=?', 'AT+CIND?', 'AT+CMER=3,0,0,1', 'AT+CLIP=1'])
+
 
 if __name__ == '__main__':
     unittest.main()